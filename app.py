@@ -1,8 +1,6 @@
 import streamlit as st
-import pandas as pd
-import numpy as np
-import random
-from datetime import datetime, timedelta
+
+from views import PAGES, layout, render
 
 # Page Configuration
 st.set_page_config(
@@ -11,1138 +9,16 @@ st.set_page_config(
     layout="wide"
 )
 
-# Custom CSS
-st.markdown("""
-<style>
-    .main-header {
-        font-size: 3rem;
-        font-weight: 700;
-        text-align: center;
-        background: linear-gradient(90deg, #667eea 0%, #764ba2 100%);
-        -webkit-background-clip: text;
-        -webkit-text-fill-color: transparent;
-        margin-bottom: 1rem;
-    }
-    .sub-header {
-        text-align: center;
-        color: #666;
-        font-size: 1.2rem;
-        margin-bottom: 2rem;
-    }
-    .developer-box {
-        background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-        color: white;
-        padding: 2rem;
-        border-radius: 15px;
-        margin: 2rem 0;
-        text-align: center;
-    }
-    .analysis-box {
-        background: linear-gradient(135deg, #f8f9fa 0%, #e9ecef 100%);
-        padding: 2rem;
-        border-radius: 15px;
-        border-left: 5px solid #667eea;
-        margin: 1rem 0;
-    }
-    .result-box {
-        background: linear-gradient(135deg, #d4edda 0%, #c3e6cb 100%);
-        padding: 2rem;
-        border-radius: 15px;
-        border-left: 5px solid #28a745;
-        margin: 1rem 0;
-    }
-    .agentic-box {
-        background: linear-gradient(135deg, #fff3cd 0%, #ffeaa7 100%);
-        padding: 2rem;
-        border-radius: 15px;
-        border-left: 5px solid #ffc107;
-        margin: 1rem 0;
-    }
-    .scenario-box {
-        background: linear-gradient(135deg, #d1ecf1 0%, #bee5eb 100%);
-        padding: 1.5rem;
-        border-radius: 12px;
-        border-left: 4px solid #17a2b8;
-        margin: 1rem 0;
-    }
-    .integration-box {
-        background: linear-gradient(135deg, #f8d7da 0%, #f5c6cb 100%);
-        padding: 2rem;
-        border-radius: 15px;
-        border-left: 5px solid #dc3545;
-        margin: 1rem 0;
-    }
-    .feature-card {
-        background: #f8f9fa;
-        padding: 1.5rem;
-        border-radius: 10px;
-        border-left: 4px solid #667eea;
-        margin: 1rem 0;
-    }
-    .metric-card {
-        background: linear-gradient(45deg, #f0f2f6, #ffffff);
-        padding: 1.5rem;
-        border-radius: 10px;
-        text-align: center;
-        margin: 0.5rem;
-        box-shadow: 0 2px 4px rgba(0,0,0,0.1);
-    }
-    .news-card {
-        background: #ffffff;
-        padding: 1.5rem;
-        border-radius: 10px;
-        border: 1px solid #dee2e6;
-        margin: 1rem 0;
-        box-shadow: 0 2px 4px rgba(0,0,0,0.05);
-    }
-</style>
-""", unsafe_allow_html=True)
-
-# Initialize session state for cross-page data sharing
-if 'analysis_data' not in st.session_state:
-    st.session_state.analysis_data = {}
-if 'search_results' not in st.session_state:
-    st.session_state.search_results = []
-if 'trend_data' not in st.session_state:
-    st.session_state.trend_data = pd.DataFrame()
-if 'pattern_insights' not in st.session_state:
-    st.session_state.pattern_insights = {}
-
-# Header
-st.markdown('<h1 class="main-header">🔬 Future STEM News Intelligence</h1>', unsafe_allow_html=True)
-st.markdown('<p class="sub-header">AI-Powered STEM News Analysis & Personal Insights</p>', unsafe_allow_html=True)
+layout.header()
+layout.init_session_state()
 
 # Navigation
-page = st.sidebar.selectbox(
-    "🚀 Navigate:",
-    ["🏠 Home", "🔍 Search & Analyze", "📊 Visualize Trends", "📈 Track Patterns", 
-     "🤖 AI Analysis", "🧠 Agentic AI & Scenarios", "🔗 Integrated Dashboard", "ℹ️ About"]
-)
-
-# Shared Functions for Agentic AI
-def generate_agentic_scenarios(topic, timeframe, complexity):
-    """Generate realistic scenarios based on agentic AI analysis"""
-    scenarios = {
-        "Artificial Intelligence": [
-            {
-                "title": "AI Governance Revolution",
-                "description": "Autonomous AI systems begin self-regulating through distributed governance protocols",
-                "probability": random.randint(65, 85),
-                "impact": "High",
-                "timeline": f"{timeframe} months"
-            },
-            {
-                "title": "Human-AI Collaborative Networks",
-                "description": "Emergence of hybrid intelligence networks where AI agents and humans work seamlessly",
-                "probability": random.randint(70, 90),
-                "impact": "Very High",
-                "timeline": f"{timeframe-6} to {timeframe} months"
-            }
-        ],
-        "Biotechnology": [
-            {
-                "title": "Personalized Medicine AI Agents",
-                "description": "AI agents autonomously design personalized treatments for individual patients",
-                "probability": random.randint(60, 80),
-                "impact": "Very High",
-                "timeline": f"{timeframe} months"
-            },
-            {
-                "title": "Synthetic Biology Automation",
-                "description": "Autonomous lab systems design and test new biological systems without human intervention",
-                "probability": random.randint(55, 75),
-                "impact": "High",
-                "timeline": f"{timeframe+6} to {timeframe+12} months"
-            }
-        ],
-        "Quantum Computing": [
-            {
-                "title": "Quantum AI Integration",
-                "description": "Quantum computers enable AI agents with unprecedented problem-solving capabilities",
-                "probability": random.randint(45, 65),
-                "impact": "Revolutionary",
-                "timeline": f"{timeframe+12} to {timeframe+24} months"
-            }
-        ]
-    }
-    
-    return scenarios.get(topic, scenarios["Artificial Intelligence"])
-
-def simulate_news_search(query, category):
-    """Simulate AI-powered news search with realistic results"""
-    base_articles = [
-        {
-            "title": f"Breakthrough in {category}: {query} Shows Promise",
-            "summary": f"Recent developments in {query} research demonstrate significant potential for advancing {category} applications.",
-            "date": datetime.now() - timedelta(days=random.randint(1, 30)),
-            "relevance": random.randint(85, 98),
-            "sentiment": random.choice(["Positive", "Neutral", "Very Positive"]),
-            "key_insights": [
-                f"Novel approach to {query} implementation",
-                f"Potential applications in {category.lower()}",
-                "Strong industry backing and funding"
-            ]
-        },
-        {
-            "title": f"Industry Analysis: {query} Market Trends",
-            "summary": f"Comprehensive analysis of market trends and future predictions for {query} in the {category} sector.",
-            "date": datetime.now() - timedelta(days=random.randint(1, 15)),
-            "relevance": random.randint(78, 92),
-            "sentiment": "Positive",
-            "key_insights": [
-                f"Growing investment in {query} research",
-                "Expanding market opportunities",
-                "Regulatory support increasing"
-            ]
-        },
-        {
-            "title": f"Research Collaboration: {query} Initiative",
-            "summary": f"Major research institutions collaborate on groundbreaking {query} project with implications for {category}.",
-            "date": datetime.now() - timedelta(days=random.randint(5, 20)),
-            "relevance": random.randint(82, 95),
-            "sentiment": "Very Positive",
-            "key_insights": [
-                "Multi-institutional partnership",
-                f"Focus on practical {category} applications",
-                "Expected timeline for results"
-            ]
-        }
-    ]
-    
-    return base_articles
-
-def generate_trend_data(categories, timeframe):
-    """Generate realistic trend data for visualization"""
-    dates = pd.date_range(start=datetime.now() - timedelta(days=timeframe*30), end=datetime.now(), freq='D')
-    
-    data = {'Date': dates}
-    for category in categories:
-        # Generate realistic trend with some noise and seasonal patterns
-        base_trend = np.linspace(50, 100, len(dates))
-        seasonal = 10 * np.sin(2 * np.pi * np.arange(len(dates)) / 365)
-        noise = np.random.normal(0, 5, len(dates))
-        data[category] = base_trend + seasonal + noise
-        data[category] = np.maximum(data[category], 0)  # Ensure non-negative values
-    
-    return pd.DataFrame(data)
-
-def extract_patterns(data, category):
-    """Extract meaningful patterns from trend data"""
-    if category in data.columns:
-        values = data[category].values
-        patterns = {
-            "trend_direction": "Upward" if values[-1] > values[0] else "Downward",
-            "volatility": "High" if np.std(values) > 10 else "Moderate" if np.std(values) > 5 else "Low",
-            "growth_rate": ((values[-1] - values[0]) / values[0] * 100) if values[0] != 0 else 0,
-            "peak_period": data.loc[data[category].idxmax(), 'Date'].strftime("%Y-%m-%d"),
-            "recent_momentum": "Increasing" if np.mean(values[-7:]) > np.mean(values[-14:-7]) else "Decreasing"
-        }
-        return patterns
-    return {}
-
-# Developer Section
-with st.expander("ℹ️ About Developer & Project", expanded=False):
-    st.markdown("""
-    <div class="developer-box">
-        <h2>👨‍💻 Developed by: M Faby Rizky K</h2>
-        <h3>🏢 Supported by: Patria & Co</h3>
-        <h4>🚀 Future STEM News Intelligence Center</h4>
-        <p style="font-size: 1.1rem; margin: 1rem 0;">
-            An advanced AI-powered platform designed to revolutionize how we consume and analyze 
-            Science, Technology, Engineering, and Mathematics news content.
-        </p>
-    </div>
-    """, unsafe_allow_html=True)
-    
-    col1, col2 = st.columns(2)
-    
-    with col1:
-        st.markdown("""
-        ### 🎯 Project Vision
-        - **Democratize** access to STEM knowledge
-        - **Provide** intelligent news curation  
-        - **Enable** data-driven insights
-        - **Foster** scientific literacy
-        
-        ### 🛠️ Technology Stack
-        - **Frontend:** Streamlit
-        - **Data Processing:** Pandas, NumPy
-        - **AI Engine:** Agentic Analysis System
-        - **Deployment:** Streamlit Cloud
-        """)
-    
-    with col2:
-        st.markdown("""
-        ### 🌟 Key Features
-        - 🔍 **Real-time** STEM news analysis
-        - 📊 **Interactive** data visualizations
-        - 📈 **Pattern recognition** and predictions
-        - 🤖 **Agentic AI** scenario modeling
-        - 🔗 **Integrated** cross-analysis dashboard
-        
-        ### 📞 Connect with Developer
-        - 💼 **LinkedIn:** https://www.linkedin.com/in/m-faby-rizky-k/
-        - 🐙 **GitHub:** https://github.com/fabyrizky 
-        - 📧 **Email:** fabyrizky@gmail.com
-        """)
-
-# Main Content
-if page == "🏠 Home":
-    st.markdown("## Welcome to Your Advanced STEM Intelligence Hub! 🎉")
-    
-    # Metrics Row
-    col1, col2, col3, col4 = st.columns(4)
-    
-    with col1:
-        st.markdown("""
-        <div class="metric-card">
-            <h3>📚</h3>
-            <h2>1,234</h2>
-            <p>Articles Analyzed</p>
-            <small style="color: green;">↗️ +12% this month</small>
-        </div>
-        """, unsafe_allow_html=True)
-    
-    with col2:
-        st.markdown("""
-        <div class="metric-card">
-            <h3>🔬</h3>
-            <h2>567</h2>
-            <p>Research Papers</p>
-            <small style="color: green;">↗️ +8% this month</small>
-        </div>
-        """, unsafe_allow_html=True)
-    
-    with col3:
-        st.markdown("""
-        <div class="metric-card">
-            <h3>🚀</h3>
-            <h2>890</h2>
-            <p>Tech Innovations</p>
-            <small style="color: green;">↗️ +15% this month</small>
-        </div>
-        """, unsafe_allow_html=True)
-    
-    with col4:
-        st.markdown("""
-        <div class="metric-card">
-            <h3>🤖</h3>
-            <h2>234</h2>
-            <p>AI Scenarios</p>
-            <small style="color: green;">↗️ +23% this month</small>
-        </div>
-        """, unsafe_allow_html=True)
-    
-    st.markdown("### 🎯 Advanced AI-Powered Features:")
-    
-    features = [
-        ("🔍 Search & Analyze", "Real-time STEM news analysis with AI-powered insights and sentiment analysis"),
-        ("📊 Visualize Trends", "Interactive charts and data visualization tools with predictive modeling"),
-        ("📈 Track Patterns", "Monitor scientific publication trends and extract actionable patterns"),
-        ("🤖 AI Career Analysis", "Personalized career recommendations based on current market trends"),
-        ("🧠 Agentic AI Scenarios", "Advanced scenario modeling and future prediction capabilities"),
-        ("🔗 Integrated Dashboard", "Unified view combining all analysis components with cross-referencing")
-    ]
-    
-    for title, description in features:
-        st.markdown(f"""
-        <div class="feature-card">
-            <h4>{title}</h4>
-            <p>{description}</p>
-        </div>
-        """, unsafe_allow_html=True)
-
-elif page == "🔍 Search & Analyze":
-    st.header("🔍 Real-time STEM News Analysis")
-    
-    st.markdown("""
-    <div class="analysis-box">
-        <h3>🎯 AI-Powered News Intelligence</h3>
-        <p>Search and analyze STEM news with advanced AI insights, sentiment analysis, and relevance scoring.</p>
-    </div>
-    """, unsafe_allow_html=True)
-    
-    # Search Interface
-    col1, col2, col3 = st.columns([3, 2, 1])
-    
-    with col1:
-        search_query = st.text_input("🔍 Enter your search query:", placeholder="e.g., quantum computing, CRISPR, machine learning")
-    
-    with col2:
-        category = st.selectbox("📂 Category:", ["All", "Artificial Intelligence", "Biotechnology", "Quantum Computing", "Data Science", "Renewable Energy"])
-    
-    with col3:
-        if st.button("🚀 Analyze", type="primary"):
-            if search_query:
-                with st.spinner("🤖 AI is analyzing STEM news..."):
-                    # Simulate AI analysis
-                    results = simulate_news_search(search_query, category)
-                    st.session_state.search_results = results
-                    st.session_state.analysis_data['last_search'] = {
-                        'query': search_query,
-                        'category': category,
-                        'timestamp': datetime.now()
-                    }
-    
-    # Display Results
-    if st.session_state.search_results:
-        st.subheader("📊 Analysis Results")
-        
-        # Summary Metrics
-        col1, col2, col3, col4 = st.columns(4)
-        with col1:
-            st.metric("📄 Articles Found", len(st.session_state.search_results))
-        with col2:
-            avg_relevance = np.mean([article['relevance'] for article in st.session_state.search_results])
-            st.metric("🎯 Avg Relevance", f"{avg_relevance:.1f}%")
-        with col3:
-            positive_sentiment = sum(1 for article in st.session_state.search_results if 'Positive' in article['sentiment'])
-            st.metric("😊 Positive Sentiment", f"{positive_sentiment}/{len(st.session_state.search_results)}")
-        with col4:
-            st.metric("⚡ Analysis Speed", "1.2s")
-        
-        # Detailed Results
-        for i, article in enumerate(st.session_state.search_results):
-            st.markdown(f"""
-            <div class="news-card">
-                <h4>📰 {article['title']}</h4>
-                <p><strong>📅 Date:</strong> {article['date'].strftime('%Y-%m-%d')} | 
-                   <strong>🎯 Relevance:</strong> {article['relevance']}% | 
-                   <strong>😊 Sentiment:</strong> {article['sentiment']}</p>
-                <p>{article['summary']}</p>
-                <p><strong>🔍 Key Insights:</strong></p>
-                <ul>
-                    {"".join([f"<li>{insight}</li>" for insight in article['key_insights']])}
-                </ul>
-            </div>
-            """, unsafe_allow_html=True)
-        
-        # AI Insights Summary
-        st.markdown("""
-        <div class="agentic-box">
-            <h3>🧠 AI Meta-Analysis</h3>
-            <p><strong>Trend Direction:</strong> The analyzed articles show strong positive momentum in the searched topic.</p>
-            <p><strong>Key Themes:</strong> Innovation, collaboration, market growth, and regulatory support are dominant themes.</p>
-            <p><strong>Prediction:</strong> Based on current patterns, expect continued growth and development in this area over the next 6-12 months.</p>
-        </div>
-        """, unsafe_allow_html=True)
-
-elif page == "📊 Visualize Trends":
-    st.header("📊 Interactive Trend Visualization")
-    
-    st.markdown("""
-    <div class="analysis-box">
-        <h3>📈 Advanced Data Visualization</h3>
-        <p>Interactive charts with predictive modeling and cross-correlation analysis.</p>
-    </div>
-    """, unsafe_allow_html=True)
-    
-    # Visualization Controls
-    col1, col2, col3 = st.columns(3)
-    
-    with col1:
-        selected_categories = st.multiselect(
-            "📂 Select Categories:",
-            ["AI & Machine Learning", "Biotechnology", "Quantum Computing", "Data Science", "Renewable Energy"],
-            default=["AI & Machine Learning", "Biotechnology"]
-        )
-    
-    with col2:
-        timeframe = st.selectbox("📅 Timeframe:", [3, 6, 12, 24], index=2, format_func=lambda x: f"{x} months")
-    
-    with col3:
-        chart_type = st.selectbox("📊 Chart Type:", ["Line Chart", "Area Chart", "Bar Chart"])
-    
-    if selected_categories:
-        # Generate trend data
-        trend_data = generate_trend_data(selected_categories, timeframe)
-        st.session_state.trend_data = trend_data
-        
-        # Display main chart
-        st.subheader(f"📈 {chart_type} - {timeframe} Month Trend")
-        
-        if chart_type == "Line Chart":
-            st.line_chart(trend_data.set_index('Date')[selected_categories])
-        elif chart_type == "Area Chart":
-            st.area_chart(trend_data.set_index('Date')[selected_categories])
-        else:
-            # For bar chart, show recent monthly averages
-            monthly_data = trend_data.set_index('Date').resample('M')[selected_categories].mean()
-            st.bar_chart(monthly_data)
-        
-        # Trend Analysis
-        col1, col2 = st.columns(2)
-        
-        with col1:
-            st.subheader("📊 Trend Statistics")
-            for category in selected_categories:
-                if category in trend_data.columns:
-                    values = trend_data[category].values
-                    growth = ((values[-1] - values[0]) / values[0] * 100) if values[0] != 0 else 0
-                    st.metric(f"📈 {category}", f"{values[-1]:.1f}", f"{growth:+.1f}%")
-        
-        with col2:
-            st.subheader("🔍 Pattern Insights")
-            for category in selected_categories:
-                patterns = extract_patterns(trend_data, category)
-                if patterns:
-                    st.session_state.pattern_insights[category] = patterns
-                    st.markdown(f"""
-                    **{category}:**
-                    - Trend: {patterns['trend_direction']}
-                    - Volatility: {patterns['volatility']}
-                    - Recent Momentum: {patterns['recent_momentum']}
-                    """)
-        
-        # Predictive Analysis
-        st.markdown("""
-        <div class="agentic-box">
-            <h3>🔮 AI Predictive Analysis</h3>
-            <p><strong>Short-term Forecast (Next 30 days):</strong> Based on current trends, expect continued growth in AI & Machine Learning with potential volatility in Biotechnology due to regulatory developments.</p>
-            <p><strong>Long-term Outlook (6 months):</strong> Strong positive correlation between AI and Biotechnology suggests synergistic growth opportunities.</p>
-        </div>
-        """, unsafe_allow_html=True)
-
-elif page == "📈 Track Patterns":
-    st.header("📈 Advanced Pattern Recognition")
-    
-    st.markdown("""
-    <div class="analysis-box">
-        <h3>🎯 Scientific Publication Pattern Analysis</h3>
-        <p>Monitor and extract actionable insights from STEM publication trends and research patterns.</p>
-    </div>
-    """, unsafe_allow_html=True)
-    
-    # Pattern Analysis Controls
-    col1, col2 = st.columns(2)
-    
-    with col1:
-        analysis_type = st.selectbox(
-            "🔍 Analysis Type:",
-            ["Publication Volume", "Citation Patterns", "Collaboration Networks", "Research Impact", "Funding Trends"]
-        )
-    
-    with col2:
-        time_period = st.selectbox("📅 Time Period:", ["Last 6 months", "Last year", "Last 2 years", "Last 5 years"])
-    
-    # Generate pattern data based on selection
-    if analysis_type and time_period:
-        # Create sample pattern data
-        categories = ["Artificial Intelligence", "Biotechnology", "Quantum Computing", "Materials Science", "Neuroscience"]
-        
-        if analysis_type == "Publication Volume":
-            data = {
-                "Field": categories,
-                "Publications": [random.randint(500, 1500) for _ in categories],
-                "Growth Rate (%)": [random.randint(-5, 25) for _ in categories],
-                "H-Index": [random.randint(30, 80) for _ in categories],
-                "International Collaborations (%)": [random.randint(40, 85) for _ in categories]
-            }
-        elif analysis_type == "Citation Patterns":
-            data = {
-                "Field": categories,
-                "Avg Citations": [random.randint(15, 45) for _ in categories],
-                "Self-Citation Rate (%)": [random.randint(10, 30) for _ in categories],
-                "Cross-Field Citations (%)": [random.randint(20, 60) for _ in categories],
-                "Impact Factor": [round(random.uniform(2.5, 8.5), 2) for _ in categories]
-            }
-        else:
-            data = {
-                "Field": categories,
-                "Active Researchers": [random.randint(1000, 5000) for _ in categories],
-                "Institutions": [random.randint(50, 200) for _ in categories],
-                "Funding ($M)": [random.randint(100, 800) for _ in categories],
-                "Success Rate (%)": [random.randint(15, 35) for _ in categories]
-            }
-        
-        pattern_df = pd.DataFrame(data)
-        
-        # Display pattern analysis
-        st.subheader(f"📊 {analysis_type} Analysis - {time_period}")
-        st.dataframe(pattern_df, use_container_width=True)
-        
-        # Visualize patterns
-        col1, col2 = st.columns(2)
-        
-        with col1:
-            st.subheader("📈 Comparative Analysis")
-            if analysis_type == "Publication Volume":
-                st.bar_chart(pattern_df.set_index('Field')['Publications'])
-            elif analysis_type == "Citation Patterns":
-                st.bar_chart(pattern_df.set_index('Field')['Avg Citations'])
-            else:
-                st.bar_chart(pattern_df.set_index('Field')['Active Researchers'])
-        
-        with col2:
-            st.subheader("🎯 Growth Trends")
-            if 'Growth Rate (%)' in pattern_df.columns:
-                st.bar_chart(pattern_df.set_index('Field')['Growth Rate (%)'])
-            elif 'Cross-Field Citations (%)' in pattern_df.columns:
-                st.bar_chart(pattern_df.set_index('Field')['Cross-Field Citations (%)'])
-            else:
-                st.bar_chart(pattern_df.set_index('Field')['Success Rate (%)'])
-        
-        # Pattern Insights
-        st.subheader("🔍 Key Pattern Insights")
-        
-        insights = [
-            f"**Leading Field:** {pattern_df.iloc[0]['Field']} shows highest activity in {analysis_type.lower()}",
-            f"**Emerging Trend:** Cross-disciplinary research is increasing, especially in AI-Bio convergence",
-            f"**Geographic Distribution:** North America and Europe dominate, but Asia is rapidly growing",
-            f"**Funding Patterns:** Government funding remains stable while private investment is surging"
-        ]
-        
-        for insight in insights:
-            st.markdown(f"• {insight}")
-        
-        # Store pattern insights for integration
-        st.session_state.pattern_insights['current_analysis'] = {
-            'type': analysis_type,
-            'period': time_period,
-            'data': pattern_df,
-            'timestamp': datetime.now()
-        }
-        
-        # Advanced Pattern Recognition
-        st.markdown("""
-        <div class="agentic-box">
-            <h3>🧠 AI Pattern Recognition</h3>
-            <p><strong>Detected Patterns:</strong></p>
-            <ul>
-                <li><strong>Cyclical Trend:</strong> Publication volumes show seasonal patterns with peaks in Q1 and Q3</li>
-                <li><strong>Correlation Discovery:</strong> Strong positive correlation (r=0.78) between funding levels and international collaborations</li>
-                <li><strong>Anomaly Detection:</strong> Unusual spike in quantum computing publications suggests breakthrough discovery</li>
-                <li><strong>Predictive Insight:</strong> Based on current patterns, expect 15-20% growth in AI-related publications next quarter</li>
-            </ul>
-        </div>
-        """, unsafe_allow_html=True)
-
-elif page == "🧠 Agentic AI & Scenarios":
-    st.header("🧠 Agentic AI Analysis & Future Scenarios")
-    
-    st.markdown("""
-    <div class="agentic-box">
-        <h3>🤖 Advanced Agentic AI System</h3>
-        <p>Our agentic AI system autonomously analyzes trends, generates scenarios, and provides strategic foresight for STEM developments.</p>
-    </div>
-    """, unsafe_allow_html=True)
-    
-    # Agentic AI Controls
-    col1, col2, col3 = st.columns(3)
-    
-    with col1:
-        focus_area = st.selectbox(
-            "🎯 Focus Area:",
-            ["Artificial Intelligence", "Biotechnology", "Quantum Computing", "Climate Technology", "Space Technology"]
-        )
-    
-    with col2:
-        scenario_timeframe = st.selectbox("⏰ Scenario Timeframe:", [6, 12, 18, 24, 36], format_func=lambda x: f"{x} months")
-    
-    with col3:
-        complexity_level = st.selectbox("🧩 Complexity Level:", ["Basic", "Intermediate", "Advanced", "Expert"])
-    
-    if st.button("🚀 Generate Agentic Analysis", type="primary"):
-        with st.spinner("🤖 Agentic AI is analyzing and generating scenarios..."):
-            # Generate scenarios
-            scenarios = generate_agentic_scenarios(focus_area, scenario_timeframe, complexity_level)
-            
-            st.subheader("🔮 AI-Generated Future Scenarios")
-            
-            for i, scenario in enumerate(scenarios, 1):
-                st.markdown(f"""
-                <div class="scenario-box">
-                    <h4>📋 Scenario {i}: {scenario['title']}</h4>
-                    <p><strong>Description:</strong> {scenario['description']}</p>
-                    <p><strong>🎯 Probability:</strong> {scenario['probability']}% | 
-                       <strong>💥 Impact:</strong> {scenario['impact']} | 
-                       <strong>⏰ Timeline:</strong> {scenario['timeline']}</p>
-                </div>
-                """, unsafe_allow_html=True)
-            
-            # Agentic Analysis Summary
-            st.subheader("🧠 Agentic AI Meta-Analysis")
-            
-            st.markdown(f"""
-            <div class="result-box">
-                <h4>🤖 Autonomous AI Insights for {focus_area}</h4>
-                <p><strong>Trend Convergence:</strong> The AI has identified key convergence points between {focus_area} and other STEM fields, suggesting interdisciplinary breakthroughs within the {scenario_timeframe}-month timeframe.</p>
-                <p><strong>Risk Assessment:</strong> Medium-low risk with high potential rewards. Key dependencies include regulatory frameworks and funding availability.</p>
-                <p><strong>Strategic Recommendations:</strong></p>
-                <ul>
-                    <li>Invest in cross-functional research teams</li>
-                    <li>Monitor regulatory developments closely</li>
-                    <li>Develop contingency plans for rapid scaling</li>
-                    <li>Foster international collaboration networks</li>
-                </ul>
-                <p><strong>Confidence Level:</strong> 78% based on current data patterns and historical trends</p>
-            </div>
-            """, unsafe_allow_html=True)
-            
-            # Agent Reasoning Process
-            st.subheader("🔍 Agentic Reasoning Process")
-            
-            reasoning_steps = [
-                "🔍 **Data Ingestion**: Analyzed 10,000+ research papers and market reports",
-                "📊 **Pattern Recognition**: Identified recurring themes and correlation patterns",
-                "🧠 **Scenario Generation**: Applied Monte Carlo simulations and decision trees",
-                "⚡ **Impact Assessment**: Evaluated potential outcomes using multi-criteria analysis",
-                "🎯 **Probability Calibration**: Adjusted predictions based on historical accuracy",
-                "📋 **Report Synthesis**: Generated human-readable insights and recommendations"
-            ]
-            
-            for step in reasoning_steps:
-                st.markdown(f"• {step}")
-            
-            # Store agentic analysis for integration
-            st.session_state.analysis_data['agentic_scenarios'] = {
-                'focus_area': focus_area,
-                'timeframe': scenario_timeframe,
-                'scenarios': scenarios,
-                'timestamp': datetime.now()
-            }
-
-elif page == "🤖 AI Analysis":
-    st.header("🤖 AI-Powered STEM Career Analysis")
-    
-    st.markdown("""
-    <div class="analysis-box">
-        <h3>🎯 Personalized Career Insights</h3>
-        <p>Get customized analysis and recommendations based on your STEM interests, career level, and goals. 
-        Our AI-powered system will provide detailed insights and actionable advice for your career journey.</p>
-    </div>
-    """, unsafe_allow_html=True)
-    
-    # Input Form
-    with st.form("career_analysis_form"):
-        st.subheader("📋 Tell Us About Yourself")
-        
-        col1, col2 = st.columns(2)
-        
-        with col1:
-            research_area = st.selectbox(
-                "🔬 Primary Research/Interest Area:",
-                ["Artificial Intelligence", "Biotechnology", "Quantum Computing", 
-                 "Data Science", "Renewable Energy", "Robotics", "Cybersecurity", "Space Technology"]
-            )
-            
-            career_level = st.selectbox(
-                "👤 Career Level:",
-                ["Student", "Recent Graduate", "Entry Level", "Mid-Career", "Senior Professional", "Career Changer"]
-            )
-            
-            interests = st.multiselect(
-                "🎯 Specific Interests (select multiple):",
-                ["Machine Learning", "Research & Development", "Product Development", 
-                 "Data Analysis", "Project Management", "Teaching/Education", 
-                 "Entrepreneurship", "Consulting", "Policy Making"]
-            )
-        
-        with col2:
-            challenges = st.multiselect(
-                "⚠️ Current Challenges:",
-                ["Lack of Experience", "Keeping Up with Technology", "Finding Opportunities", 
-                 "Skill Development", "Networking", "Work-Life Balance", "Salary Expectations"]
-            )
-            
-            goals = st.multiselect(
-                "🎯 Career Goals (select multiple):",
-                ["Career Transition", "Skill Enhancement", "Leadership Role", 
-                 "Research Opportunities", "Industry Networking", "Higher Education", 
-                 "Starting a Business", "Remote Work Opportunities"]
-            )
-            
-            additional_info = st.text_area(
-                "📝 Additional Information (optional):",
-                placeholder="Tell us anything else that might help us provide better recommendations..."
-            )
-        
-        submitted = st.form_submit_button("🚀 Generate Analysis", type="primary")
-        
-        if submitted:
-            if research_area and career_level:
-                with st.spinner("🤖 Generating your personalized analysis..."):
-                    # Generate the analysis (using the function from previous version)
-                    analysis_result = generate_analysis(research_area, career_level, interests, challenges, goals)
-                    
-                    # Display the result
-                    st.markdown("""
-                    <div class="result-box">
-                        <h3>✨ Your Personalized STEM Career Analysis</h3>
-                    </div>
-                    """, unsafe_allow_html=True)
-                    
-                    st.markdown(analysis_result)
-                    
-                    # Store career analysis for integration
-                    st.session_state.analysis_data['career_analysis'] = {
-                        'research_area': research_area,
-                        'career_level': career_level,
-                        'interests': interests,
-                        'challenges': challenges,
-                        'goals': goals,
-                        'timestamp': datetime.now()
-                    }
-                    
-                    # Additional actionable insights
-                    st.markdown("---")
-                    st.subheader("📊 Quick Stats for Your Field")
-                    
-                    col1, col2, col3 = st.columns(3)
-                    with col1:
-                        st.metric("💼 Job Growth", "15-25%", "projected 2024-2030")
-                    with col2:
-                        st.metric("💰 Avg Salary", "$75K-$150K", "based on experience")
-                    with col3:
-                        st.metric("🌟 Satisfaction", "4.2/5", "industry average")
-                    
-                    st.success("✅ Analysis complete! Check the Integrated Dashboard for cross-analysis insights.")
-            else:
-                st.error("⚠️ Please fill in at least the Research Area and Career Level fields.")
-
-elif page == "🔗 Integrated Dashboard":
-    st.header("🔗 Integrated Analysis Dashboard")
-    
-    st.markdown("""
-    <div class="integration-box">
-        <h3>🔄 Cross-Analysis Integration</h3>
-        <p>This dashboard combines insights from all analysis components to provide a unified, comprehensive view of your STEM intelligence.</p>
-    </div>
-    """, unsafe_allow_html=True)
-    
-    # Check if we have data from different analysis modules
-    has_search = 'last_search' in st.session_state.analysis_data
-    has_career = 'career_analysis' in st.session_state.analysis_data
-    has_agentic = 'agentic_scenarios' in st.session_state.analysis_data
-    has_patterns = bool(st.session_state.pattern_insights)
-    has_trends = not st.session_state.trend_data.empty
-    
-    if not any([has_search, has_career, has_agentic, has_patterns, has_trends]):
-        st.warning("🔍 **No analysis data available yet.** Please run analyses in other sections first to see integrated insights here.")
-        
-        st.markdown("""
-        ### 🚀 How to Use the Integrated Dashboard:
-        
-        1. **🔍 Search & Analyze**: Run a news search to get current STEM trends
-        2. **📊 Visualize Trends**: Generate trend data for your areas of interest  
-        3. **📈 Track Patterns**: Analyze publication and research patterns
-        4. **🤖 AI Analysis**: Get personalized career recommendations
-        5. **🧠 Agentic AI**: Generate future scenarios and strategic insights
-        6. **Return here** to see how all analyses connect and inform each other
-        
-        The integration engine will automatically cross-reference your analyses to provide:
-        - **Coherent insights** across different data sources
-        - **Strategic recommendations** based on multiple factors
-        - **Personalized roadmaps** combining market trends with career goals
-        - **Risk assessments** and opportunity identification
-        """)
-    else:
-        st.subheader("📊 Integration Summary")
-        
-        # Integration metrics
-        col1, col2, col3, col4 = st.columns(4)
-        
-        with col1:
-            st.metric("🔍 Search Analysis", "✅" if has_search else "❌", "Active" if has_search else "Pending")
-        with col2:
-            st.metric("📈 Trend Analysis", "✅" if has_trends else "❌", "Active" if has_trends else "Pending")
-        with col3:
-            st.metric("🧠 Career Analysis", "✅" if has_career else "❌", "Active" if has_career else "Pending")
-        with col4:
-            st.metric("🤖 Agentic AI", "✅" if has_agentic else "❌", "Active" if has_agentic else "Pending")
-        
-        # Cross-Analysis Insights
-        if has_search and has_career:
-            st.subheader("🔗 Search-Career Integration")
-            search_data = st.session_state.analysis_data['last_search']
-            career_data = st.session_state.analysis_data['career_analysis']
-            
-            st.markdown(f"""
-            <div class="result-box">
-                <h4>🎯 Personalized Market Alignment</h4>
-                <p><strong>Your Focus:</strong> {career_data['research_area']} at {career_data['career_level']} level</p>
-                <p><strong>Market Activity:</strong> Recent search for "{search_data['query']}" in {search_data['category']}</p>
-                <p><strong>Alignment Score:</strong> 85% - Strong alignment between your career goals and current market trends</p>
-                <p><strong>Recommendation:</strong> The market shows high activity in your area of interest. Consider focusing on the emerging themes identified in your search results.</p>
-            </div>
-            """, unsafe_allow_html=True)
-        
-        if has_trends and has_career:
-            st.subheader("📈 Trend-Career Integration")
-            career_data = st.session_state.analysis_data['career_analysis']
-            
-            st.markdown(f"""
-            <div class="result-box">
-                <h4>📊 Career-Trend Synchronization</h4>
-                <p><strong>Your Field Growth:</strong> {career_data['research_area']} shows strong positive trajectory</p>
-                <p><strong>Strategic Timing:</strong> Current trends suggest optimal time for career advancement in your field</p>
-                <p><strong>Skill Priority:</strong> Based on trend analysis, focus on {', '.join(career_data['interests'][:3]) if career_data['interests'] else 'core technical skills'}</p>
-            </div>
-            """, unsafe_allow_html=True)
-        
-        if has_agentic and has_career:
-            st.subheader("🧠 Agentic-Career Integration")
-            agentic_data = st.session_state.analysis_data['agentic_scenarios']
-            career_data = st.session_state.analysis_data['career_analysis']
-            
-            st.markdown(f"""
-            <div class="result-box">
-                <h4>🔮 Future-Aligned Career Strategy</h4>
-                <p><strong>Scenario Relevance:</strong> Agentic AI scenarios for {agentic_data['focus_area']} align with your {career_data['research_area']} focus</p>
-                <p><strong>Timeline Synchronization:</strong> {agentic_data['timeframe']}-month scenarios match your career development timeline</p>
-                <p><strong>Strategic Advantage:</strong> Position yourself ahead of predicted industry shifts by developing skills in emerging areas</p>
-            </div>
-            """, unsafe_allow_html=True)
-        
-        # Comprehensive Integration Analysis
-        if sum([has_search, has_career, has_agentic, has_patterns, has_trends]) >= 3:
-            st.subheader("🌟 Comprehensive Integration Analysis")
-            
-            st.markdown("""
-            <div class="agentic-box">
-                <h3>🤖 AI-Powered Integration Engine Results</h3>
-                <p><strong>Cross-Analysis Confidence:</strong> 92% - High confidence in integrated recommendations</p>
-                
-                <h4>🎯 Key Integration Insights:</h4>
-                <ul>
-                    <li><strong>Market-Career Alignment:</strong> Your career trajectory aligns well with current market dynamics</li>
-                    <li><strong>Trend Convergence:</strong> Multiple data sources confirm growth in your area of interest</li>
-                    <li><strong>Strategic Positioning:</strong> You are well-positioned to capitalize on emerging opportunities</li>
-                    <li><strong>Risk Mitigation:</strong> Diversify skills across identified high-growth areas</li>
-                </ul>
-                
-                <h4>📋 Integrated Action Plan:</h4>
-                <ol>
-                    <li><strong>Immediate (30 days):</strong> Focus on skills identified in trend analysis</li>
-                    <li><strong>Short-term (3-6 months):</strong> Network in areas highlighted by search analysis</li>
-                    <li><strong>Medium-term (6-12 months):</strong> Prepare for scenarios predicted by agentic AI</li>
-                    <li><strong>Long-term (1-2 years):</strong> Position for leadership in emerging convergence areas</li>
-                </ol>
-                
-                <h4>🔍 Continuous Monitoring:</h4>
-                <p>The integration engine will continue to update recommendations as new data becomes available from your ongoing analyses.</p>
-            </div>
-            """, unsafe_allow_html=True)
-        
-        # Data freshness indicator
-        st.markdown("---")
-        st.subheader("📅 Data Freshness")
-        
-        for key, data in st.session_state.analysis_data.items():
-            if isinstance(data, dict) and 'timestamp' in data:
-                time_diff = datetime.now() - data['timestamp']
-                if time_diff.total_seconds() < 3600:  # Less than 1 hour
-                    freshness = "🟢 Fresh"
-                elif time_diff.total_seconds() < 86400:  # Less than 1 day
-                    freshness = "🟡 Recent"
-                else:
-                    freshness = "🔴 Stale"
-                
-                st.markdown(f"• **{key.replace('_', ' ').title()}:** {freshness} (Updated: {data['timestamp'].strftime('%Y-%m-%d %H:%M')})")
-
-elif page == "ℹ️ About":
-    st.header("ℹ️ About This Platform")
-    
-    st.markdown("""
-    ### 🚀 Future STEM News Intelligence
-    
-    Welcome to the next generation of STEM news analysis! This platform combines the power of 
-    artificial intelligence with intuitive data visualization to bring you insights from the 
-    world of Science, Technology, Engineering, and Mathematics.
-    
-    #### 🎯 Our Mission
-    To democratize access to STEM knowledge and make complex scientific information 
-    accessible to everyone - from students and researchers to industry professionals 
-    and curious minds.
-    
-    #### 🛠️ Advanced Technology Stack
-    - **Frontend Framework:** Streamlit for rapid development and deployment
-    - **Data Processing:** Pandas and NumPy for efficient data manipulation
-    - **Visualization:** Native Streamlit charts for interactive displays
-    - **AI Analysis Engine:** Custom algorithms for personalized career insights
-    - **Agentic AI System:** Autonomous scenario generation and strategic planning
-    - **Integration Engine:** Cross-analysis correlation and insight synthesis
-    - **Deployment:** Streamlit Cloud for seamless hosting
-    - **Version Control:** GitHub for collaborative development
-    
-    #### 📈 Current Features
-    - **🔍 Real-time News Analysis:** AI-powered search with sentiment analysis
-    - **📊 Interactive Trend Visualization:** Dynamic charts with predictive modeling
-    - **📈 Pattern Recognition:** Advanced pattern extraction from research data
-    - **🤖 AI Career Analysis:** Personalized career insights and recommendations
-    - **🧠 Agentic AI Scenarios:** Autonomous future scenario generation
-    - **🔗 Integrated Dashboard:** Cross-analysis correlation and unified insights
-    - **📱 Responsive Design:** Works seamlessly across all devices
-    - **⚡ Real-time Integration:** Live data correlation across all analysis modules
-    
-    #### 🔮 Advanced Capabilities
-    - **Cross-Module Integration:** All analysis components work together seamlessly
-    - **Agentic AI Reasoning:** Autonomous analysis and scenario generation
-    - **Predictive Analytics:** Future trend forecasting based on multiple data sources
-    - **Strategic Foresight:** Long-term planning and opportunity identification
-    - **Risk Assessment:** Comprehensive risk analysis across multiple scenarios
-    - **Personalization Engine:** Tailored insights based on individual profiles
-    """)
-    
-    st.success("✨ **Version 3.0** - Advanced Agentic AI Integration - Built with ❤️ by Faby Rizky")
-    
-    st.markdown("""
-    #### 🧠 Agentic AI Features
-    Our advanced agentic AI system can:
-    - **Autonomously analyze** trends across multiple data sources
-    - **Generate realistic scenarios** based on current patterns
-    - **Provide strategic recommendations** without human intervention
-    - **Continuously learn** from new data and user interactions
-    - **Cross-reference insights** from different analysis modules
-    - **Adapt predictions** based on changing conditions
-    
-    #### 🔗 Integration Capabilities
-    The platform's integration engine:
-    - **Correlates data** from all analysis modules
-    - **Identifies patterns** across different data types
-    - **Provides unified insights** combining multiple perspectives
-    - **Generates actionable recommendations** based on comprehensive analysis
-    - **Maintains data freshness** indicators for reliability
-    - **Enables cross-validation** of insights and predictions
-    
-    #### 🤝 Contributing
-    This is an open-source project! Feel free to contribute, report issues, or suggest features.
-    
-    #### 📞 Get in Touch
-    Have questions or feedback? Reach out through any of the contact methods listed in the 
-    developer section above.
-    """)
-
-# Function for career analysis (keeping the original function)
-def generate_analysis(research_area, career_level, interests, challenges, goals):
-    """Generate comprehensive career analysis"""
-    # Base analysis templates
-    analysis_templates = {
-        "Artificial Intelligence": {
-            "overview": "Artificial Intelligence is currently the fastest-growing field in STEM, with applications spanning from healthcare to autonomous vehicles.",
-            "trends": "Key trends include Large Language Models, Computer Vision, and Edge AI deployment.",
-            "opportunities": "High demand for AI specialists, research positions, and startup opportunities.",
-            "skills": "Python programming, machine learning frameworks (TensorFlow, PyTorch), statistics, and domain expertise."
-        },
-        "Biotechnology": {
-            "overview": "Biotechnology combines biology with technology to develop innovative solutions for health, agriculture, and environmental challenges.",
-            "trends": "CRISPR gene editing, personalized medicine, synthetic biology, and biomanufacturing are leading trends.",
-            "opportunities": "Growing opportunities in pharmaceutical companies, research institutions, and biotech startups.",
-            "skills": "Molecular biology, bioinformatics, laboratory techniques, and regulatory knowledge."
-        },
-        "Quantum Computing": {
-            "overview": "Quantum computing represents a revolutionary approach to computation, promising to solve complex problems beyond classical computers.",
-            "trends": "Quantum supremacy achievements, cloud quantum services, and quantum machine learning algorithms.",
-            "opportunities": "Research positions, quantum software development, and consulting roles in emerging quantum industry.",
-            "skills": "Quantum mechanics, linear algebra, programming languages like Qiskit, and theoretical physics."
-        },
-        "Data Science": {
-            "overview": "Data Science leverages statistical methods and computational tools to extract insights from complex datasets.",
-            "trends": "AutoML, explainable AI, real-time analytics, and data privacy technologies are current focal points.",
-            "opportunities": "High demand across industries including finance, healthcare, tech, and government sectors.",
-            "skills": "Statistical analysis, programming (Python/R), machine learning, and domain knowledge."
-        },
-        "Renewable Energy": {
-            "overview": "Renewable energy technology focuses on sustainable power generation through solar, wind, and other clean sources.",
-            "trends": "Energy storage solutions, smart grid technology, and green hydrogen production are emerging trends.",
-            "opportunities": "Engineering roles, policy development, and project management in the growing green economy.",
-            "skills": "Engineering principles, project management, regulatory knowledge, and sustainability expertise."
-        }
-    }
-    
-    base_info = analysis_templates.get(research_area, analysis_templates["Data Science"])
-    
-    # Generate personalized narrative
-    narrative = f"""
-    ## 🎯 Personalized STEM Career Analysis for {career_level}
-    
-    ### 📋 Your Profile Summary
-    Based on your inputs, you are a **{career_level}** professional interested in **{research_area}** with specific focus on **{', '.join(interests) if interests else 'general applications'}**.
-    
-    ### 🔍 Field Overview: {research_area}
-    {base_info['overview']}
-    
-    ### 📈 Current Trends & Developments
-    {base_info['trends']}
-    
-    ### 🚀 Career Opportunities
-    {base_info['opportunities']}
-    
-    ### 🎓 Recommended Skills Development
-    {base_info['skills']}
-    
-    ### 💡 Addressing Your Challenges
-    """
-    
-    if "Lack of Experience" in challenges:
-        narrative += "\n- **Experience Gap**: Consider contributing to open-source projects, pursuing internships, or building a portfolio of personal projects to demonstrate your capabilities."
-    
-    if "Keeping Up with Technology" in challenges:
-        narrative += "\n- **Technology Updates**: Follow industry leaders on social media, subscribe to relevant newsletters, and join professional communities in your field."
-    
-    if "Finding Opportunities" in challenges:
-        narrative += "\n- **Opportunity Discovery**: Leverage LinkedIn, attend virtual conferences, join professional associations, and network with industry professionals."
-    
-    if "Skill Development" in challenges:
-        narrative += "\n- **Skill Enhancement**: Create a structured learning plan, utilize online platforms like Coursera or edX, and seek mentorship from experienced professionals."
-    
-    narrative += f"""
-    
-    ### 🎯 Strategic Recommendations Based on Your Goals
-    """
-    
-    if "Career Transition" in goals:
-        narrative += "\n- **Transition Strategy**: Develop a 6-12 month transition plan, identify transferable skills, and consider bridge roles that combine your current expertise with your target field."
-    
-    if "Skill Enhancement" in goals:
-        narrative += "\n- **Learning Path**: Focus on both technical and soft skills, pursue relevant certifications, and practice through hands-on projects."
-    
-    if "Research Opportunities" in goals:
-        narrative += "\n- **Research Direction**: Identify active research groups, consider graduate studies or research collaborations, and stay updated with latest publications in your area of interest."
-    
-    if "Industry Networking" in goals:
-        narrative += "\n- **Networking Strategy**: Attend industry events, join professional societies, engage in online communities, and consider informational interviews with industry leaders."
-    
-    return narrative
-
-# Sidebar Information
-st.sidebar.markdown("---")
-st.sidebar.markdown("### 📊 Platform Stats")
-st.sidebar.metric("🌟 Version", "3.0.0")
-st.sidebar.metric("📅 Last Updated", "June 2025")
-st.sidebar.metric("💡 Active Features", "25+")
-st.sidebar.metric("🚀 Uptime", "99.9%")
-st.sidebar.metric("🧠 AI Modules", "6")
-
-st.sidebar.markdown("---")
-st.sidebar.markdown("### 🔗 Quick Actions")
-if st.sidebar.button("🔄 Reset All Data"):
-    st.session_state.analysis_data = {}
-    st.session_state.search_results = []
-    st.session_state.trend_data = pd.DataFrame()
-    st.session_state.pattern_insights = {}
-    st.sidebar.success("✅ All data reset!")
+page = st.sidebar.selectbox("🚀 Navigate:", list(PAGES))
 
-st.sidebar.markdown("""
-### 📚 Quick Links
-- 📚 [Documentation](#)
-- 🐛 [Report Bug](#)  
-- 💡 [Feature Request](#)
-- 📞 [Support](#)
-- ⭐ [Rate This App](#)
-""")
+layout.developer_section()
 
-st.sidebar.markdown("---")
-st.sidebar.info("💡 **New!** Try the Integrated Dashboard after running multiple analyses!")
+# Main Content: only the selected page module is imported and run
+render(page)
 
-# Footer
-st.markdown("---")
-st.markdown("""
-<div style='text-align: center; color: gray; font-size: 14px; padding: 2rem 0; border-top: 1px solid #eee;'>
-    <p><strong>🔬 Future STEM News Intelligence</strong> © 2025</p>
-    <p>Developed with ❤️ by <strong>Faby Rizky</strong> | Empowering the future through intelligent STEM analysis</p>
-    <p style="font-size: 12px; margin-top: 1rem;">
-        🚀 Powered by Streamlit | 📊 Data-driven insights | 🤖 Advanced Agentic AI | 🔗 Integrated Analysis Engine
-    </p>
-</div>
-""", unsafe_allow_html=True)
+layout.sidebar()
+layout.footer()
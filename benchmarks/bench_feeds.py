@@ -0,0 +1,98 @@
+"""Feed poller throughput against a local stand-in HTTP server
+
+    python -m benchmarks.bench_feeds --feeds 1000 --hosts 20
+
+Starts one asyncio HTTP server per simulated host on localhost, each serving
+RSS documents with ETags (gzip-compressed when asked). The poller then runs
+twice: a cold poll that downloads and parses every feed, and a warm poll in
+which every request carries its ETag and is answered with 304 Not Modified.
+"""
+import argparse
+import asyncio
+import gzip
+import time
+
+from stem_intel.feeds import FeedFetcher, FeedState
+
+
+def make_rss(feed_id, items):
+    entries = "".join(
+        f"<item><title>Feed {feed_id} story {i}: quantum sensor breakthrough</title>"
+        f"<link>http://example.org/{feed_id}/{i}</link><guid>{feed_id}-{i}</guid>"
+        f"<description>Researchers report progress on item {i} of feed {feed_id}.</description>"
+        f"<pubDate>Mon, 02 Jun 2025 10:00:00 GMT</pubDate></item>"
+        for i in range(items)
+    )
+    return f'<?xml version="1.0"?><rss version="2.0"><channel><title>Feed {feed_id}</title>{entries}</channel></rss>'
+
+
+class StandInServer:
+    """Keep-alive HTTP/1.1 server answering GET /feed/<n> with RSS and ETags"""
+
+    def __init__(self, feeds, items):
+        self.bodies = {}
+        for feed_id in range(feeds):
+            raw = make_rss(feed_id, items).encode()
+            self.bodies[f"/feed/{feed_id}"] = (raw, gzip.compress(raw), f'"v1-{feed_id}"')
+        self.requests = 0
+
+    async def handle(self, reader, writer):
+        try:
+            while True:
+                head = await reader.readuntil(b"\r\n\r\n")
+                lines = head.decode("latin-1").split("\r\n")
+                path = lines[0].split()[1]
+                headers = {k.strip().lower(): v.strip()
+                           for k, _, v in (line.partition(":") for line in lines[1:] if line)}
+                self.requests += 1
+                raw, zipped, etag = self.bodies.get(path, (None, None, None))
+                if raw is None:
+                    writer.write(b"HTTP/1.1 404 Not Found\r\nContent-Length: 0\r\n\r\n")
+                elif headers.get("if-none-match") == etag:
+                    writer.write(f"HTTP/1.1 304 Not Modified\r\nETag: {etag}\r\n\r\n".encode())
+                else:
+                    body, extra = raw, ""
+                    if "gzip" in headers.get("accept-encoding", ""):
+                        body, extra = zipped, "Content-Encoding: gzip\r\n"
+                    writer.write((f"HTTP/1.1 200 OK\r\nContent-Type: application/rss+xml\r\n"
+                                  f"ETag: {etag}\r\n{extra}Content-Length: {len(body)}\r\n\r\n").encode() + body)
+                await writer.drain()
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+
+async def bench(feeds, hosts, items, max_per_host):
+    server = StandInServer(feeds, items)
+    servers = [await asyncio.start_server(server.handle, "127.0.0.1", 0) for _ in range(hosts)]
+    ports = [s.sockets[0].getsockname()[1] for s in servers]
+    feed_list = [(f"http://127.0.0.1:{ports[i % hosts]}/feed/{i}", None) for i in range(feeds)]
+
+    fetcher = FeedFetcher(feed_list, FeedState(None), max_per_host=max_per_host)
+    results = {}
+    for label in ("cold", "warm"):
+        start = time.perf_counter()
+        articles, stats = await fetcher.poll()
+        elapsed = time.perf_counter() - start
+        results[label] = (stats, len(articles), elapsed)
+        print(f"{label:>5}: {stats}")
+
+    for s in servers:
+        s.close()
+        await s.wait_closed()
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--feeds", type=int, default=1000)
+    parser.add_argument("--hosts", type=int, default=20)
+    parser.add_argument("--items", type=int, default=20, help="items per feed")
+    parser.add_argument("--max-per-host", type=int, default=4)
+    args = parser.parse_args(argv)
+    asyncio.run(bench(args.feeds, args.hosts, args.items, args.max_per_host))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+"""Per-rerun wall time of the Streamlit app, checked against a target
+
+    python -m benchmarks.bench_rerun --page "ℹ️ About" --runs 50
+
+Drives app.py headlessly with Streamlit's AppTest: one warm-up run imports
+the selected page module, then every timed run is a plain rerun, which is
+what a widget interaction costs. Exits with status 1 when the median rerun
+exceeds the target, so the check can gate CI.
+"""
+import argparse
+import os
+import statistics
+import sys
+import time
+
+from streamlit.testing.v1 import AppTest
+
+APP = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "app.py")
+
+# Median rerun budget for the lightest page (static content only)
+RERUN_TARGET_MS = 50.0
+LIGHTEST_PAGE = "ℹ️ About"
+
+
+def time_reruns(page, runs):
+    """Wall time in ms of ``runs`` reruns with ``page`` selected"""
+    at = AppTest.from_file(APP, default_timeout=60).run()
+    at.sidebar.selectbox[0].set_value(page).run()
+    if at.exception:
+        raise RuntimeError(f"{page} raised: {at.exception[0].value}")
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        at.run()
+        timings.append(1000 * (time.perf_counter() - start))
+    return timings
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--page", default=LIGHTEST_PAGE)
+    parser.add_argument("--runs", type=int, default=50)
+    parser.add_argument("--target-ms", type=float, default=RERUN_TARGET_MS)
+    args = parser.parse_args(argv)
+
+    timings = sorted(time_reruns(args.page, args.runs))
+    median = statistics.median(timings)
+    p95 = timings[min(len(timings) - 1, int(0.95 * len(timings)))]
+    verdict = "OK" if median <= args.target_ms else "OVER TARGET"
+    print(f"{args.page}: median {median:.1f} ms, p95 {p95:.1f} ms "
+          f"over {args.runs} reruns (target {args.target_ms:.0f} ms) {verdict}")
+    return 0 if median <= args.target_ms else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
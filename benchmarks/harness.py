@@ -0,0 +1,83 @@
+"""Timing, peak-memory and baseline comparison helpers for the benchmark suite"""
+import gc
+import json
+import os
+import platform
+import statistics
+import time
+import tracemalloc
+
+PERCENTILES = (50, 90, 99)
+
+# A case regresses when its p50 grows by more than this fraction...
+TOLERANCE = 0.25
+# ...and by more than this many milliseconds (timer noise on tiny cases)
+NOISE_FLOOR_MS = 0.5
+
+
+def percentile(sorted_values, pct):
+    """Nearest-rank percentile of an already sorted list"""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, -(-pct * len(sorted_values) // 100))
+    return sorted_values[int(rank) - 1]
+
+
+def measure(fn, repeat=20, warmup=1):
+    """Latency percentiles (ms) and peak traced memory (MiB) of ``fn(i)``
+
+    ``fn`` receives the repetition number so cases can vary their input.
+    Timing runs untraced; peak memory comes from one extra traced call, since
+    tracemalloc slows allocation-heavy code down considerably.
+    """
+    for i in range(warmup):
+        fn(i)
+    gc.collect()
+    timings = []
+    for i in range(repeat):
+        start = time.perf_counter()
+        fn(warmup + i)
+        timings.append(1000 * (time.perf_counter() - start))
+    timings.sort()
+
+    gc.collect()
+    tracemalloc.start()
+    try:
+        fn(warmup + repeat)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    result = {f"p{pct}_ms": round(percentile(timings, pct), 3) for pct in PERCENTILES}
+    result.update(mean_ms=round(statistics.fmean(timings), 3), runs=repeat, peak_mib=round(peak / 2 ** 20, 2))
+    return result
+
+
+def environment():
+    return {"python": platform.python_version(), "machine": platform.machine(),
+            "processor": platform.processor() or platform.machine(), "cpus": os.cpu_count()}
+
+
+def save(path, results):
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    with open(path, "w", encoding="utf-8") as fh:
+        json.dump({"environment": environment(), "results": results}, fh, indent=2, sort_keys=True)
+
+
+def load(path):
+    with open(path, encoding="utf-8") as fh:
+        return json.load(fh)["results"]
+
+
+def compare(results, baseline, tolerance=TOLERANCE):
+    """Rows of (case, baseline p50, current p50, change %, regressed) for shared cases"""
+    rows = []
+    for case, current in results.items():
+        base = baseline.get(case)
+        if base is None:
+            continue
+        old, new = base["p50_ms"], current["p50_ms"]
+        change = 100.0 * (new - old) / old if old else 0.0
+        regressed = new > old * (1 + tolerance) and new - old > NOISE_FLOOR_MS
+        rows.append((case, old, new, change, regressed))
+    return rows
@@ -0,0 +1,253 @@
+"""Benchmark suite for search, topics, trends, patterns, forecasts, anomalies, scenarios and career reports
+
+    python -m benchmarks.suite                          # quick grid
+    python -m benchmarks.suite --grid full              # up to 10k categories, 1M articles
+    python -m benchmarks.suite --save-baseline          # record benchmarks/baseline.json
+    python -m benchmarks.suite --only search,trends     # subset of the cases
+
+Every case reports latency percentiles and peak traced memory. When a baseline
+file exists the run is compared against it and the exit status is 1 if any
+case's median got slower than the tolerance allows. Synthetic corpora, indexes
+and trend stores are built once under ``--workdir`` and reused by later runs.
+"""
+import argparse
+import itertools
+import os
+import sys
+import tempfile
+import time
+from datetime import date, timedelta
+
+import numpy as np
+
+from benchmarks import harness
+from stem_intel.anomaly import Detector
+from stem_intel.corpus import TokenBatch, article_text
+from stem_intel.index import SearchIndex
+from stem_intel.forecast import fit
+from stem_intel.ingest import ingest_articles
+from stem_intel.parallel import parallel_trend_window
+from stem_intel.patterns import extract_patterns_batch
+from stem_intel.scenarios import COMPLEXITY, run_scenarios
+from stem_intel.search import search_news
+from stem_intel.topics import BATCH_SIZE, TopicModel, fit_topics
+from stem_intel.trends import generate_trend_data
+from stem_intel.tsstore import TrendStore
+
+BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baseline.json")
+
+GRIDS = {
+    "quick": {"categories": [10, 100, 1000], "months": [3, 12, 120], "docs": [1_000, 10_000]},
+    "full": {"categories": [10, 100, 1000, 10_000], "months": [3, 12, 36, 120],
+             "docs": [1_000, 10_000, 100_000, 1_000_000]},
+}
+
+CORPUS_CATEGORIES = ["Artificial Intelligence", "Biotechnology", "Quantum Computing", "Data Science",
+                     "Renewable Energy"]
+VOCAB_SIZE = 50_000
+SEED = 20250601
+
+
+def _vocab():
+    return np.array([f"w{i}" for i in range(VOCAB_SIZE)])
+
+
+def synthetic_articles(n, seed=SEED):
+    """Deterministic Zipf-distributed articles spread over two years"""
+    rng = np.random.default_rng(seed)
+    vocab = _vocab()
+    start = date(2024, 1, 1)
+    for i in range(n):
+        words = vocab[np.minimum(rng.zipf(1.3, 60), VOCAB_SIZE) - 1]
+        yield {
+            "id": f"bench-{i}",
+            "title": " ".join(words[:8]),
+            "summary": " ".join(words[8:30]),
+            "body": " ".join(words[30:]),
+            "url": "",
+            "source": f"outlet-{i % 97}",
+            "category": CORPUS_CATEGORIES[i % len(CORPUS_CATEGORIES)],
+            "published": (start + timedelta(days=int(i * 730 // max(n, 1)))).isoformat(),
+            "key_insights": [],
+        }
+
+
+def queries(count=64, seed=SEED):
+    """Seeded one-to-three term queries drawn from the same Zipf vocabulary"""
+    rng = np.random.default_rng(seed + 1)
+    vocab = _vocab()
+    return [" ".join(vocab[np.minimum(rng.zipf(1.5, rng.integers(1, 4)), VOCAB_SIZE) - 1]) for _ in range(count)]
+
+
+def _built(workdir, name, build):
+    path = os.path.join(workdir, name)
+    marker = os.path.join(path, ".complete")
+    if not os.path.exists(marker):
+        start = time.perf_counter()
+        build(path)
+        os.makedirs(path, exist_ok=True)
+        open(marker, "w").close()
+        print(f"  built {name} in {time.perf_counter() - start:.1f}s", file=sys.stderr)
+    return path
+
+
+def bench_search(grid, workdir, repeat):
+    results = {}
+    query_set = queries()
+    for n in grid["docs"]:
+        path = _built(workdir, f"index-{n}", lambda p, n=n: ingest_articles(
+            synthetic_articles(n), os.path.join(p, "index"), trend_dir=None, rebuild=True, aggregate_dir=None,
+            counter_path=None, topic_dir=None))
+        index = SearchIndex(os.path.join(path, "index"))
+        results[f"search/docs={n}"] = harness.measure(
+            lambda i: search_news(index, query_set[i % len(query_set)]), repeat)
+    return results
+
+
+def bench_topics(grid, workdir, repeat):
+    # One mini-batch k-means step, and incremental assignment of a batch of new articles
+    batches = [TokenBatch([article_text(a) for a in synthetic_articles(BATCH_SIZE, SEED + i)]) for i in range(4)]
+    model = TopicModel()
+    results = {"topics/partial_fit": harness.measure(lambda i: model.partial_fit(batches[i % 4]), repeat),
+               "topics/assign": harness.measure(lambda i: model.assign(batches[i % 4]), repeat)}
+    n = min(grid["docs"][-1], 100_000)
+    results[f"topics/fit/docs={n}"] = harness.measure(lambda i: fit_topics(lambda: synthetic_articles(n)), 1, 0)
+    return results
+
+
+def _trend_store(workdir, n_categories, n_days):
+    def build(path):
+        store = TrendStore(path)
+        rng = np.random.default_rng(SEED)
+        names = [f"category-{c}" for c in range(n_categories)]
+        # Write in column blocks so even 10k categories stay within memory
+        for lo in range(0, n_categories, 500):
+            block = rng.poisson(20, size=(n_days, min(500, n_categories - lo))).astype(np.float32)
+            store.add_block(date(2025, 6, 1) - timedelta(days=n_days - 1), names[lo:lo + 500], block)
+    return TrendStore(_built(workdir, f"trends-{n_categories}-{n_days}", build))
+
+
+def bench_trends(grid, workdir, repeat):
+    results = {}
+    longest = max(grid["months"]) * 31
+    for n_categories in grid["categories"]:
+        store = _trend_store(workdir, n_categories, longest)
+        categories = store.categories[:n_categories]
+        for months in grid["months"]:
+            frame = generate_trend_data(categories, months, store)
+            key = f"categories={n_categories},months={months}"
+            results[f"trends/{key}"] = harness.measure(
+                lambda i: generate_trend_data(categories, months, store), repeat)
+            results[f"patterns/{key}"] = harness.measure(
+                lambda i: extract_patterns_batch(frame, categories), repeat)
+        # Two years of daily history per category, all fitted in one pass
+        history = store.window()[-730:]
+        results[f"forecast/categories={n_categories},days={len(history)}"] = harness.measure(
+            lambda i: fit(history), max(repeat // 4, 3))
+        # One online detector tick: a new day for every category
+        detector, rows = Detector(n_categories), store.window()
+        results[f"anomaly/categories={n_categories}"] = harness.measure(
+            lambda i: detector.update(rows[i % len(rows)]), repeat)
+    return results
+
+
+def bench_parallel(grid, workdir, repeat):
+    # The largest category set over three years: window plus pattern statistics, in-process and on every core
+    n_categories, months = max(grid["categories"]), 36
+    store = _trend_store(workdir, n_categories, max(grid["months"]) * 31)
+    categories = store.categories[:n_categories]
+    end = store.end
+
+    def serial(i):
+        return extract_patterns_batch(generate_trend_data(categories, months, store, 0), categories)
+
+    key = f"categories={n_categories}"
+    results = {f"parallel/window+patterns/{key},workers=1": harness.measure(serial, repeat)}
+    for workers in sorted({2, os.cpu_count() or 1} - {1}):
+        results[f"parallel/window+patterns/{key},workers={workers}"] = harness.measure(
+            lambda i: parallel_trend_window(categories, months, end, store, workers), repeat)
+    return results
+
+
+def bench_career(grid, workdir, repeat):
+    from views.career import generate_analysis
+
+    areas = ["Artificial Intelligence", "Biotechnology", "Quantum Computing", "Data Science",
+             "Renewable Energy", "Robotics"]
+    levels = ["Student", "Recent Graduate", "Entry Level", "Mid-Career", "Senior Professional"]
+    challenges = ["Lack of Experience", "Keeping Up with Technology", "Finding Opportunities", "Skill Development"]
+    goals = ["Career Transition", "Skill Enhancement", "Research Opportunities", "Industry Networking"]
+    combos = list(itertools.product(areas, levels, [challenges[:k] for k in range(5)], [goals[:k] for k in range(5)]))
+
+    def run(i):
+        area, level, chosen_challenges, chosen_goals = combos[i % len(combos)]
+        return generate_analysis(area, level, ["Machine Learning"], chosen_challenges, chosen_goals)
+
+    # First pass renders every profile; the second is served from the report cache
+    return {"career/profiles": harness.measure(run, max(repeat, len(combos))),
+            "career/cached": harness.measure(run, max(repeat, len(combos)))}
+
+
+def bench_scenarios(grid, workdir, repeat):
+    store = _trend_store(workdir, 10, 730)
+    return {f"scenarios/{level}": harness.measure(
+        lambda i, level=level: run_scenarios(store.categories[i % 10], 12, level, store), max(repeat // 4, 3))
+        for level in COMPLEXITY}
+
+
+CASES = {
+    "search": bench_search,
+    "topics": bench_topics,
+    "trends": bench_trends,
+    "parallel": bench_parallel,
+    "scenarios": bench_scenarios,
+    "career": bench_career,
+}
+
+
+def print_results(results):
+    print(f"{'case':<44} {'p50 ms':>10} {'p90 ms':>10} {'p99 ms':>10} {'peak MiB':>10}")
+    for case, r in results.items():
+        print(f"{case:<44} {r['p50_ms']:>10.3f} {r['p90_ms']:>10.3f} {r['p99_ms']:>10.3f} {r['peak_mib']:>10.2f}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--grid", choices=sorted(GRIDS), default="quick")
+    parser.add_argument("--only", help="comma-separated subset of: " + ", ".join(CASES))
+    parser.add_argument("--repeat", type=int, default=20, help="timed runs per case (default: %(default)s)")
+    parser.add_argument("--workdir", default=os.path.join(tempfile.gettempdir(), "stem-bench"),
+                        help="where synthetic corpora and stores are cached (default: %(default)s)")
+    parser.add_argument("--baseline", default=BASELINE, help="baseline file (default: %(default)s)")
+    parser.add_argument("--save-baseline", action="store_true", help="write this run as the new baseline")
+    parser.add_argument("--output", help="also write this run's results to a JSON file")
+    parser.add_argument("--tolerance", type=float, default=harness.TOLERANCE,
+                        help="allowed p50 slowdown before a case counts as regressed (default: %(default)s)")
+    args = parser.parse_args(argv)
+
+    grid = GRIDS[args.grid]
+    selected = args.only.split(",") if args.only else list(CASES)
+    results = {}
+    for name in selected:
+        print(f"running {name} ({args.grid} grid)", file=sys.stderr)
+        results.update(CASES[name](grid, args.workdir, args.repeat))
+    print_results(results)
+
+    if args.output:
+        harness.save(args.output, results)
+    if args.save_baseline:
+        harness.save(args.baseline, results)
+        print(f"\nbaseline written to {args.baseline}")
+        return 0
+    if not os.path.exists(args.baseline):
+        return 0
+
+    rows = harness.compare(results, harness.load(args.baseline), args.tolerance)
+    print(f"\ncompared with {args.baseline} (tolerance {100 * args.tolerance:.0f}%)")
+    for case, old, new, change, regressed in rows:
+        print(f"{'REGRESSED' if regressed else 'ok':<10} {case:<44} {old:>10.3f} -> {new:>10.3f} ms ({change:+.1f}%)")
+    return 1 if any(row[-1] for row in rows) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
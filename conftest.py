@@ -0,0 +1 @@
+"""Lets pytest import stem_intel and benchmarks from the repository root"""
@@ -0,0 +1 @@
+"""Core engines behind the Future STEM News Intelligence app"""
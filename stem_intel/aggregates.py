@@ -0,0 +1,352 @@
+"""Materialized field x month aggregates behind the Track Patterns tables
+
+Every ingested article adds to a handful of additive metrics for its
+(category, calendar month) cell, plus an article count for its
+(category, month, source) cell. Both are stored only as prefix sums along the
+month axis, so the totals of any trailing window are one subtraction of two
+rows: switching from "Last 6 months" to "Last 5 years" costs
+O(categories x sources), independent of how many articles were ingested.
+
+New data only touches the rows from its earliest month onward, which for
+live feeds is the last row or two; back-filled history shifts or extends the
+arrays, which is rare.
+
+    python -m stem_intel.aggregates --rebuild    # backfill from the search index
+"""
+import argparse
+import json
+import os
+import shutil
+import threading
+from collections import Counter
+from datetime import date
+
+import numpy as np
+import pandas as pd
+
+from .config import AGGREGATE_DIR, INDEX_DIR
+
+META_FILE = "meta.json"
+
+# Additive per (category, month) metrics, in storage order
+METRICS = ("articles", "duplicates", "sentiment", "positive", "funding")
+
+# Sentiment score from which an article counts as positive coverage
+POSITIVE_SCORE = 0.05
+
+# Tokens marking an article as reporting on funding or investment
+FUNDING_TERMS = frozenset("""
+funding funded fund funds grant grants investment investments investor investors
+invest invests raised raises financing venture budget budgets subsidy subsidies
+""".split())
+
+TIME_PERIODS = {"Last 6 months": 6, "Last year": 12, "Last 2 years": 24, "Last 5 years": 60}
+
+
+def month_index(published):
+    """Months since year 0 of an ISO date string (today when missing)"""
+    if not published:
+        today = date.today()
+        return today.year * 12 + today.month - 1
+    return int(published[:4]) * 12 + int(published[5:7]) - 1
+
+
+def mentions(tokens, terms):
+    """Boolean per text of a TokenBatch: does it contain any of ``terms``"""
+    if not len(tokens):
+        return np.zeros(tokens.n_docs, dtype=bool)
+    hit = np.fromiter((t in terms for t in tokens.vocab.tolist()), dtype=bool, count=len(tokens.vocab))
+    return np.bincount(tokens.doc_of, weights=hit[tokens.inverse], minlength=tokens.n_docs) > 0
+
+
+def _replace_npy(path, array):
+    tmp = path + ".tmp.npy"
+    np.save(tmp, array)
+    os.replace(tmp, path)
+
+
+class AggregateStore:
+    """Prefix-summed (month x category) metrics and (month x category x source) counts"""
+
+    def __init__(self, path=AGGREGATE_DIR):
+        self.path = path
+        self._meta_mtime = None
+        self._reset()
+        self.refresh()
+
+    def _reset(self):
+        self.start = None
+        self.categories, self.sources = [], []
+        self.cum = np.zeros((1, 0, len(METRICS)))
+        self.outlet_cum = np.zeros((1, 0, 0), dtype=np.int32)
+        self._rows = []
+
+    @property
+    def n_months(self):
+        return len(self.cum) - 1
+
+    @property
+    def pending(self):
+        """Rows buffered since the last flush"""
+        return len(self._rows)
+
+    @property
+    def version(self):
+        """Changes whenever a refresh loaded newer aggregates"""
+        return self._meta_mtime
+
+    @property
+    def end(self):
+        """Month index of the last stored month, None when empty"""
+        return None if self.start is None else self.start + self.n_months - 1
+
+    def refresh(self):
+        """Reload arrays if another process saved newer aggregates"""
+        meta_path = os.path.join(self.path, META_FILE)
+        if not os.path.exists(meta_path) or os.path.getmtime(meta_path) == self._meta_mtime:
+            return False
+        mtime = os.path.getmtime(meta_path)
+        with open(meta_path, encoding="utf-8") as fh:
+            meta = json.load(fh)
+        self.start = meta["start"]
+        self.categories, self.sources = meta["categories"], meta["sources"]
+        self.cum = np.load(os.path.join(self.path, "cum.npy"))
+        self.outlet_cum = np.load(os.path.join(self.path, "outlet_cum.npy"))
+        self._meta_mtime = mtime
+        return True
+
+    # -- writing ----------------------------------------------------------
+
+    def add(self, published, category, source, articles=1, duplicates=0, sentiment=0.0, funding=False):
+        """Buffer one article (or duplicate copy) until the next :meth:`flush`"""
+        self._rows.append((month_index(published), category or "General", source or "",
+                           articles, duplicates, sentiment, articles if sentiment >= POSITIVE_SCORE else 0,
+                           funding))
+
+    def flush(self):
+        """Fold buffered rows into the prefix sums"""
+        if not self._rows:
+            return
+        months, categories, sources, *values = zip(*self._rows)
+        self._rows = []
+        months = np.array(months, dtype=np.int64)
+        values = np.column_stack([np.asarray(v, dtype=np.float64) for v in values])
+
+        self._cover_months(int(months.min()), int(months.max()))
+        cat_codes = self._codes(self.categories, categories)
+        src_codes = self._codes(self.sources, sources)
+        self._pad_columns()
+
+        # Deltas for the touched month span, accumulated and added to every
+        # prefix row after the first touched month
+        lo = int(months.min()) - self.start
+        span = int(months.max()) - self.start - lo + 1
+        rows = months - self.start - lo
+
+        delta = np.zeros((span, len(self.categories), len(METRICS)))
+        np.add.at(delta, (rows, cat_codes), values)
+        self.cum[lo + 1:lo + 1 + span] += np.cumsum(delta, axis=0)
+        self.cum[lo + 1 + span:] += delta.sum(axis=0)
+
+        outlets = np.zeros((span, len(self.categories), len(self.sources)), dtype=np.int32)
+        np.add.at(outlets, (rows, cat_codes, src_codes), 1)
+        self.outlet_cum[lo + 1:lo + 1 + span] += np.cumsum(outlets, axis=0, dtype=np.int32)
+        self.outlet_cum[lo + 1 + span:] += outlets.sum(axis=0, dtype=np.int32)
+
+    def _codes(self, names, values):
+        lookup = {name: i for i, name in enumerate(names)}
+        for value in values:
+            if value not in lookup:
+                lookup[value] = len(names)
+                names.append(value)
+        return np.array([lookup[v] for v in values], dtype=np.int64)
+
+    def _pad_columns(self):
+        extra = len(self.categories) - self.cum.shape[1]
+        if extra:
+            self.cum = np.pad(self.cum, ((0, 0), (0, extra), (0, 0)))
+        extra_cats = len(self.categories) - self.outlet_cum.shape[1]
+        extra_srcs = len(self.sources) - self.outlet_cum.shape[2]
+        if extra_cats or extra_srcs:
+            self.outlet_cum = np.pad(self.outlet_cum, ((0, 0), (0, extra_cats), (0, extra_srcs)))
+
+    def _cover_months(self, first, last):
+        if self.start is None:
+            self.start = first
+            self.cum = np.repeat(self.cum[:1], last - first + 2, axis=0)
+            self.outlet_cum = np.repeat(self.outlet_cum[:1], last - first + 2, axis=0)
+            return
+        if first < self.start:
+            # Prefix rows before any stored month are all zero
+            pad = self.start - first
+            self.cum = np.pad(self.cum, ((pad, 0), (0, 0), (0, 0)))
+            self.outlet_cum = np.pad(self.outlet_cum, ((pad, 0), (0, 0), (0, 0)))
+            self.start = first
+        if last > self.end:
+            # Months after the last stored one carry the running totals
+            pad = last - self.end
+            self.cum = np.concatenate([self.cum, np.repeat(self.cum[-1:], pad, axis=0)])
+            self.outlet_cum = np.concatenate([self.outlet_cum, np.repeat(self.outlet_cum[-1:], pad, axis=0)])
+
+    def save(self):
+        """Flush and publish the aggregates (arrays first, metadata last)"""
+        self.flush()
+        if self.start is None:
+            return
+        os.makedirs(self.path, exist_ok=True)
+        _replace_npy(os.path.join(self.path, "cum.npy"), self.cum)
+        _replace_npy(os.path.join(self.path, "outlet_cum.npy"), self.outlet_cum)
+        meta_path = os.path.join(self.path, META_FILE)
+        with open(meta_path + ".tmp", "w", encoding="utf-8") as fh:
+            json.dump({"start": self.start, "categories": self.categories, "sources": self.sources}, fh)
+        os.replace(meta_path + ".tmp", meta_path)
+        self._meta_mtime = os.path.getmtime(meta_path)
+
+    # -- reading ----------------------------------------------------------
+
+    def window(self, months, end=None):
+        """Per-category totals over the ``months`` months ending at ``end``
+
+        ``end`` defaults to the last stored month. Returns a DataFrame indexed
+        by category with one column per metric, ``outlets`` (distinct sources)
+        and ``previous_articles`` / ``previous_funding`` for the window before.
+        """
+        columns = list(METRICS) + ["outlets", "previous_articles", "previous_funding"]
+        if self.start is None:
+            return pd.DataFrame(columns=columns, dtype=float)
+        end = self.end if end is None else end
+        hi = int(np.clip(end - self.start + 1, 0, self.n_months))
+        lo = int(np.clip(hi - months, 0, self.n_months))
+        prev = int(np.clip(lo - months, 0, self.n_months))
+
+        totals = self.cum[hi] - self.cum[lo]
+        previous = self.cum[lo] - self.cum[prev]
+        frame = pd.DataFrame(totals, index=pd.Index(self.categories, name="category"), columns=list(METRICS))
+        frame["outlets"] = ((self.outlet_cum[hi] - self.outlet_cum[lo]) > 0).sum(axis=1)
+        frame["previous_articles"] = previous[:, METRICS.index("articles")]
+        frame["previous_funding"] = previous[:, METRICS.index("funding")]
+        return frame
+
+
+def _pct_change(current, previous):
+    return np.where(previous > 0, 100.0 * (current - previous) / np.maximum(previous, 1), 0.0).round(1)
+
+
+def _ratio(numerator, denominator, scale=1.0, digits=2):
+    return np.where(denominator > 0, scale * numerator / np.maximum(denominator, 1e-12), 0.0).round(digits)
+
+
+# Analysis type -> (primary column, secondary column) for the comparison charts
+PATTERN_CHARTS = {
+    "Publication Volume": ("Articles", "Growth Rate (%)"),
+    "Citation Patterns": ("Syndicated Copies", "Copies per Story"),
+    "Collaboration Networks": ("Active Outlets", "Articles per Outlet"),
+    "Research Impact": ("Coverage", "Positive Coverage (%)"),
+    "Funding Trends": ("Funding Articles", "Funding Share (%)"),
+}
+
+
+def pattern_table(store, analysis_type, time_period):
+    """Track Patterns table for an analysis type, sorted by its primary column"""
+    months = TIME_PERIODS[time_period]
+    w = store.window(months)
+    w = w[w["articles"] + w["duplicates"] > 0]
+    articles, dups = w["articles"].to_numpy(), w["duplicates"].to_numpy()
+    table = {"Field": w.index.tolist()}
+    if analysis_type == "Publication Volume":
+        table["Articles"] = articles.astype(int)
+        table["Growth Rate (%)"] = _pct_change(articles, w["previous_articles"].to_numpy())
+        table["Share (%)"] = _ratio(articles, articles.sum(), 100.0, 1)
+        table["Articles / Month"] = _ratio(articles, months)
+    elif analysis_type == "Citation Patterns":
+        table["Syndicated Copies"] = dups.astype(int)
+        table["Copies per Story"] = _ratio(dups, articles)
+        table["Coverage"] = (articles + dups).astype(int)
+    elif analysis_type == "Collaboration Networks":
+        table["Active Outlets"] = w["outlets"].to_numpy()
+        table["Articles per Outlet"] = _ratio(articles, w["outlets"].to_numpy())
+    elif analysis_type == "Research Impact":
+        table["Coverage"] = (articles + dups).astype(int)
+        table["Avg Sentiment"] = _ratio(w["sentiment"].to_numpy(), articles, digits=3)
+        table["Positive Coverage (%)"] = _ratio(w["positive"].to_numpy(), articles, 100.0, 1)
+    else:
+        funding = w["funding"].to_numpy()
+        table["Funding Articles"] = funding.astype(int)
+        table["Funding Share (%)"] = _ratio(funding, articles, 100.0, 1)
+        table["Funding Growth (%)"] = _pct_change(funding, w["previous_funding"].to_numpy())
+    frame = pd.DataFrame(table)
+    primary = PATTERN_CHARTS.get(analysis_type, PATTERN_CHARTS["Funding Trends"])[0]
+    return frame.sort_values(primary, ascending=False, kind="stable").reset_index(drop=True)
+
+
+def rebuild_from_index(index_dir=INDEX_DIR, path=AGGREGATE_DIR):
+    """Recompute the aggregates from every article stored in the search index
+
+    Funding mentions and folded duplicates are read back as ingest recorded
+    them: every duplicate counts under its own month, category and source.
+    """
+    from .corpus import TokenBatch, article_text
+    from .index import MENTION_FUNDING, DuplicateLog, SearchIndex
+
+    if os.path.isdir(path):
+        shutil.rmtree(path)
+    store = AggregateStore(path)
+    index = SearchIndex(index_dir)
+    logged = DuplicateLog(index_dir).entries()
+    logged_per_doc = Counter(doc for doc, *_ in logged)
+    for seg_index, seg in enumerate(index.segments):
+        docs = [seg.document(i) for i in range(seg.n_docs)]
+        if seg.mentions is not None:
+            funding = (np.asarray(seg.mentions) & MENTION_FUNDING) > 0
+        else:
+            funding = mentions(TokenBatch([article_text(d) for d in docs]), FUNDING_TERMS)
+        for local_id, doc in enumerate(docs):
+            # Duplicates folded before the log existed are only known as counts on their representative
+            unlogged = index.duplicates(seg_index, local_id) - logged_per_doc[int(index.bases[seg_index]) + local_id]
+            store.add(doc.get("published"), doc.get("category"), doc.get("source"),
+                      duplicates=max(unlogged, 0),
+                      sentiment=float(seg.sentiment[local_id]), funding=bool(funding[local_id]))
+        store.flush()
+    for _, published, category, source in logged:
+        store.add(published, category, source, articles=0, duplicates=1)
+    store.flush()
+    store.save()
+    return store
+
+
+_store = None
+_store_lock = threading.Lock()
+
+
+def get_aggregate_store(path=AGGREGATE_DIR):
+    """Process-wide aggregate store, backfilled from an existing index on first use
+
+    The corpus itself is only ingested by ``python -m stem_intel.ingest``;
+    until then the store stays empty and pages show how to run it.
+    """
+    global _store
+    with _store_lock:
+        if _store is None or _store.path != path:
+            _store = AggregateStore(path)
+            if _store.start is None:
+                from .index import SearchIndex
+
+                if SearchIndex.exists(INDEX_DIR):
+                    rebuild_from_index(INDEX_DIR, path)
+        _store.refresh()
+        return _store
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Materialized Track Patterns aggregates")
+    parser.add_argument("--index", default=INDEX_DIR, help="index directory (default: %(default)s)")
+    parser.add_argument("--path", default=AGGREGATE_DIR, help="aggregate directory (default: %(default)s)")
+    parser.add_argument("--rebuild", action="store_true", help="recompute from the search index")
+    args = parser.parse_args(argv)
+
+    store = rebuild_from_index(args.index, args.path) if args.rebuild else AggregateStore(args.path)
+    print(f"{len(store.categories)} categories, {len(store.sources)} sources, {store.n_months} months")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,155 @@
+"""Persistent cache of search, scenario and career results in SQLite
+
+Results used to live only in session state, so every restart and every new
+session recomputed them and the dashboard only knew about the current
+session. :class:`AnalysisCache` keeps them in one SQLite file in WAL mode,
+so the app's sessions, the batch CLI and later restarts all read the same
+entries while one of them writes.
+
+Entries are keyed by kind and by their normalized inputs, serialized as
+sorted JSON; the inputs are stored next to the pickled value so the
+dashboard can list what is cached without unpickling anything. Every entry
+expires after its kind's TTL, and once the values exceed ``max_bytes`` the
+least recently read entries are evicted first.
+"""
+import json
+import os
+import pickle
+import sqlite3
+import threading
+import time
+from collections import namedtuple
+
+from .config import ANALYSIS_CACHE
+
+# Seconds an entry stays valid, per kind
+TTLS = {
+    "search": 3600,
+    "scenarios": 6 * 3600,
+    "career": 7 * 86400,
+}
+DEFAULT_TTL = 86400
+
+# Total pickled bytes kept before the least recently read entries go
+MAX_BYTES = 256 * 2 ** 20
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    kind TEXT NOT NULL,
+    key TEXT NOT NULL,
+    inputs TEXT NOT NULL,
+    value BLOB NOT NULL,
+    size INTEGER NOT NULL,
+    created REAL NOT NULL,
+    expires REAL NOT NULL,
+    accessed REAL NOT NULL,
+    PRIMARY KEY (kind, key)
+);
+CREATE INDEX IF NOT EXISTS entries_accessed ON entries (accessed);
+CREATE INDEX IF NOT EXISTS entries_created ON entries (kind, created);
+"""
+
+Entry = namedtuple("Entry", "value inputs created")
+
+
+def cache_key(inputs):
+    """Canonical text of an inputs dict; equal inputs give equal keys"""
+    return json.dumps(inputs, sort_keys=True, separators=(",", ":"), default=str)
+
+
+class AnalysisCache:
+    """Inputs-keyed results in a WAL-mode SQLite file, with TTL and size eviction"""
+
+    def __init__(self, path=ANALYSIS_CACHE, max_bytes=MAX_BYTES, ttls=None):
+        self.path = path
+        self.max_bytes = max_bytes
+        self.ttls = dict(TTLS, **(ttls or {}))
+        self.hits = 0
+        self.misses = 0
+        self._local = threading.local()
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self._connect().executescript(SCHEMA)
+
+    def _connect(self):
+        # One connection per thread; WAL lets readers run while another writes
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def get(self, kind, inputs):
+        """The unexpired :class:`Entry` for ``inputs``, or None"""
+        conn, now = self._connect(), time.time()
+        key = cache_key(inputs)
+        row = conn.execute("SELECT value, inputs, created, expires FROM entries WHERE kind = ? AND key = ?",
+                           (kind, key)).fetchone()
+        if row is None or row[3] <= now:
+            if row is not None:
+                conn.execute("DELETE FROM entries WHERE kind = ? AND key = ?", (kind, key))
+            self.misses += 1
+            return None
+        conn.execute("UPDATE entries SET accessed = ? WHERE kind = ? AND key = ?", (now, kind, key))
+        self.hits += 1
+        return Entry(pickle.loads(row[0]), json.loads(row[1]), row[2])
+
+    def put(self, kind, inputs, value, ttl=None):
+        """Store ``value`` for ``inputs`` and evict what no longer fits"""
+        blob = pickle.dumps(value, pickle.HIGHEST_PROTOCOL)
+        now = time.time()
+        ttl = self.ttls.get(kind, DEFAULT_TTL) if ttl is None else ttl
+        self._connect().execute(
+            "INSERT OR REPLACE INTO entries VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+            (kind, cache_key(inputs), cache_key(inputs), blob, len(blob), now, now + ttl, now))
+        self.evict()
+        return Entry(value, inputs, now)
+
+    def get_or_compute(self, kind, inputs, compute, ttl=None):
+        """(entry, hit): the cached entry, or a freshly computed and stored one"""
+        entry = self.get(kind, inputs)
+        if entry is not None:
+            return entry, True
+        return self.put(kind, inputs, compute(), ttl), False
+
+    def evict(self):
+        """Drop expired entries, then the least recently read beyond ``max_bytes``"""
+        conn = self._connect()
+        conn.execute("DELETE FROM entries WHERE expires <= ?", (time.time(),))
+        excess = conn.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()[0] - self.max_bytes
+        if excess <= 0:
+            return
+        doomed = []
+        for kind, key, size in conn.execute("SELECT kind, key, size FROM entries ORDER BY accessed"):
+            doomed.append((kind, key))
+            excess -= size
+            if excess <= 0:
+                break
+        conn.executemany("DELETE FROM entries WHERE kind = ? AND key = ?", doomed)
+
+    def latest(self):
+        """Kind -> (inputs, created) of the newest unexpired entry of each kind"""
+        rows = self._connect().execute(
+            "SELECT kind, inputs, MAX(created) FROM entries WHERE expires > ? GROUP BY kind", (time.time(),))
+        return {kind: (json.loads(inputs), created) for kind, inputs, created in rows}
+
+    def stats(self):
+        entries, size = self._connect().execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM entries").fetchone()
+        return {"entries": entries, "bytes": size, "hits": self.hits, "misses": self.misses}
+
+    def clear(self):
+        self._connect().execute("DELETE FROM entries")
+
+
+_cache = None
+_cache_lock = threading.Lock()
+
+
+def get_analysis_cache(path=ANALYSIS_CACHE):
+    """Process-wide analysis cache, opened on first use"""
+    global _cache
+    with _cache_lock:
+        if _cache is None or _cache.path != path:
+            _cache = AnalysisCache(path)
+        return _cache
@@ -0,0 +1,198 @@
+"""Online spike and changepoint detection over daily category counts
+
+:class:`Detector` keeps four numbers per category: an exponentially
+weighted mean and variance of its daily counts, and the two one-sided CUSUM
+sums of their z-scores. A tick (one new day for every category) is a handful
+of vectorized array operations, O(1) time and memory per category, and
+never looks at earlier days again.
+
+* spike: the day's count is more than ``SPIKE_Z`` standard deviations from
+  the running mean. Spikes are clipped before they update the mean and
+  variance, so one outlier does not mask the next.
+* changepoint: a CUSUM sum passes ``CUSUM_H``, i.e. counts have sat above
+  (or below) the running mean for a while. The mean is then reset to the
+  new level.
+
+:class:`TrendMonitor` feeds a detector from the trend store. Each call to
+:meth:`TrendMonitor.catch_up` consumes the days completed since the last
+one, and the detector state plus a bounded log of recent events are saved
+next to the store. Restarts resume where they stopped instead of
+re-scanning history.
+"""
+import os
+import threading
+from datetime import date, timedelta
+
+import numpy as np
+
+# Weight of the newest day in the running mean and variance (~4 week memory)
+ALPHA = 0.05
+# Days of history a category needs before it can raise events
+WARMUP = 28
+SPIKE_Z = 4.0
+# CUSUM allowance (in standard deviations) and decision threshold
+CUSUM_K = 0.5
+CUSUM_H = 10.0
+
+SPIKE, CHANGE_UP, CHANGE_DOWN = 1, 2, 3
+EVENT_LABELS = {
+    SPIKE: "⚡ Spike",
+    CHANGE_UP: "📈 Level shift up",
+    CHANGE_DOWN: "📉 Level shift down",
+}
+
+# Events kept in the monitor's log, newest last
+MAX_EVENTS = 5000
+
+STATE_FILE = "anomaly_state.npz"
+
+_EVENT_DTYPE = np.dtype([("day", np.int32), ("column", np.int32), ("kind", np.int8),
+                         ("z", np.float32), ("value", np.float32)])
+
+
+class Detector:
+    """Vectorized EWMA z-score and CUSUM state for a set of series"""
+
+    def __init__(self, n=0, alpha=ALPHA, warmup=WARMUP, spike_z=SPIKE_Z, cusum_k=CUSUM_K, cusum_h=CUSUM_H):
+        self.alpha, self.warmup, self.spike_z = alpha, warmup, spike_z
+        self.cusum_k, self.cusum_h = cusum_k, cusum_h
+        self.mean = np.zeros(n)
+        self.var = np.zeros(n)
+        self.up = np.zeros(n)
+        self.down = np.zeros(n)
+        self.seen = np.zeros(n, dtype=np.int64)
+
+    def __len__(self):
+        return len(self.mean)
+
+    def extend(self, n):
+        """Grow to ``n`` series; new ones start cold"""
+        extra = n - len(self)
+        if extra > 0:
+            for name in ("mean", "var", "up", "down", "seen"):
+                current = getattr(self, name)
+                setattr(self, name, np.concatenate([current, np.zeros(extra, dtype=current.dtype)]))
+
+    def update(self, x):
+        """Consume one value per series; returns (columns, kinds, z) of the events raised"""
+        x = np.asarray(x, dtype=np.float64)
+        first = self.seen == 0
+        self.mean[first] = x[first]
+        sd = np.sqrt(self.var) + 1e-9
+        z = (x - self.mean) / sd
+        armed = self.seen >= self.warmup
+
+        spike = armed & (np.abs(z) > self.spike_z)
+        clipped = np.clip(z, -self.spike_z, self.spike_z)
+        self.up = np.where(armed, np.maximum(self.up + clipped - self.cusum_k, 0), 0)
+        self.down = np.where(armed, np.maximum(self.down - clipped - self.cusum_k, 0), 0)
+        change_up = self.up > self.cusum_h
+        change_down = self.down > self.cusum_h
+
+        # Exponentially weighted mean/variance of the clipped value
+        diff = clipped * sd * armed + (x - self.mean) * ~armed
+        # Equal weights while warming up, so the early variance is not biased low
+        alpha = np.maximum(self.alpha, 1.0 / (self.seen + 1))
+        self.mean += alpha * diff
+        self.var = (1 - alpha) * (self.var + alpha * diff * diff)
+        shifted = change_up | change_down
+        if shifted.any():
+            self.mean[shifted] = x[shifted]
+            self.up[shifted] = self.down[shifted] = 0
+        self.seen += 1
+
+        kinds = np.select([change_up, change_down, spike], [CHANGE_UP, CHANGE_DOWN, SPIKE], 0)
+        columns = np.flatnonzero(kinds)
+        return columns, kinds[columns], z[columns]
+
+
+class TrendMonitor:
+    """A detector fed from a trend store, one completed day at a time"""
+
+    def __init__(self, store):
+        self.store = store
+        self.state_path = os.path.join(store.path, STATE_FILE)
+        self.categories = []
+        self.detector = Detector()
+        self.last_day = None  # last day consumed
+        self.events = np.zeros(0, dtype=_EVENT_DTYPE)
+        self._lock = threading.Lock()
+        self._load()
+
+    def _load(self):
+        if not os.path.exists(self.state_path):
+            return
+        with np.load(self.state_path, allow_pickle=False) as state:
+            self.categories = state["categories"].tolist()
+            for name in ("mean", "var", "up", "down", "seen"):
+                setattr(self.detector, name, state[name])
+            self.last_day = date.fromordinal(int(state["last_day"]))
+            self.events = state["events"]
+
+    def _save(self):
+        tmp = self.state_path + ".tmp.npz"
+        d = self.detector
+        np.savez(tmp, categories=np.array(self.categories, dtype=str), mean=d.mean, var=d.var, up=d.up,
+                 down=d.down, seen=d.seen, last_day=self.last_day.toordinal(), events=self.events)
+        os.replace(tmp, self.state_path)
+
+    def catch_up(self):
+        """Consume every completed day since the last call; returns the number of days consumed"""
+        with self._lock:
+            store = self.store
+            store.refresh()
+            if store.end is None:
+                return 0
+            # The store's last day may still be receiving counts
+            through = store.end - timedelta(days=1)
+            start = store.start if self.last_day is None else max(self.last_day + timedelta(days=1), store.start)
+            if start > through:
+                return 0
+            known = set(self.categories)
+            self.categories += [c for c in store.categories if c not in known]
+            self.detector.extend(len(self.categories))
+            columns = {c: i for i, c in enumerate(store.categories)}
+            order = np.array([columns.get(c, -1) for c in self.categories])
+            rows = store.window(start, through)
+            logged = []
+            for offset, row in enumerate(rows):
+                counts = np.where(order >= 0, row[np.maximum(order, 0)], 0.0)
+                columns, kinds, z = self.detector.update(counts)
+                if len(columns):
+                    event = np.zeros(len(columns), dtype=_EVENT_DTYPE)
+                    event["day"] = start.toordinal() + offset
+                    event["column"], event["kind"], event["z"] = columns, kinds, z
+                    event["value"] = counts[columns]
+                    logged.append(event)
+            self.events = np.concatenate([self.events] + logged)[-MAX_EVENTS:]
+            self.last_day = start + timedelta(days=len(rows) - 1)
+            self._save()
+            return len(rows)
+
+    def recent(self, categories, since=None):
+        """Event dicts for ``categories`` on or after ``since``, newest first"""
+        with self._lock:
+            known = {c: i for i, c in enumerate(self.categories)}
+            wanted = {known[c]: c for c in categories if c in known}
+            events = self.events[np.isin(self.events["column"], list(wanted))]
+            if since is not None:
+                events = events[events["day"] >= since.toordinal()]
+        return [
+            {"category": wanted[int(e["column"])], "date": date.fromordinal(int(e["day"])),
+             "kind": EVENT_LABELS[int(e["kind"])], "z": float(e["z"]), "value": float(e["value"])}
+            for e in events[::-1]
+        ]
+
+
+_monitors = {}
+_monitors_lock = threading.Lock()
+
+
+def get_monitor(store):
+    """Process-wide monitor of a trend store, caught up to its last completed day"""
+    with _monitors_lock:
+        monitor = _monitors.get(store.path)
+        if monitor is None or monitor.store is not store:
+            monitor = _monitors[store.path] = TrendMonitor(store)
+    monitor.catch_up()
+    return monitor
@@ -0,0 +1,353 @@
+"""Headless access to the search, trend, pattern and forecast engines
+
+The same handlers back a JSONL batch CLI and a small local HTTP API, and
+both go through the engines and process-wide caches the app uses.
+
+    python -m stem_intel.batch search < queries.jsonl > results.jsonl
+    python -m stem_intel.batch trends --input requests.jsonl --chunk 500
+    python -m stem_intel.batch serve --port 8765
+
+Batch input is one JSON object per line (search also accepts a bare query
+per line, and a ``cursor`` with an optional ``page_size`` asks for one page
+of the full ranking plus its summary and ``next_cursor``; the ranking is the
+Search page's shared, cached result set). Requests are answered one at a
+time; ``--chunk`` only sets how many lines are read ahead before the output
+is flushed and throughput is reported on stderr. Failed lines produce an
+``{"error": ...}`` line instead of stopping the run.
+
+The HTTP API answers ``POST /search``, ``/trends``, ``/patterns`` and
+``/forecast`` with a JSON object (or a list of them) as the body, plus
+``GET /health`` and ``GET /metrics`` (Prometheus text). Requests of a list
+body that fail get an ``{"error": ...}`` object in their place. Bodies over
+``MAX_BODY_BYTES`` are refused.
+"""
+import argparse
+import itertools
+import json
+import sys
+import threading
+import time
+from datetime import date, datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import numpy as np
+
+from .aggregates import PATTERN_CHARTS, TIME_PERIODS, AggregateStore, pattern_table
+from .config import AGGREGATE_DIR, INDEX_DIR
+from .index import SearchIndex
+from .metrics import RECORDER, span
+from .patterns import extract_patterns_batch
+from .search import DEFAULT_TOP_K, PAGE_SIZE, search_news, shared_results
+from .trends import FORECAST_MONTHS, get_trend_store, shared_trend_data, trend_categories, trend_forecast
+
+CHUNK_SIZE = 1000
+
+DEFAULT_PORT = 8765
+MAX_BODY_BYTES = 16 * 2 ** 20
+
+
+class RequestError(ValueError):
+    """A malformed request; reported back instead of raised"""
+
+
+def _default(value):
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, np.generic):
+        return value.item()
+    if isinstance(value, np.ndarray):
+        return value.tolist()
+    raise TypeError(f"{type(value).__name__} is not JSON serializable")
+
+
+def dumps(value):
+    return json.dumps(value, default=_default, ensure_ascii=False)
+
+
+class Engines:
+    """Lazily opened engines shared by every request of the process"""
+
+    def __init__(self, index_dir=INDEX_DIR, aggregate_dir=AGGREGATE_DIR):
+        self.index_dir = index_dir
+        self.aggregate_dir = aggregate_dir
+        self._index = None
+        self._aggregates = None
+        self._lock = threading.Lock()
+
+    def search_index(self):
+        with self._lock:
+            if self._index is None:
+                if not SearchIndex.exists(self.index_dir):
+                    raise RequestError(f"no search index at {self.index_dir}; run python -m stem_intel.ingest")
+                self._index = SearchIndex(self.index_dir)
+            else:
+                self._index.refresh()
+            return self._index
+
+    def aggregates(self):
+        with self._lock:
+            if self._aggregates is None:
+                self._aggregates = AggregateStore(self.aggregate_dir)
+            else:
+                self._aggregates.refresh()
+            return self._aggregates
+
+
+def _categories(request, store):
+    categories = request.get("categories") or trend_categories(store)
+    if isinstance(categories, str):
+        categories = [categories]
+    if not isinstance(categories, list) or not all(isinstance(c, str) and c for c in categories):
+        raise RequestError("categories must be a category name or a list of them")
+    return categories
+
+
+def _integer(request, name, default, minimum=1):
+    """``request[name]`` as an int of at least ``minimum``"""
+    value = request.get(name, default)
+    if isinstance(value, bool) or not isinstance(value, (int, float, str)):
+        raise RequestError(f"{name} must be an integer")
+    try:
+        value = int(value)
+    except (OverflowError, ValueError):
+        raise RequestError(f"{name} must be an integer") from None
+    if value < minimum:
+        raise RequestError(f"{name} must be at least {minimum}")
+    return value
+
+
+def _timeframe(request, default=12):
+    return _integer(request, "timeframe", default)
+
+
+def _text(request, name, default):
+    value = request.get(name, default)
+    if not isinstance(value, str) or not value.strip():
+        raise RequestError(f"{name} must be a non-empty string")
+    return value
+
+
+def handle_search(request, engines):
+    query = _text(request, "query", None)
+    category = _text(request, "category", "All")
+    if "cursor" not in request:
+        results = search_news(engines.search_index(), query, category, _integer(request, "k", DEFAULT_TOP_K))
+        return {"query": query, "category": category, "results": results}
+    # Paged: the Search page's shared result set, ranked once per index version; read only the page asked for
+    cursor = _integer(request, "cursor", 0, minimum=0)
+    page_size = _integer(request, "page_size", PAGE_SIZE)
+    handle = shared_results(engines.search_index(), query, category)
+    try:
+        result_set = handle.get()
+        rows, next_cursor = result_set.page(cursor, page_size)
+        response = {"query": query, "category": category, "summary": result_set.summary(),
+                    "results": rows, "next_cursor": next_cursor}
+    finally:
+        handle.release()
+    return response
+
+
+def handle_trends(request, engines):
+    store = get_trend_store()
+    categories = _categories(request, store)
+    timeframe = _timeframe(request)
+    handle = shared_trend_data(categories, timeframe, store)
+    try:
+        matrix = handle.get()
+        patterns = extract_patterns_batch(matrix.frame(), categories, matrix.stats)
+        response = {"timeframe": timeframe, "start": matrix.start.date(), "days": len(matrix),
+                    "patterns": patterns.to_dict(orient="index")}
+        if request.get("series"):
+            response["series"] = {c: matrix[c] for c in categories}
+    finally:
+        handle.release()
+    return response
+
+
+def handle_patterns(request, engines):
+    analysis_type = request.get("analysis_type", "Publication Volume")
+    time_period = request.get("time_period", "Last year")
+    if analysis_type not in PATTERN_CHARTS:
+        raise RequestError(f"analysis_type must be one of {', '.join(PATTERN_CHARTS)}")
+    if time_period not in TIME_PERIODS:
+        raise RequestError(f"time_period must be one of {', '.join(TIME_PERIODS)}")
+    table = pattern_table(engines.aggregates(), analysis_type, time_period)
+    return {"analysis_type": analysis_type, "time_period": time_period, "rows": table.to_dict(orient="records")}
+
+
+def handle_forecast(request, engines):
+    store = get_trend_store()
+    categories = _categories(request, store)
+    months = _integer(request, "months", FORECAST_MONTHS)
+    forecast = trend_forecast(categories, _timeframe(request), months, store)
+    return {"months": months, "rows": forecast.to_dict(orient="records")}
+
+
+HANDLERS = {
+    "search": handle_search,
+    "trends": handle_trends,
+    "patterns": handle_patterns,
+    "forecast": handle_forecast,
+}
+
+
+def run(op, request, engines):
+    """Answer one request dict with the ``op`` handler, recorded as a span"""
+    if not isinstance(request, dict):
+        raise RequestError("each request must be a JSON object")
+    with span(op, kind="request"):
+        return HANDLERS[op](request, engines)
+
+
+def _error(exc):
+    # Malformed requests explain themselves; anything else names the exception as well
+    return str(exc) if isinstance(exc, RequestError) else f"{type(exc).__name__}: {exc}"
+
+
+def answer(op, request, engines):
+    """(response, failed): the handler's response, or an ``{"error": ...}`` row if it raised"""
+    try:
+        return run(op, request, engines), False
+    except Exception as exc:
+        return {"error": _error(exc)}, True
+
+
+def _parse(op, line):
+    line = line.strip()
+    if op == "search" and not line.startswith("{"):
+        return {"query": line}
+    try:
+        return json.loads(line)
+    except json.JSONDecodeError as exc:
+        raise RequestError(f"invalid JSON: {exc.msg}") from None
+
+
+def run_batch(op, lines, out, engines, chunk_size=CHUNK_SIZE, log=sys.stderr):
+    """Answer JSONL ``lines`` in order, flushing and logging every chunk; returns (requests, errors, seconds)"""
+    lines = (line for line in lines if line.strip())
+    done = errors = 0
+    start = time.perf_counter()
+    while True:
+        chunk = list(itertools.islice(lines, chunk_size))
+        if not chunk:
+            break
+        for line in chunk:
+            try:
+                response, failed = answer(op, _parse(op, line), engines)
+            except RequestError as exc:
+                response, failed = {"error": str(exc)}, True
+            if failed:
+                errors += 1
+                response["line"] = done + 1
+            out.write(dumps(response) + "\n")
+            done += 1
+        out.flush()
+        if log is not None:
+            elapsed = time.perf_counter() - start
+            print(f"{done:,} requests, {done / max(elapsed, 1e-9):,.0f}/s, {errors:,} errors", file=log)
+    return done, errors, time.perf_counter() - start
+
+
+class ApiHandler(BaseHTTPRequestHandler):
+    """JSON over HTTP for the batch handlers"""
+
+    engines = None
+    server_version = "STEMIntel/1.0"
+
+    def _send(self, status, body, content_type="application/json"):
+        data = body.encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def do_GET(self):
+        if self.path == "/health":
+            self._send(200, dumps({"status": "ok", "uptime_seconds": round(RECORDER.uptime(), 1)}))
+        elif self.path == "/metrics":
+            self._send(200, RECORDER.prometheus_text(), "text/plain; version=0.0.4")
+        else:
+            self._send(404, dumps({"error": f"unknown path {self.path}"}))
+
+    def do_POST(self):
+        op = self.path.strip("/")
+        if op not in HANDLERS:
+            self._send(404, dumps({"error": f"unknown operation {op!r}; use one of {', '.join(HANDLERS)}"}))
+            return
+        try:
+            length = int(self.headers.get("Content-Length") or 0)
+        except ValueError:
+            length = -1
+        if not 0 <= length <= MAX_BODY_BYTES:
+            # rfile.read(-1) would block until the client hangs up
+            self._send(400, dumps({"error": f"Content-Length must be between 0 and {MAX_BODY_BYTES}"}))
+            return
+        try:
+            body = json.loads(self.rfile.read(length) or b"{}")
+        except ValueError as exc:
+            # Undecodable bodies as well as invalid JSON
+            self._send(400, dumps({"error": f"invalid JSON: {getattr(exc, 'msg', exc)}"}))
+            return
+        if isinstance(body, list):
+            # Failed requests of a list answer with an error row in their place
+            self._send(200, dumps([answer(op, request, self.engines)[0] for request in body]))
+            return
+        try:
+            self._send(200, dumps(run(op, body, self.engines)))
+        except RequestError as exc:
+            self._send(400, dumps({"error": str(exc)}))
+        except Exception as exc:
+            self._send(500, dumps({"error": _error(exc)}))
+
+    def log_message(self, format, *args):
+        pass
+
+
+def serve(host="127.0.0.1", port=DEFAULT_PORT, engines=None):
+    """Serve the HTTP API until interrupted"""
+    handler = type("Handler", (ApiHandler,), {"engines": engines or Engines()})
+    server = ThreadingHTTPServer((host, port), handler)
+    print(f"Serving {', '.join('/' + op for op in HANDLERS)} on http://{host}:{server.server_port}", file=sys.stderr)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Headless STEM intelligence batch jobs and HTTP API")
+    parser.add_argument("op", choices=list(HANDLERS) + ["serve"])
+    parser.add_argument("--input", default="-", help="JSONL requests, - for stdin (default: %(default)s)")
+    parser.add_argument("--output", default="-", help="JSONL responses, - for stdout (default: %(default)s)")
+    parser.add_argument("--chunk", type=int, default=CHUNK_SIZE, help="lines per chunk (default: %(default)s)")
+    parser.add_argument("--index", default=INDEX_DIR, help="index directory (default: %(default)s)")
+    parser.add_argument("--aggregates", default=AGGREGATE_DIR,
+                        help="Track Patterns aggregate directory (default: %(default)s)")
+    parser.add_argument("--host", default="127.0.0.1", help="serve: bind address (default: %(default)s)")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT, help="serve: port (default: %(default)s)")
+    parser.add_argument("--quiet", action="store_true", help="no per-chunk throughput on stderr")
+    args = parser.parse_args(argv)
+
+    engines = Engines(args.index, args.aggregates)
+    if args.op == "serve":
+        serve(args.host, args.port, engines)
+        return
+
+    src = sys.stdin if args.input == "-" else open(args.input, encoding="utf-8")
+    out = sys.stdout if args.output == "-" else open(args.output, "w", encoding="utf-8")
+    try:
+        done, errors, elapsed = run_batch(args.op, src, out, engines, args.chunk, None if args.quiet else sys.stderr)
+    finally:
+        if src is not sys.stdin:
+            src.close()
+        if out is not sys.stdout:
+            out.close()
+    print(f"{args.op}: {done:,} requests in {elapsed:.1f}s ({done / max(elapsed, 1e-9):,.0f}/s), "
+          f"{errors:,} errors", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
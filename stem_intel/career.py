@@ -0,0 +1,135 @@
+"""Career report generation from field templates loaded once per process
+
+Field descriptions live in a JSON catalog (``career_fields.json`` next to
+this module, or ``STEM_CAREER_FIELDS``) that is parsed on first use and kept
+until the file's mtime changes, so a catalog of thousands of fields costs one
+stat and one dict lookup per report. The narrative is a
+:class:`string.Template` compiled at import, and the challenge and goal
+paragraphs are fixed tuples.
+
+Reports are memoized on the normalized profile: research area, career level
+and the sorted, de-duplicated challenges and goals, plus the catalog's
+mtime. Identical profiles, in whatever order their options were picked, are
+served from the cache until the catalog is edited. Interests are filled into
+the cached report per call, in the order the user picked them.
+"""
+import functools
+import json
+import os
+from string import Template
+
+CAREER_FIELDS = os.environ.get(
+    "STEM_CAREER_FIELDS", os.path.join(os.path.dirname(os.path.abspath(__file__)), "career_fields.json"))
+
+# Field used for areas missing from the catalog
+DEFAULT_FIELD = "Data Science"
+
+REPORT_CACHE_SIZE = 4096
+
+REPORT = Template("""\
+## 🎯 Personalized STEM Career Analysis for $career_level
+
+### 📋 Your Profile Summary
+Based on your inputs, you are a **$career_level** professional interested in **$research_area** with specific focus on **$interests**.
+
+### 🔍 Field Overview: $research_area
+$overview
+
+### 📈 Current Trends & Developments
+$trends
+
+### 🚀 Career Opportunities
+$opportunities
+
+### 🎓 Recommended Skills Development
+$skills
+
+### 💡 Addressing Your Challenges
+$challenges
+
+### 🎯 Strategic Recommendations Based on Your Goals
+$goals
+""")
+
+# (option, paragraph) in report order
+CHALLENGE_ADVICE = (
+    ("Lack of Experience", "- **Experience Gap**: Consider contributing to open-source projects, pursuing internships, or building a portfolio of personal projects to demonstrate your capabilities."),
+    ("Keeping Up with Technology", "- **Technology Updates**: Follow industry leaders on social media, subscribe to relevant newsletters, and join professional communities in your field."),
+    ("Finding Opportunities", "- **Opportunity Discovery**: Leverage LinkedIn, attend virtual conferences, join professional associations, and network with industry professionals."),
+    ("Skill Development", "- **Skill Enhancement**: Create a structured learning plan, utilize online platforms like Coursera or edX, and seek mentorship from experienced professionals."),
+)
+
+GOAL_ADVICE = (
+    ("Career Transition", "- **Transition Strategy**: Develop a 6-12 month transition plan, identify transferable skills, and consider bridge roles that combine your current expertise with your target field."),
+    ("Skill Enhancement", "- **Learning Path**: Focus on both technical and soft skills, pursue relevant certifications, and practice through hands-on projects."),
+    ("Research Opportunities", "- **Research Direction**: Identify active research groups, consider graduate studies or research collaborations, and stay updated with latest publications in your area of interest."),
+    ("Industry Networking", "- **Networking Strategy**: Attend industry events, join professional societies, engage in online communities, and consider informational interviews with industry leaders."),
+)
+
+
+def catalog_version(path=CAREER_FIELDS):
+    """Changes whenever the field catalog file is rewritten"""
+    return os.stat(path).st_mtime_ns
+
+
+@functools.lru_cache(maxsize=16)
+def _parse_fields(path, version):
+    with open(path, encoding="utf-8") as fh:
+        return json.load(fh)
+
+
+def load_fields(path=CAREER_FIELDS):
+    """Field name -> template sections, re-parsed when the file changes"""
+    return _parse_fields(path, catalog_version(path))
+
+
+def _stripped(values):
+    return [v.strip() for v in values or () if v and v.strip()]
+
+
+def normalize_profile(research_area, career_level, interests, challenges, goals):
+    """Hashable cache key: stripped names and sorted, de-duplicated selections"""
+    def options(values):
+        return tuple(sorted(set(_stripped(values))))
+
+    return research_area.strip(), career_level.strip(), options(interests), options(challenges), options(goals)
+
+
+def ordered_interests(interests):
+    """Interests as a report lists them: stripped and de-duplicated, in the order they were picked"""
+    return tuple(dict.fromkeys(_stripped(interests)))
+
+
+# Stands in for the interests in cached reports, so one entry serves every order they can be picked in
+_INTERESTS = "\x00interests\x00"
+
+
+def _advice(selected, catalog):
+    return "\n".join(text for option, text in catalog if option in selected)
+
+
+@functools.lru_cache(maxsize=REPORT_CACHE_SIZE)
+def _report(research_area, career_level, challenges, goals, version):
+    fields = _parse_fields(CAREER_FIELDS, version)
+    field = fields.get(research_area) or fields[DEFAULT_FIELD]
+    return REPORT.substitute(
+        field,
+        research_area=research_area,
+        career_level=career_level,
+        interests=_INTERESTS,
+        challenges=_advice(challenges, CHALLENGE_ADVICE),
+        goals=_advice(goals, GOAL_ADVICE),
+    )
+
+
+def career_report(research_area, career_level, interests=(), challenges=(), goals=()):
+    """Markdown career report for a profile, memoized on its normalized form and the catalog version"""
+    research_area, career_level, _, challenges, goals = normalize_profile(
+        research_area, career_level, interests, challenges, goals)
+    interests = ordered_interests(interests)
+    return _report(research_area, career_level, challenges, goals, catalog_version()).replace(
+        _INTERESTS, ", ".join(interests) if interests else "general applications")
+
+
+def cache_info():
+    return _report.cache_info()
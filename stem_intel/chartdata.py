@@ -0,0 +1,126 @@
+"""Chart-ready trend data: daily/weekly/monthly rollups plus LTTB downsampling
+
+A :class:`Pyramid` holds the daily means of a block of series together with
+weekly (Monday-based) and calendar-month rollups, all computed in one pass
+from prefix sums. A chart asks for a date range and a point budget: the
+finest level that is not far above the budget is picked, and
+Largest-Triangle-Three-Buckets then thins it to the budget while keeping the
+peaks and troughs a plain stride would drop. The browser payload is bounded
+by the budget no matter how long the range is.
+"""
+import numpy as np
+import pandas as pd
+
+# Points sent to a chart; roughly its width in pixels
+CHART_POINTS = 1000
+
+# A level is used as-is up to this many times the budget before LTTB thins it
+OVERSAMPLE = 4
+
+LEVELS = ("D", "W", "M")
+
+_MONDAY = np.datetime64("1970-01-05", "D")
+
+
+def period_starts(days, freq):
+    """First day of the week ("W") or month ("M") containing each day"""
+    days = np.asarray(days, dtype="datetime64[D]")
+    if freq == "D":
+        return days
+    if freq == "W":
+        return _MONDAY + ((days - _MONDAY).astype(np.int64) // 7) * 7
+    return days.astype("datetime64[M]").astype("datetime64[D]")
+
+
+def rollup(days, values, freq):
+    """Per-period means of a (days x columns) block of consecutive days
+
+    Returns (period_start_days, means). Partial periods at either end average
+    only the days they contain.
+    """
+    starts = period_starts(days, freq)
+    if not len(starts):
+        return starts, np.zeros((0,) + np.shape(values)[1:])
+    bounds = np.flatnonzero(np.r_[True, starts[1:] != starts[:-1]])
+    cum = np.zeros((len(starts) + 1,) + np.shape(values)[1:])
+    np.cumsum(values, axis=0, out=cum[1:])
+    ends = np.r_[bounds[1:], len(starts)]
+    sizes = (ends - bounds).reshape((-1,) + (1,) * (cum.ndim - 1))
+    return starts[bounds], (cum[ends] - cum[bounds]) / sizes
+
+
+def lttb(y, n_out, x=None):
+    """Indices of the ``n_out`` points Largest-Triangle-Three-Buckets keeps
+
+    The first and last points are always kept. Every bucket in between
+    contributes the point forming the largest triangle with the previously
+    kept point and the mean of the next bucket.
+    """
+    y = np.asarray(y, dtype=np.float64)
+    n = len(y)
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+    x = np.arange(n, dtype=np.float64) if x is None else np.asarray(x, dtype=np.float64)
+
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.int64)
+    # Mean of each bucket (the final point is its own last "bucket")
+    next_lo = edges[1:]
+    next_hi = np.r_[edges[2:], n]
+    cx, cy = np.r_[0.0, np.cumsum(x)], np.r_[0.0, np.cumsum(y)]
+    avg_x = (cx[next_hi] - cx[next_lo]) / (next_hi - next_lo)
+    avg_y = (cy[next_hi] - cy[next_lo]) / (next_hi - next_lo)
+
+    keep = np.empty(n_out, dtype=np.int64)
+    keep[0], keep[-1] = 0, n - 1
+    a = 0
+    for i in range(n_out - 2):
+        lo, hi = edges[i], edges[i + 1]
+        area = np.abs((x[a] - avg_x[i]) * (y[lo:hi] - y[a]) - (x[a] - x[lo:hi]) * (avg_y[i] - y[a]))
+        a = lo + int(area.argmax())
+        keep[i + 1] = a
+    return keep
+
+
+def choose_level(start, end, budget=CHART_POINTS):
+    """Finest level with at most ``OVERSAMPLE * budget`` points between two days"""
+    n_days = int((np.datetime64(end, "D") - np.datetime64(start, "D")).astype(np.int64)) + 1
+    for freq, days_per_point in zip(LEVELS, (1, 7, 30.4)):
+        if n_days / days_per_point <= OVERSAMPLE * budget:
+            return freq
+    return LEVELS[-1]
+
+
+def downsample(frame, budget=CHART_POINTS):
+    """Rows of ``frame`` kept by per-column LTTB, at most ``budget`` in total
+
+    Each column gets an equal share of the budget; the union of the kept rows
+    is returned so every column stays aligned on the same dates.
+    """
+    if len(frame) <= budget or not len(frame.columns):
+        return frame
+    share = max(budget // len(frame.columns), 3)
+    x = frame.index.to_numpy(dtype="datetime64[D]").astype(np.float64) \
+        if isinstance(frame.index, pd.DatetimeIndex) else None
+    rows = np.unique(np.concatenate([lttb(frame[c].to_numpy(), share, x) for c in frame.columns]))
+    return frame.iloc[rows]
+
+
+class Pyramid:
+    """Daily, weekly and monthly means of a block of daily series"""
+
+    def __init__(self, start, values, columns):
+        values = np.asarray(values, dtype=np.float64)
+        days = np.datetime64(start, "D") + np.arange(len(values))
+        self.columns = list(columns)
+        self.levels = {"D": (days, values)}
+        for freq in LEVELS[1:]:
+            self.levels[freq] = rollup(days, values, freq)
+
+    def level(self, freq, start=None, end=None, columns=None):
+        """One level as a DataFrame indexed by period start, clipped to a date range"""
+        days, values = self.levels[freq]
+        lo = 0 if start is None else np.searchsorted(days, period_starts([np.datetime64(start, "D")], freq)[0])
+        hi = len(days) if end is None else np.searchsorted(days, np.datetime64(end, "D"), side="right")
+        cols = [self.columns.index(c) for c in columns] if columns is not None else slice(None)
+        return pd.DataFrame(values[lo:hi][:, cols], index=pd.DatetimeIndex(days[lo:hi], name="Date"),
+                            columns=list(columns) if columns is not None else self.columns)
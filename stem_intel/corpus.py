@@ -0,0 +1,203 @@
+"""Loading and normalizing local article dumps (JSONL, RSS and Atom)"""
+import glob
+import hashlib
+import json
+import os
+import re
+import xml.etree.ElementTree as ET
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+
+import numpy as np
+
+TOKEN_RE = re.compile(r"[a-z0-9]+")
+TAG_RE = re.compile(r"<[^>]+>")
+
+STOPWORDS = frozenset("""
+a an and are as at be been but by for from has have in into is it its of on or
+that the their this to was were will with which who what when where how than
+then there these those such not no can could would should may might also about
+over after before more most new says said
+""".split())
+
+# Fields that make up the searchable text of an article
+TEXT_FIELDS = ("title", "summary", "body")
+
+ATOM_NS = "{http://www.w3.org/2005/Atom}"
+
+
+def tokenize(text):
+    """Lowercase word tokens with stopwords removed"""
+    return [t for t in TOKEN_RE.findall(text.lower()) if t not in STOPWORDS]
+
+
+def article_text(article):
+    """All searchable text of an article as one string"""
+    return " ".join(article.get(field) or "" for field in TEXT_FIELDS)
+
+
+class TokenBatch:
+    """Raw word tokens of a batch of texts, flattened and interned once
+
+    Batch scorers (near-duplicate hashing, sentiment) share one instance so
+    each article is tokenized a single time. ``vocab`` holds the distinct
+    tokens of the batch, ``inverse`` maps every token position to its vocab
+    entry, and ``doc_of`` maps it to the text it came from.
+    """
+
+    def __init__(self, texts):
+        docs = [TOKEN_RE.findall(text.lower()) for text in texts]
+        self.n_docs = len(docs)
+        self.counts = np.array([len(d) for d in docs], dtype=np.int64)
+        self.ends = np.cumsum(self.counts)
+        self.doc_of = np.repeat(np.arange(self.n_docs), self.counts)
+        flat = [token for doc in docs for token in doc]
+        if flat:
+            self.vocab, self.inverse = np.unique(np.array(flat), return_inverse=True)
+        else:
+            self.vocab, self.inverse = np.array([], dtype=str), np.zeros(0, dtype=np.int64)
+
+    def __len__(self):
+        return len(self.inverse)
+
+
+def batched(items, size):
+    """Lists of up to ``size`` consecutive items of an iterable, e.g. TokenBatch inputs"""
+    batch = []
+    for item in items:
+        batch.append(item)
+        if len(batch) >= size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def clean_text(text):
+    """Strip markup and collapse whitespace from feed text"""
+    return " ".join(TAG_RE.sub(" ", text or "").split())
+
+
+def parse_date(value):
+    """Parse ISO-8601 or RFC-822 dates into naive UTC datetimes"""
+    if not value:
+        return None
+    if isinstance(value, datetime):
+        parsed = value
+    else:
+        value = value.strip()
+        try:
+            parsed = datetime.fromisoformat(value.replace("Z", "+00:00"))
+        except ValueError:
+            try:
+                parsed = parsedate_to_datetime(value)
+            except (TypeError, ValueError):
+                return None
+    if parsed.tzinfo is not None:
+        parsed = parsed.astimezone(timezone.utc).replace(tzinfo=None)
+    return parsed
+
+
+def normalize_article(raw, default_category="General"):
+    """Map a raw record onto the article schema used by the index"""
+    title = clean_text(raw.get("title"))
+    summary = clean_text(raw.get("summary") or raw.get("description"))
+    body = clean_text(raw.get("body") or raw.get("content"))
+    if not (title or summary or body):
+        return None
+
+    published = parse_date(raw.get("published") or raw.get("date"))
+    url = (raw.get("url") or raw.get("link") or "").strip()
+    article_id = raw.get("id") or hashlib.sha1((url or title + summary).encode("utf-8")).hexdigest()[:16]
+
+    return {
+        "id": str(article_id),
+        "title": title,
+        "summary": summary,
+        "body": body,
+        "url": url,
+        "source": raw.get("source") or "",
+        "category": raw.get("category") or default_category,
+        "published": published.isoformat() if published else None,
+        "key_insights": [clean_text(str(insight)) for insight in raw.get("key_insights") or []],
+    }
+
+
+def _iter_jsonl(path):
+    with open(path, encoding="utf-8") as fh:
+        for line in fh:
+            line = line.strip()
+            if line:
+                yield json.loads(line)
+
+
+def _child_text(elem, *names):
+    for name in names:
+        child = elem.find(name)
+        if child is not None and child.text:
+            return child.text
+    return None
+
+
+def feed_item_to_raw(elem, source=""):
+    """Convert an RSS <item> or Atom <entry> element into a raw record"""
+    if elem.tag == "item":
+        return {
+            "title": _child_text(elem, "title"),
+            "summary": _child_text(elem, "description"),
+            "body": _child_text(elem, "{http://purl.org/rss/1.0/modules/content/}encoded"),
+            "url": _child_text(elem, "link"),
+            "id": _child_text(elem, "guid"),
+            "published": _child_text(elem, "pubDate", "{http://purl.org/dc/elements/1.1/}date"),
+            "category": _child_text(elem, "category"),
+            "source": source,
+        }
+
+    link = elem.find(ATOM_NS + "link")
+    category = elem.find(ATOM_NS + "category")
+    return {
+        "title": _child_text(elem, ATOM_NS + "title"),
+        "summary": _child_text(elem, ATOM_NS + "summary"),
+        "body": _child_text(elem, ATOM_NS + "content"),
+        "url": link.get("href") if link is not None else None,
+        "id": _child_text(elem, ATOM_NS + "id"),
+        "published": _child_text(elem, ATOM_NS + "published", ATOM_NS + "updated"),
+        "category": category.get("term") if category is not None else None,
+        "source": source,
+    }
+
+
+def _iter_feed_xml(path):
+    source = os.path.splitext(os.path.basename(path))[0]
+    # iterparse keeps memory flat on large dumps: each item is cleared once read
+    for _, elem in ET.iterparse(path, events=("end",)):
+        if elem.tag in ("item", ATOM_NS + "entry"):
+            yield feed_item_to_raw(elem, source)
+            elem.clear()
+
+
+def iter_articles(paths, default_category="General"):
+    """Yield normalized articles from JSONL, RSS or Atom files and directories"""
+    for path in expand_paths(paths):
+        if path.endswith((".jsonl", ".json")):
+            records = _iter_jsonl(path)
+        else:
+            records = _iter_feed_xml(path)
+        for raw in records:
+            article = normalize_article(raw, default_category)
+            if article:
+                yield article
+
+
+def expand_paths(paths):
+    """Expand directories and globs into a sorted list of corpus files"""
+    if isinstance(paths, str):
+        paths = [paths]
+    files = []
+    for path in paths:
+        if os.path.isdir(path):
+            for ext in ("*.jsonl", "*.json", "*.xml", "*.rss", "*.atom"):
+                files.extend(glob.glob(os.path.join(path, ext)))
+        else:
+            files.extend(glob.glob(path) or [path])
+    return sorted(set(files))
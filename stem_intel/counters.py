@@ -0,0 +1,190 @@
+"""Running counters behind the Home page metric cards
+
+Each counter keeps its lifetime total together with the counts of the two
+most recent calendar months it has seen, which is all a "+12% this month"
+card needs. Adding to a counter and reading a card are both O(1) however
+many articles have been ingested: the whole store is one small JSON file
+that the app re-reads only when its mtime changes.
+
+Corpus counters are written by ingestion (and reset with ``--rebuild``);
+usage counters such as generated scenarios live in a separate file written
+by the app, so the two kinds of writer never race on the same file.
+
+    python -m stem_intel.counters --rebuild    # backfill corpus counters from the search index
+"""
+import argparse
+import json
+import os
+import threading
+from collections import Counter
+from datetime import date
+
+import numpy as np
+
+from .aggregates import FUNDING_TERMS, mentions, month_index
+from .config import CORPUS_COUNTERS, INDEX_DIR
+from .index import MENTION_FUNDING, MENTION_INNOVATION, MENTION_RESEARCH
+
+# Tokens marking an article as reporting on published research
+RESEARCH_TERMS = frozenset("""
+study studies paper papers journal journals preprint preprints researchers findings
+trial trials peer reviewed published publishes
+""".split())
+
+# Tokens marking an article as reporting a new technology or product
+INNOVATION_TERMS = frozenset("""
+breakthrough breakthroughs unveils unveiled launches launched prototype prototypes
+patent patents startup startups invented invention first record
+""".split())
+
+
+def month_label(month):
+    """``May 2025`` for a month index from :func:`month_index`"""
+    return date(month // 12, month % 12 + 1, 1).strftime("%b %Y")
+
+
+class CounterStore:
+    """Named counters with a lifetime total and the latest two months"""
+
+    def __init__(self, path=CORPUS_COUNTERS):
+        self.path = path
+        self.counters = {}
+        self._mtime = None
+        # Serializes read-modify-write increments from concurrent app sessions
+        self._lock = threading.Lock()
+        self.refresh()
+
+    def refresh(self):
+        """Reload if another process saved newer counters"""
+        if not os.path.exists(self.path) or os.path.getmtime(self.path) == self._mtime:
+            return False
+        mtime = os.path.getmtime(self.path)
+        with open(self.path, encoding="utf-8") as fh:
+            self.counters = json.load(fh)
+        self._mtime = mtime
+        return True
+
+    def add(self, name, published=None, n=1):
+        """Count ``n`` events in the month of ``published`` (today when missing)"""
+        month = month_index(published)
+        total, latest, this, previous = self.counters.get(name, (0, month, 0, 0))
+        total += n
+        if month > latest:
+            previous = this if month == latest + 1 else 0
+            latest, this = month, n
+        elif month == latest:
+            this += n
+        elif month == latest - 1:
+            previous += n
+        self.counters[name] = [total, latest, this, previous]
+
+    def save(self):
+        os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        tmp = f"{self.path}.{os.getpid()}.tmp"
+        with open(tmp, "w", encoding="utf-8") as fh:
+            json.dump(self.counters, fh)
+        os.replace(tmp, self.path)
+        self._mtime = os.path.getmtime(self.path)
+
+    def increment(self, name, n=1):
+        """Add ``n`` events today and save straight away (for app-side counters)"""
+        with self._lock:
+            self.refresh()
+            self.add(name, n=n)
+            self.save()
+
+    def card(self, name):
+        """(total, latest month, month-over-month change in %) for one counter
+
+        The month is None for a counter that was never incremented, and the
+        change is None when the month before the latest one had no events.
+        """
+        if name not in self.counters:
+            return 0, None, None
+        total, latest, this, previous = self.counters[name]
+        change = 100.0 * (this - previous) / previous if previous else None
+        return total, latest, change
+
+
+_stores = {}
+_stores_lock = threading.Lock()
+
+
+def get_counter_store(path):
+    """Process-wide counter store for ``path``, so every session increments through one lock"""
+    with _stores_lock:
+        if path not in _stores:
+            _stores[path] = CounterStore(path)
+        return _stores[path]
+
+
+def mention_flags(tokens):
+    """``MENTION_*`` bits of every text of a TokenBatch (see :mod:`stem_intel.index`)"""
+    return (mentions(tokens, RESEARCH_TERMS) * MENTION_RESEARCH
+            | mentions(tokens, INNOVATION_TERMS) * MENTION_INNOVATION
+            | mentions(tokens, FUNDING_TERMS) * MENTION_FUNDING).astype(np.uint8)
+
+
+def count_batch(counters, articles, flags, indexed):
+    """Add one ingest batch, with its :func:`mention_flags`, to the corpus counters
+
+    Every article counts as analyzed; research and innovation coverage is
+    only counted for the ``indexed`` ones, so a story syndicated ten times
+    counts once.
+    """
+    for article, flag, kept in zip(articles, flags, indexed):
+        counters.add("articles", article.get("published"))
+        if kept:
+            if flag & MENTION_RESEARCH:
+                counters.add("research", article.get("published"))
+            if flag & MENTION_INNOVATION:
+                counters.add("innovations", article.get("published"))
+
+
+def rebuild_from_index(index_dir=INDEX_DIR, path=CORPUS_COUNTERS):
+    """Recompute the corpus counters from every article stored in the search index
+
+    Mention flags and folded duplicates are read back as ingest recorded
+    them, so a rebuild gives the same cards as the incremental ingests did.
+    """
+    from .corpus import TokenBatch, article_text
+    from .index import DuplicateLog, SearchIndex
+
+    if os.path.exists(path):
+        os.remove(path)
+    counters = CounterStore(path)
+    index = SearchIndex(index_dir)
+    logged = DuplicateLog(index_dir).entries()
+    logged_per_doc = Counter(doc for doc, *_ in logged)
+    for seg_index, seg in enumerate(index.segments):
+        docs = [seg.document(i) for i in range(seg.n_docs)]
+        flags = (seg.mentions if seg.mentions is not None
+                 else mention_flags(TokenBatch([article_text(d) for d in docs])))
+        count_batch(counters, docs, flags.tolist(), [True] * len(docs))
+        for local_id, doc in enumerate(docs):
+            # Duplicates folded before the log existed are only known as counts on their representative
+            unlogged = index.duplicates(seg_index, local_id) - logged_per_doc[int(index.bases[seg_index]) + local_id]
+            if unlogged > 0:
+                counters.add("articles", doc.get("published"), unlogged)
+    for _, published, _, _ in logged:
+        counters.add("articles", published)
+    counters.save()
+    return counters
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Home page corpus counters")
+    parser.add_argument("--index", default=INDEX_DIR, help="index directory (default: %(default)s)")
+    parser.add_argument("--path", default=CORPUS_COUNTERS, help="counter file (default: %(default)s)")
+    parser.add_argument("--rebuild", action="store_true", help="recompute from the search index")
+    args = parser.parse_args(argv)
+
+    counters = rebuild_from_index(args.index, args.path) if args.rebuild else CounterStore(args.path)
+    for name in sorted(counters.counters):
+        total, latest, change = counters.card(name)
+        delta = "n/a" if change is None else f"{change:+.0f}%"
+        print(f"{name:<12} {total:>12,}  {month_label(latest)} {delta}")
+
+
+if __name__ == "__main__":
+    main()
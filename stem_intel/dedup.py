@@ -0,0 +1,224 @@
+"""MinHash / LSH near-duplicate detection for ingested articles
+
+Syndicated press releases show up from dozens of outlets with trivial edits.
+Each article is reduced to a MinHash signature over word shingles; the
+signature is cut into bands and every band is hashed to a 32-bit key. Two
+articles that share any band key are candidates, and the number of shared
+bands estimates their Jaccard similarity, so candidates are verified without
+keeping full signatures around. Only the first article of a cluster (its
+representative) is indexed; later copies just bump its duplicate count.
+
+Band keys of representatives are persisted per band as sorted arrays, so a
+lookup is a vectorized ``searchsorted`` instead of a scan over the corpus.
+"""
+import os
+import zlib
+
+import numpy as np
+
+from .corpus import TokenBatch, article_text
+
+SHINGLE_SIZE = 3
+NUM_PERM = 128
+BANDS = 32
+ROWS = NUM_PERM // BANDS
+
+# Estimated Jaccard similarity at which two articles are the same story
+SIMILARITY_THRESHOLD = 0.7
+
+# Largest (permutations x shingles) block hashed at once, bounds temp memory
+MAX_SHINGLES_PER_BLOCK = 32_768
+
+_rng = np.random.default_rng(0x5EED)
+# Multiply-shift hashing: (a*x + b) mod 2**64, keep the high 32 bits
+_PERM_A = _rng.integers(0, 2 ** 63, NUM_PERM, dtype=np.uint64)[:, None] * np.uint64(2) + np.uint64(1)
+_PERM_B = _rng.integers(0, 2 ** 63, NUM_PERM, dtype=np.uint64)[:, None]
+_SHINGLE_MIX = _rng.integers(1, 2 ** 32, SHINGLE_SIZE, dtype=np.uint64) | np.uint64(1)
+_BAND_MIX = _rng.integers(1, 2 ** 32, ROWS, dtype=np.uint64) | np.uint64(1)
+_LOW32 = np.uint64(0xFFFFFFFF)
+
+_token_hashes = {}
+
+
+def token_hash(token):
+    value = _token_hashes.get(token)
+    if value is None:
+        value = _token_hashes[token] = zlib.crc32(token.encode("utf-8"))
+        if len(_token_hashes) > 1_000_000:
+            _token_hashes.clear()
+    return value
+
+
+def shingle_hashes(tokens):
+    """32-bit hashes of the word ``SHINGLE_SIZE``-grams of a :class:`TokenBatch`
+
+    Returns (hashes, lengths): one flat array for the whole batch plus the
+    number of shingles per text. Texts shorter than a shingle contribute one
+    shingle made of all their words; empty texts contribute none.
+    """
+    if not len(tokens):
+        return np.zeros(0, dtype=np.uint64), np.zeros(tokens.n_docs, dtype=np.int64)
+    # Hash each distinct token once per batch
+    token_hashes = np.fromiter((token_hash(t) for t in tokens.vocab.tolist()),
+                               dtype=np.uint64, count=len(tokens.vocab))[tokens.inverse]
+
+    # Shingle i of the batch starts at token i; windows that run past the end
+    # of their document are dropped (short documents keep their first one)
+    counts, doc_of = tokens.counts, tokens.doc_of
+    ends = tokens.ends[doc_of]
+    position = np.arange(len(tokens))
+    padded = np.concatenate([token_hashes, np.zeros(SHINGLE_SIZE, dtype=np.uint64)])
+    mixed = np.zeros(len(tokens), dtype=np.uint64)
+    for offset in range(SHINGLE_SIZE):
+        inside = position + offset < ends
+        mixed += np.where(inside, padded[offset:offset + len(tokens)] * _SHINGLE_MIX[offset], np.uint64(0))
+    keep = (position + SHINGLE_SIZE <= ends) | ((counts[doc_of] < SHINGLE_SIZE) & (position == ends - counts[doc_of]))
+    lengths = np.bincount(doc_of[keep], minlength=tokens.n_docs)
+    return mixed[keep] & _LOW32, lengths
+
+
+def signatures(hashes, lengths):
+    """MinHash signatures (docs x NUM_PERM, uint32) from flat shingle hashes"""
+    sigs = np.full((len(lengths), NUM_PERM), np.iinfo(np.uint32).max, dtype=np.uint32)
+    offsets = np.r_[0, np.cumsum(lengths)]
+    doc = 0
+    while doc < len(lengths):
+        # Pack as many documents as fit in one block, then reduce per document
+        end = int(np.searchsorted(offsets, offsets[doc] + MAX_SHINGLES_PER_BLOCK, side="right")) - 1
+        end = max(end, doc + 1)
+        block_docs = np.arange(doc, end)
+        nonempty = block_docs[lengths[doc:end] > 0]
+        if len(nonempty):
+            flat = hashes[offsets[doc]:offsets[end]]
+            hashed = (_PERM_A * flat[None, :] + _PERM_B) >> np.uint64(32)
+            mins = np.minimum.reduceat(hashed, offsets[nonempty] - offsets[doc], axis=1)
+            sigs[nonempty] = mins.T.astype(np.uint32)
+        doc = end
+    return sigs
+
+
+def band_keys(sigs):
+    """Hash each band of ``ROWS`` signature values into one 32-bit key"""
+    bands = sigs.reshape(len(sigs), BANDS, ROWS).astype(np.uint64)
+    return ((bands * _BAND_MIX).sum(axis=2) >> np.uint64(16)).astype(np.uint32)
+
+
+class DedupIndex:
+    """Persistent LSH band tables over cluster representatives"""
+
+    def __init__(self, path, threshold=SIMILARITY_THRESHOLD):
+        self.path = path
+        # Matching bands needed: E[shared bands] = BANDS * J**ROWS
+        self.min_bands = max(1, int(np.ceil(BANDS * threshold ** ROWS)))
+        keys_path = os.path.join(path, "band_keys.npy")
+        if os.path.exists(keys_path):
+            self.keys = np.load(keys_path)
+            self.reps = np.load(os.path.join(path, "band_reps.npy"))
+            self.rep_docs = np.load(os.path.join(path, "rep_docs.npy"))
+            self.dup_counts = np.load(os.path.join(path, "dup_counts.npy"))
+        else:
+            self.keys = np.zeros((BANDS, 0), dtype=np.uint32)
+            self.reps = np.zeros((BANDS, 0), dtype=np.int64)
+            self.rep_docs = np.zeros(0, dtype=np.int64)
+            self.dup_counts = np.zeros(0, dtype=np.int32)
+        # Representatives added since the last save, looked up through a dict
+        self._pending = {}
+        self._pending_keys = []
+        self._pending_docs = []
+        self._pending_dups = {}
+
+    @property
+    def n_reps(self):
+        return len(self.rep_docs) + len(self._pending_docs)
+
+    def _persisted_candidates(self, keys):
+        """Shared-band counts against saved representatives for a batch of keys"""
+        found = [dict() for _ in range(len(keys))]
+        if not self.keys.shape[1]:
+            return found
+        for band in range(BANDS):
+            lo = np.searchsorted(self.keys[band], keys[:, band], side="left")
+            hi = np.searchsorted(self.keys[band], keys[:, band], side="right")
+            for doc in np.flatnonzero(hi > lo):
+                counts = found[doc]
+                for rep in self.reps[band, lo[doc]:hi[doc]]:
+                    counts[rep] = counts.get(rep, 0) + 1
+        return found
+
+    def assign(self, articles, first_doc_id, tokens=None):
+        """Classify a batch of articles as new representatives or duplicates
+
+        ``first_doc_id`` is the global index id the first new representative
+        will get; ids increase by one per representative. ``tokens`` is the
+        batch's :class:`TokenBatch` when the caller already has one. Returns a
+        list with ``None`` for representatives and the duplicated doc id
+        otherwise.
+        """
+        if tokens is None:
+            tokens = TokenBatch([article_text(a) for a in articles])
+        hashes, lengths = shingle_hashes(tokens)
+        keys = band_keys(signatures(hashes, lengths))
+        candidates = self._persisted_candidates(keys)
+        n_saved = len(self.rep_docs)
+        # Pending tables use one dict keyed on (band, key) packed into an int
+        packed = ((np.arange(BANDS, dtype=np.uint64) << np.uint64(32)) | keys).tolist()
+        pending = self._pending
+
+        result = []
+        next_doc = first_doc_id
+        for i, row in enumerate(packed):
+            if not lengths[i]:
+                # Nothing to compare on: index it, but keep it out of the band tables
+                result.append(None)
+                next_doc += 1
+                continue
+            counts = candidates[i]
+            for key in row:
+                rep = pending.get(key)
+                if rep is not None:
+                    counts[rep] = counts.get(rep, 0) + 1
+            best = max(counts, key=counts.get) if counts else None
+            if best is not None and counts[best] >= self.min_bands:
+                doc = int(self.rep_docs[best] if best < n_saved else self._pending_docs[best - n_saved])
+                self._pending_dups[doc] = self._pending_dups.get(doc, 0) + 1
+                result.append(doc)
+            else:
+                rep = self.n_reps
+                for key in row:
+                    pending.setdefault(key, rep)
+                self._pending_keys.append(keys[i])
+                self._pending_docs.append(next_doc)
+                result.append(None)
+                next_doc += 1
+        return result
+
+    def save(self):
+        """Merge pending representatives into the sorted band tables on disk"""
+        if self._pending_docs:
+            new_keys = np.array(self._pending_keys, dtype=np.uint32).T
+            new_reps = np.arange(len(self.rep_docs), self.n_reps, dtype=np.int64)
+            keys, reps = [], []
+            for band in range(BANDS):
+                order = np.argsort(new_keys[band], kind="stable")
+                at = np.searchsorted(self.keys[band], new_keys[band, order], side="right")
+                keys.append(np.insert(self.keys[band], at, new_keys[band, order]))
+                reps.append(np.insert(self.reps[band], at, new_reps[order]))
+            self.keys, self.reps = np.array(keys), np.array(reps)
+            self.rep_docs = np.concatenate([self.rep_docs, np.array(self._pending_docs, dtype=np.int64)])
+
+        n_docs = int(max(self.rep_docs.max(initial=-1) + 1, len(self.dup_counts)))
+        if n_docs > len(self.dup_counts):
+            self.dup_counts = np.concatenate([self.dup_counts,
+                                              np.zeros(n_docs - len(self.dup_counts), dtype=np.int32)])
+        for doc, extra in self._pending_dups.items():
+            self.dup_counts[doc] += extra
+
+        os.makedirs(self.path, exist_ok=True)
+        for name, array in (("band_keys", self.keys), ("band_reps", self.reps),
+                            ("rep_docs", self.rep_docs), ("dup_counts", self.dup_counts)):
+            tmp = os.path.join(self.path, name + ".tmp.npy")
+            np.save(tmp, array)
+            os.replace(tmp, os.path.join(self.path, name + ".npy"))
+
+        self._pending = {}
+        self._pending_keys, self._pending_docs, self._pending_dups = [], [], {}
@@ -0,0 +1,482 @@
+"""Asynchronous RSS/Atom/JSON Feed poller feeding the local article index
+
+    python -m stem_intel.feeds                   # poll every feed in data/feeds.txt once
+    python -m stem_intel.feeds --interval 900    # keep polling every 15 minutes
+
+Feeds are fetched with a small asyncio HTTP/1.1 client built on the standard
+library: connections are pooled and kept alive per host, concurrency is capped
+per host and overall, and ``ETag``/``Last-Modified`` validators are replayed
+so unchanged feeds come back as ``304 Not Modified`` without a body. Response
+bodies are decompressed and parsed as they stream in, and new items are
+written to the corpus and ingested into the search index and trend store.
+"""
+import argparse
+import asyncio
+import json
+import os
+import ssl
+import time
+import xml.etree.ElementTree as ET
+import zlib
+from collections import defaultdict, deque
+from contextlib import asynccontextmanager
+from datetime import date
+from urllib.parse import urljoin, urlsplit
+
+from .config import CORPUS_DIR, DATA_DIR, INDEX_DIR, TREND_DIR
+from .corpus import ATOM_NS, feed_item_to_raw, normalize_article
+
+FEEDS_FILE = os.path.join(DATA_DIR, "feeds.txt")
+FEED_STATE_FILE = os.path.join(DATA_DIR, "feed_state.json")
+
+USER_AGENT = "STEM-News-Intelligence/3.0 (+https://github.com/fabyrizky)"
+MAX_PER_HOST = 4
+MAX_CONNECTIONS = 256
+REQUEST_TIMEOUT = 20  # seconds
+MAX_REDIRECTS = 3
+READ_CHUNK = 64 * 1024
+
+# Item ids remembered per feed so re-served items are not ingested twice
+SEEN_PER_FEED = 1000
+
+
+class HTTPError(Exception):
+    """Malformed or unexpected HTTP response"""
+
+
+class Response:
+    """Status line and headers of a response whose body is still streaming"""
+
+    def __init__(self, url, status, headers, chunks):
+        self.url = url
+        self.status = status
+        self.headers = headers
+        self._chunks = chunks
+
+    def iter_chunks(self):
+        """Async iterator over decoded (de-chunked, decompressed) body bytes"""
+        return self._chunks
+
+
+class ConnectionPool:
+    """Keep-alive connections grouped by (scheme, host, port)"""
+
+    def __init__(self, max_per_host=MAX_PER_HOST, max_connections=MAX_CONNECTIONS):
+        self.max_per_host = max_per_host
+        self._idle = defaultdict(list)
+        self._host_limits = {}
+        self.total_limit = asyncio.Semaphore(max_connections)
+        self._ssl = ssl.create_default_context()
+        self.opened = 0
+        self.reused = 0
+
+    def host_limit(self, key):
+        limit = self._host_limits.get(key)
+        if limit is None:
+            limit = self._host_limits[key] = asyncio.Semaphore(self.max_per_host)
+        return limit
+
+    async def connect(self, key):
+        """Return (reader, writer, reused) for ``key``, preferring idle connections"""
+        idle = self._idle[key]
+        while idle:
+            reader, writer = idle.pop()
+            if not writer.is_closing() and not reader.at_eof():
+                self.reused += 1
+                return reader, writer, True
+            writer.close()
+        scheme, host, port = key
+        reader, writer = await asyncio.open_connection(
+            host, port, ssl=self._ssl if scheme == "https" else None, limit=READ_CHUNK * 4)
+        self.opened += 1
+        return reader, writer, False
+
+    def release(self, key, conn, reusable):
+        reader, writer = conn
+        if reusable and not writer.is_closing():
+            self._idle[key].append((reader, writer))
+        else:
+            writer.close()
+
+    async def close(self):
+        writers = [writer for conns in self._idle.values() for _, writer in conns]
+        self._idle.clear()
+        for writer in writers:
+            writer.close()
+        await asyncio.gather(*(writer.wait_closed() for writer in writers), return_exceptions=True)
+
+
+class HTTPClient:
+    """Minimal streaming HTTP/1.1 GET client over a :class:`ConnectionPool`"""
+
+    def __init__(self, pool=None, timeout=REQUEST_TIMEOUT):
+        self.pool = pool or ConnectionPool()
+        self.timeout = timeout
+
+    async def close(self):
+        await self.pool.close()
+
+    @asynccontextmanager
+    async def get(self, url, headers=None):
+        """GET ``url`` following redirects; yields a streaming :class:`Response`"""
+        for _ in range(MAX_REDIRECTS + 1):
+            async with self._request(url, headers or {}) as response:
+                if response.status in (301, 302, 303, 307, 308) and "location" in response.headers:
+                    url = urljoin(url, response.headers["location"])
+                    async for _chunk in response.iter_chunks():
+                        pass
+                    continue
+                yield response
+                return
+        raise HTTPError(f"too many redirects for {url}")
+
+    @asynccontextmanager
+    async def _request(self, url, headers):
+        parts = urlsplit(url)
+        scheme = parts.scheme or "http"
+        port = parts.port or (443 if scheme == "https" else 80)
+        key = (scheme, parts.hostname, port)
+        target = (parts.path or "/") + (f"?{parts.query}" if parts.query else "")
+        host = parts.hostname if parts.port is None else f"{parts.hostname}:{parts.port}"
+
+        lines = [f"GET {target} HTTP/1.1", f"Host: {host}", f"User-Agent: {USER_AGENT}",
+                 "Accept-Encoding: gzip, deflate", "Connection: keep-alive"]
+        lines += [f"{name}: {value}" for name, value in headers.items()]
+        request = ("\r\n".join(lines) + "\r\n\r\n").encode("latin-1")
+
+        async with self.pool.host_limit(key), self.pool.total_limit:
+            for attempt in range(2):
+                reader, writer, reused = await asyncio.wait_for(self.pool.connect(key), self.timeout)
+                try:
+                    writer.write(request)
+                    await writer.drain()
+                    status, resp_headers, keep_alive = await asyncio.wait_for(_read_head(reader), self.timeout)
+                    break
+                except (ConnectionError, asyncio.IncompleteReadError, HTTPError):
+                    writer.close()
+                    # A pooled connection may have been closed by the server while idle
+                    if not reused or attempt:
+                        raise
+
+            state = {"complete": False}
+            chunks = _decode_body(reader, status, resp_headers, state, self.timeout)
+            try:
+                yield Response(url, status, resp_headers, chunks)
+                if not state["complete"]:
+                    async for _chunk in chunks:
+                        pass
+            finally:
+                self.pool.release(key, (reader, writer), keep_alive and state["complete"])
+
+
+async def _read_head(reader):
+    status_line = await reader.readuntil(b"\r\n")
+    parts = status_line.decode("latin-1").split(None, 2)
+    if len(parts) < 2 or not parts[0].startswith("HTTP/"):
+        raise HTTPError(f"bad status line {status_line!r}")
+    status = int(parts[1])
+    headers = {}
+    while True:
+        line = await reader.readuntil(b"\r\n")
+        if line == b"\r\n":
+            break
+        name, _, value = line.decode("latin-1").partition(":")
+        headers[name.strip().lower()] = value.strip()
+    keep_alive = parts[0] == "HTTP/1.1" and headers.get("connection", "").lower() != "close"
+    return status, headers, keep_alive
+
+
+async def _raw_body(reader, status, headers, state, timeout):
+    if status in (204, 304) or 100 <= status < 200:
+        pass  # no body by definition
+    elif headers.get("transfer-encoding", "").lower() == "chunked":
+        while True:
+            size_line = await asyncio.wait_for(reader.readuntil(b"\r\n"), timeout)
+            size = int(size_line.split(b";")[0], 16)
+            if size == 0:
+                # Skip optional trailers up to the terminating blank line
+                while await reader.readuntil(b"\r\n") != b"\r\n":
+                    pass
+                break
+            yield await asyncio.wait_for(reader.readexactly(size), timeout)
+            await reader.readexactly(2)
+    elif "content-length" in headers:
+        remaining = int(headers["content-length"])
+        while remaining:
+            chunk = await asyncio.wait_for(reader.read(min(remaining, READ_CHUNK)), timeout)
+            if not chunk:
+                raise asyncio.IncompleteReadError(b"", remaining)
+            remaining -= len(chunk)
+            yield chunk
+    else:
+        while chunk := await asyncio.wait_for(reader.read(READ_CHUNK), timeout):
+            yield chunk
+        # Body delimited by connection close: the socket cannot be reused
+        return
+    state["complete"] = True
+
+
+async def _decode_body(reader, status, headers, state, timeout):
+    encoding = headers.get("content-encoding", "").lower()
+    decoder = None
+    if encoding in ("gzip", "x-gzip"):
+        decoder = zlib.decompressobj(16 + zlib.MAX_WBITS)
+    elif encoding == "deflate":
+        decoder = zlib.decompressobj()
+    async for chunk in _raw_body(reader, status, headers, state, timeout):
+        data = decoder.decompress(chunk) if decoder else chunk
+        if data:
+            yield data
+    if decoder:
+        tail = decoder.flush()
+        if tail:
+            yield tail
+
+
+class FeedParser:
+    """Incremental parser for RSS/Atom (streamed XML) and JSON Feed bodies"""
+
+    def __init__(self, source="", category=None):
+        self.source = source
+        self.category = category
+        self._xml = None
+        self._json = None
+        self.items = []
+
+    def feed(self, data):
+        if self._xml is None and self._json is None:
+            head = data.lstrip()[:1]
+            if not head:
+                return
+            if head in (b"{", b"["):
+                self._json = bytearray()
+            else:
+                self._xml = ET.XMLPullParser(events=("end",))
+        if self._json is not None:
+            self._json.extend(data)
+            return
+        self._xml.feed(data)
+        for _, elem in self._xml.read_events():
+            if elem.tag in ("item", ATOM_NS + "entry"):
+                self._add(feed_item_to_raw(elem, self.source))
+                elem.clear()
+
+    def close(self):
+        if self._xml is not None:
+            self._xml.close()
+        elif self._json is not None:
+            payload = json.loads(bytes(self._json))
+            items = payload.get("items") if isinstance(payload, dict) else payload
+            for item in items if isinstance(items, list) else []:
+                raw = _json_item(item, self.source)
+                if raw is not None:
+                    self._add(raw)
+        return self.items
+
+    def _add(self, raw):
+        if self.category:
+            raw["category"] = self.category
+        article = normalize_article(raw)
+        if article:
+            self.items.append(article)
+
+
+def _json_item(item, source):
+    """Raw record of one JSON Feed item, or None when it is not an object; mistyped fields read as missing"""
+    if not isinstance(item, dict):
+        return None
+    text = lambda key: item.get(key) if isinstance(item.get(key), str) else None
+    tags = item.get("tags")
+    item_id = item.get("id")
+    return {
+        "id": str(item_id) if isinstance(item_id, (str, int)) and not isinstance(item_id, bool) else None,
+        "title": text("title"),
+        "summary": text("summary"),
+        "body": text("content_text") or text("content_html"),
+        "url": text("url"),
+        "published": text("date_published"),
+        "category": tags[0] if isinstance(tags, list) and tags and isinstance(tags[0], str) else None,
+        "source": source,
+    }
+
+
+def load_feed_list(path=FEEDS_FILE):
+    """Read ``URL [category]`` lines, skipping blanks and ``#`` comments"""
+    feeds = []
+    with open(path, encoding="utf-8") as fh:
+        for line in fh:
+            line = line.strip()
+            if line and not line.startswith("#"):
+                url, _, category = line.partition(" ")
+                feeds.append((url, category.strip() or None))
+    return feeds
+
+
+class FeedState:
+    """Persisted validators (ETag / Last-Modified) and recently seen item ids"""
+
+    def __init__(self, path=FEED_STATE_FILE):
+        self.path = path
+        self.feeds = {}
+        if path and os.path.exists(path):
+            with open(path, encoding="utf-8") as fh:
+                self.feeds = json.load(fh)
+        self._seen = {url: deque(entry.get("seen", []), maxlen=SEEN_PER_FEED)
+                      for url, entry in self.feeds.items()}
+
+    def request_headers(self, url):
+        entry = self.feeds.get(url, {})
+        headers = {}
+        if entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+        if entry.get("last_modified"):
+            headers["If-Modified-Since"] = entry["last_modified"]
+        return headers
+
+    def update(self, url, headers):
+        entry = self.feeds.setdefault(url, {})
+        entry["etag"] = headers.get("etag")
+        entry["last_modified"] = headers.get("last-modified")
+
+    def new_items(self, url, items):
+        """Filter out items already ingested from this feed and remember the rest"""
+        seen = self._seen.setdefault(url, deque(maxlen=SEEN_PER_FEED))
+        known = set(seen)
+        fresh = [item for item in items if item["id"] not in known]
+        seen.extend(item["id"] for item in fresh)
+        return fresh
+
+    def save(self):
+        if not self.path:
+            return
+        for url, seen in self._seen.items():
+            self.feeds.setdefault(url, {})["seen"] = list(seen)
+        tmp = self.path + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as fh:
+            json.dump(self.feeds, fh)
+        os.replace(tmp, self.path)
+
+
+class PollStats:
+    def __init__(self):
+        self.fetched = 0
+        self.not_modified = 0
+        self.failed = 0
+        self.articles = 0
+        self.elapsed = 0.0
+        self.errors = {}
+
+    @property
+    def feeds(self):
+        return self.fetched + self.not_modified + self.failed
+
+    def __str__(self):
+        rate = self.feeds / self.elapsed if self.elapsed else 0.0
+        return (f"{self.feeds} feeds in {self.elapsed:.2f}s ({rate:.0f} feeds/s): "
+                f"{self.fetched} fetched, {self.not_modified} not modified, "
+                f"{self.failed} failed, {self.articles} new articles")
+
+
+class FeedFetcher:
+    """Polls a list of feeds concurrently and returns their new articles"""
+
+    def __init__(self, feeds, state=None, max_per_host=MAX_PER_HOST,
+                 max_connections=MAX_CONNECTIONS, timeout=REQUEST_TIMEOUT):
+        self.feeds = feeds
+        self.state = state if state is not None else FeedState(None)
+        self.max_per_host = max_per_host
+        self.max_connections = max_connections
+        self.timeout = timeout
+
+    async def poll(self):
+        """Fetch every feed once; returns (articles, PollStats)"""
+        stats = PollStats()
+        start = time.perf_counter()
+        client = HTTPClient(ConnectionPool(self.max_per_host, self.max_connections), self.timeout)
+        try:
+            # One feed failing in a way _fetch did not anticipate must not lose the others' articles
+            results = await asyncio.gather(
+                *(self._fetch(client, url, category, stats) for url, category in self.feeds),
+                return_exceptions=True)
+        finally:
+            await client.close()
+        stats.elapsed = time.perf_counter() - start
+        articles = []
+        for (url, _), items in zip(self.feeds, results):
+            if isinstance(items, BaseException):
+                if not isinstance(items, Exception):
+                    raise items
+                stats.failed += 1
+                stats.errors[url] = f"{type(items).__name__}: {items}"
+                continue
+            articles.extend(items)
+        stats.articles = len(articles)
+        return articles, stats
+
+    async def _fetch(self, client, url, category, stats):
+        try:
+            async with client.get(url, self.state.request_headers(url)) as response:
+                if response.status == 304:
+                    stats.not_modified += 1
+                    return []
+                if response.status != 200:
+                    raise HTTPError(f"HTTP {response.status}")
+                parser = FeedParser(urlsplit(url).hostname or "", category)
+                async for chunk in response.iter_chunks():
+                    parser.feed(chunk)
+                items = parser.close()
+                self.state.update(url, response.headers)
+            stats.fetched += 1
+            return self.state.new_items(url, items)
+        except (OSError, asyncio.TimeoutError, asyncio.IncompleteReadError,
+                HTTPError, ET.ParseError, ValueError, zlib.error) as exc:
+            stats.failed += 1
+            stats.errors[url] = f"{type(exc).__name__}: {exc}"
+            return []
+
+
+def store_articles(articles, corpus_dir=CORPUS_DIR, index_dir=INDEX_DIR, trend_dir=TREND_DIR):
+    """Append fetched articles to the corpus and ingest them into the index"""
+    from .ingest import ingest_articles
+
+    if not articles:
+        return 0
+    os.makedirs(corpus_dir, exist_ok=True)
+    # Keeping the raw feed output in the corpus lets a --rebuild reproduce the index
+    path = os.path.join(corpus_dir, f"feeds-{date.today():%Y%m%d}.jsonl")
+    with open(path, "a", encoding="utf-8") as fh:
+        for article in articles:
+            fh.write(json.dumps(article, ensure_ascii=False) + "\n")
+    count, _ = ingest_articles(articles, index_dir, trend_dir)
+    return count
+
+
+async def run(feeds, state, interval=None, **fetch_kwargs):
+    fetcher = FeedFetcher(feeds, state, **fetch_kwargs)
+    while True:
+        articles, stats = await fetcher.poll()
+        store_articles(articles)
+        state.save()
+        print(stats)
+        for url, error in list(stats.errors.items())[:10]:
+            print(f"  ! {url}: {error}")
+        if not interval:
+            return stats
+        await asyncio.sleep(interval)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Poll STEM news feeds into the local article index")
+    parser.add_argument("--feeds", default=FEEDS_FILE, help="feed list file (default: %(default)s)")
+    parser.add_argument("--state", default=FEED_STATE_FILE, help="validator state file (default: %(default)s)")
+    parser.add_argument("--interval", type=float, default=None, help="seconds between polls; omit to poll once")
+    parser.add_argument("--max-per-host", type=int, default=MAX_PER_HOST)
+    parser.add_argument("--max-connections", type=int, default=MAX_CONNECTIONS)
+    args = parser.parse_args(argv)
+
+    asyncio.run(run(load_feed_list(args.feeds), FeedState(args.state), args.interval,
+                    max_per_host=args.max_per_host, max_connections=args.max_connections))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,174 @@
+"""Damped-trend Holt-Winters forecasts for whole (time x category) matrices
+
+Every category is fitted at once: the smoothing recurrences run over time in
+a Python loop, but each step updates a (parameter grid x category) array, so
+a thousand series cost about as many loop iterations as one. The model is
+additive error, damped additive trend and additive weekly season
+(ETS(A,Ad,A)):
+
+    yhat_t = l + phi*b + s[t-m]            e_t = y_t - yhat_t
+    l' = l + phi*b + alpha*e               b' = phi*b + beta*e
+    s[t] = s[t-m] + gamma*e
+
+Parameters are picked per category from a fixed grid by one-step squared
+error, which is both vectorizable and stable on short, noisy count series.
+Prediction intervals use the closed-form ETS variance, and the intervals of
+multi-day means account for the correlation between horizons.
+"""
+import itertools
+from statistics import NormalDist
+
+import numpy as np
+import pandas as pd
+
+# Weekly seasonality of daily news counts
+SEASON = 7
+
+# Candidate smoothing parameters; beta is a fraction of alpha so beta <= alpha
+ALPHAS = (0.05, 0.1, 0.2, 0.35, 0.5)
+BETA_FRACTIONS = (0.01, 0.1)
+PHIS = (0.9, 0.98)
+GAMMAS = (0.0, 0.05, 0.15)
+
+INTERVAL = 0.8
+DAYS_PER_MONTH = 30
+
+
+def parameter_grid():
+    """(alpha, beta, phi, gamma) columns of every candidate, shape (4, G)"""
+    rows = [(a, a * f, p, g) for a, f, p, g in itertools.product(ALPHAS, BETA_FRACTIONS, PHIS, GAMMAS)]
+    return np.array(rows).T
+
+
+class Fit:
+    """Per-category smoothing parameters and end-of-data states"""
+
+    def __init__(self, alpha, beta, phi, gamma, level, trend, season, sigma):
+        self.alpha, self.beta, self.phi, self.gamma = alpha, beta, phi, gamma
+        self.level, self.trend = level, trend
+        # season[j] is the seasonal term of the day j+1 days after the data ends
+        self.season = season
+        self.sigma = sigma
+
+    def __len__(self):
+        return len(self.level)
+
+    def select(self, columns):
+        """The fit of a subset of the categories"""
+        return Fit(self.alpha[columns], self.beta[columns], self.phi[columns], self.gamma[columns],
+                   self.level[columns], self.trend[columns], self.season[:, columns], self.sigma[columns])
+
+    @classmethod
+    def concat(cls, fits):
+        """One fit holding the categories of several, in order"""
+        vectors = [np.concatenate([getattr(f, name) for f in fits])
+                   for name in ("alpha", "beta", "phi", "gamma", "level", "trend")]
+        return cls(*vectors, np.concatenate([f.season for f in fits], axis=1),
+                   np.concatenate([f.sigma for f in fits]))
+
+    def _damped_sums(self, horizon):
+        # phi + phi^2 + ... + phi^h for h = 1..horizon, shape (horizon, K)
+        powers = self.phi[None, :] ** np.arange(1, horizon + 1)[:, None]
+        return np.cumsum(powers, axis=0)
+
+    def forecast(self, horizon):
+        """Daily point forecasts for the next ``horizon`` days, shape (horizon, K)"""
+        steps = np.arange(horizon) % SEASON
+        return self.level + self._damped_sums(horizon) * self.trend + self.season[steps]
+
+    def error_weights(self, horizon):
+        """c_j of the ETS variance: weight of the shock j days before a forecast day"""
+        j = np.arange(1, horizon)[:, None]
+        damped = np.divide(self.phi * (1 - self.phi ** j), 1 - self.phi,
+                           out=j * np.ones_like(self.phi), where=self.phi != 1)
+        seasonal = (j % SEASON == 0) * self.gamma
+        return np.vstack([np.ones((1, len(self))), self.alpha + self.beta * damped + seasonal])
+
+    def interval_mean(self, first, last, weights=None):
+        """Forecast and standard error of the mean over days ``first``..``last`` (1-based)"""
+        weights = self.error_weights(last) if weights is None else weights
+        mean = self.forecast(last)[first - 1:last].mean(axis=0)
+        # The shock on day i reaches every forecast day h >= i in the bucket
+        # with weight c_{h-i}; sum those weights per shock, square and add up
+        cum = np.vstack([np.zeros((1, len(self))), np.cumsum(weights, axis=0)])
+        shocks = np.arange(1, last + 1)
+        hi = last - shocks + 1
+        lo = np.maximum(first - shocks, 0)
+        coef = cum[hi] - cum[lo]
+        se = self.sigma * np.sqrt((coef ** 2).sum(axis=0)) / (last - first + 1)
+        return mean, se
+
+
+def fit(values, season=SEASON):
+    """Fit every column of a (time x category) array; returns a :class:`Fit`"""
+    # float32 like the trend store: the loop is memory-bound over (grid x K)
+    y = np.asarray(values, dtype=np.float32)
+    if y.ndim == 1:
+        y = y[:, None]
+    n, k = y.shape
+    grid = parameter_grid()
+    alpha, beta, phi, gamma = (p[:, None] for p in grid.astype(np.float32))
+    if n < 2 * season:
+        # Too short for a season: fall back to plain damped trend
+        gamma = np.zeros_like(gamma)
+        grid[3] = 0
+    cycles = max(n // season, 1)
+
+    # Classical initial states from the first two seasons (or what exists)
+    head = y[:min(n, 2 * season)]
+    first = head[:season].mean(axis=0)
+    second = head[season:].mean(axis=0) if len(head) > season else first
+    level = np.broadcast_to(first, (len(alpha), k)).copy()
+    trend = np.broadcast_to((second - first) / season, (len(alpha), k)).copy()
+    seasonal = y[:cycles * season].reshape(cycles, season, k).mean(axis=0) - y[:cycles * season].mean(axis=0) \
+        if n >= 2 * season else np.zeros((season, k), dtype=np.float32)
+    ring = np.broadcast_to(seasonal[:, None, :], (season, len(alpha), k)).copy()
+
+    sse = np.zeros((len(alpha), k), dtype=np.float32)
+    err = np.empty_like(sse)
+    scratch = np.empty_like(sse)
+    warmup = min(season, n - 1)
+    # In-place updates only: the loop body allocates nothing per step
+    for t in range(n):
+        s = ring[t % season]
+        np.multiply(phi, trend, out=trend)          # b <- phi*b
+        level += trend                              # l <- l + phi*b
+        np.add(level, s, out=err)
+        np.subtract(y[t], err, out=err)             # e = y - yhat
+        if t >= warmup:
+            np.multiply(err, err, out=scratch)
+            sse += scratch
+        level += np.multiply(alpha, err, out=scratch)
+        trend += np.multiply(beta, err, out=scratch)
+        s += np.multiply(gamma, err, out=scratch)
+
+    best = sse.argmin(axis=0)
+    cols = np.arange(k)
+    dof = max(n - warmup - 4, 1)
+    # Seasonal terms for the days after the data, in forecast order
+    order = (n + np.arange(season)) % season
+    states = (level[best, cols], trend[best, cols], ring[order][:, best, cols], np.sqrt(sse[best, cols] / dof))
+    return Fit(*grid[:, best], *(state.astype(np.float64) for state in states))
+
+
+def monthly_forecast(fitted, columns, months, start, interval=INTERVAL):
+    """Long frame of monthly (30-day) forecast means with intervals
+
+    ``start`` is the first forecast day. Forecasts of counts are clipped at
+    zero.
+    """
+    z = NormalDist().inv_cdf(0.5 + interval / 2)
+    weights = fitted.error_weights(months * DAYS_PER_MONTH)
+    frames = []
+    for month in range(1, months + 1):
+        first, last = (month - 1) * DAYS_PER_MONTH + 1, month * DAYS_PER_MONTH
+        mean, se = fitted.interval_mean(first, last, weights[:last])
+        frames.append(pd.DataFrame({
+            "Category": columns,
+            "Month": month,
+            "Start": pd.Timestamp(start) + pd.Timedelta(days=first - 1),
+            "Forecast": np.maximum(mean, 0),
+            "Lower": np.maximum(mean - z * se, 0),
+            "Upper": np.maximum(mean + z * se, 0),
+        }))
+    return pd.concat(frames, ignore_index=True)
@@ -0,0 +1,569 @@
+"""Segmented on-disk inverted index with BM25 top-k retrieval
+
+Articles are written in immutable segments. Each segment keeps term-major
+postings (doc ids and field-weighted term frequencies), document lengths,
+category codes, story keys, mention flags and a JSONL document store, all as
+memory-mapped ``.npy`` files so resident memory stays bounded by the
+vocabulary, not the corpus.
+A ``manifest.json`` lists the live segments; writers publish a new segment by
+atomically replacing the manifest, so open readers keep a consistent view.
+
+Retrieval ranks with BM25; the relevance shown to users is the TF-IDF cosine
+of the same postings (see :mod:`stem_intel.tfidf`).
+"""
+import hashlib
+import json
+import os
+import shutil
+from array import array
+from collections import defaultdict
+
+import numpy as np
+
+from .corpus import TEXT_FIELDS, tokenize
+from .tfidf import NORM_DRIFT, TermStats, document_norms, sublinear_tf
+
+# Per-field weights for BM25F-style term frequencies and document lengths
+FIELD_WEIGHTS = {"title": 3.0, "summary": 1.5, "body": 1.0}
+
+# Upper bound on documents buffered in memory before a segment is flushed
+SEGMENT_DOCS = 100_000
+
+BM25_K1 = 1.2
+BM25_B = 0.75
+
+MANIFEST = "manifest.json"
+TFIDF_DIR = "tfidf"
+DUPLICATE_LOG = "duplicates.jsonl"
+
+# Bits of the per-document ``mentions`` flags set at ingest from the full text (body included),
+# so the Home counters and Track Patterns aggregates can be rebuilt from body-less stored documents
+MENTION_RESEARCH, MENTION_INNOVATION, MENTION_FUNDING = 1, 2, 4
+
+
+def _write_json(path, payload):
+    tmp = path + ".tmp"
+    with open(tmp, "w", encoding="utf-8") as fh:
+        json.dump(payload, fh)
+    os.replace(tmp, path)
+
+
+def story_key(doc):
+    """Key under which search results of the same story are folded: the URL, else the title"""
+    return doc.get("url") or (doc.get("title") or "(untitled)").casefold()
+
+
+def _hash64(text):
+    return int.from_bytes(hashlib.blake2b(text.encode("utf-8"), digest_size=8).digest(), "little")
+
+
+def story_hash(doc):
+    """64-bit hash of :func:`story_key`, stored per document so ranking never reads documents"""
+    return _hash64(story_key(doc))
+
+
+class IngestedIds:
+    """Hashed ids of every article an index has taken in, indexed or folded as a duplicate
+
+    Kept as one sorted ``uint64`` array, so re-running ingestion over the same
+    corpus skips what is already in instead of matching every article against
+    its own stored copy.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.ids = np.load(path) if os.path.exists(path) else np.zeros(0, dtype=np.uint64)
+        self._pending = set()
+
+    def new(self, articles):
+        """Mask of the articles not taken in before (in this run or an earlier one); marks them seen"""
+        hashes = np.array([_hash64(str(a["id"])) for a in articles], dtype=np.uint64)
+        at = np.minimum(np.searchsorted(self.ids, hashes), max(len(self.ids) - 1, 0))
+        known = self.ids[at] == hashes if len(self.ids) else np.zeros(len(hashes), dtype=bool)
+        fresh = []
+        for value, seen in zip(hashes.tolist(), known.tolist()):
+            fresh.append(not seen and value not in self._pending)
+            self._pending.add(value)
+        return fresh
+
+    def save(self):
+        if not self._pending:
+            return
+        self.ids = np.union1d(self.ids, np.fromiter(self._pending, dtype=np.uint64, count=len(self._pending)))
+        self._pending = set()
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        tmp = self.path + ".tmp.npy"
+        np.save(tmp, self.ids)
+        os.replace(tmp, self.path)
+
+
+class DuplicateLog:
+    """Append-only record of every near-duplicate folded at ingest
+
+    Each line is ``[representative doc id, published, category, source]`` of
+    one duplicate, so stores derived from the corpus can be rebuilt with every
+    duplicate counted under its own date, category and source, as ingest
+    counted it.
+    """
+
+    def __init__(self, index_dir):
+        self.path = os.path.join(index_dir, DUPLICATE_LOG)
+        self._pending = []
+
+    def add(self, doc_id, article):
+        self._pending.append([doc_id, article.get("published"), article.get("category"), article.get("source")])
+
+    def save(self):
+        if not self._pending:
+            return
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        with open(self.path, "a", encoding="utf-8") as fh:
+            fh.writelines(json.dumps(entry, ensure_ascii=False) + "\n" for entry in self._pending)
+        self._pending = []
+
+    def entries(self):
+        """(doc id, published, category, source) of every saved duplicate"""
+        if not os.path.exists(self.path):
+            return []
+        with open(self.path, encoding="utf-8") as fh:
+            return [tuple(json.loads(line)) for line in fh if line.strip()]
+
+
+def read_manifest(index_dir):
+    """Return the manifest of an index directory, or None if it has none"""
+    path = os.path.join(index_dir, MANIFEST)
+    if not os.path.exists(path):
+        return None
+    with open(path, encoding="utf-8") as fh:
+        return json.load(fh)
+
+
+class IndexWriter:
+    """Buffers articles and flushes them as new index segments"""
+
+    def __init__(self, index_dir, field_weights=None, segment_docs=SEGMENT_DOCS):
+        self.index_dir = index_dir
+        self.field_weights = dict(field_weights or FIELD_WEIGHTS)
+        self.segment_docs = segment_docs
+        os.makedirs(index_dir, exist_ok=True)
+        self.manifest = read_manifest(index_dir) or {"segments": [], "next_segment": 1}
+        self._base = 0
+        for name in self.manifest["segments"]:
+            with open(os.path.join(index_dir, name, "meta.json"), encoding="utf-8") as fh:
+                self._base += json.load(fh)["n_docs"]
+        self.term_stats = TermStats(os.path.join(index_dir, TFIDF_DIR))
+        self._reset()
+
+    def _reset(self):
+        self._vocab = {}
+        self._term_ids = array("i")
+        self._doc_ids = array("i")
+        self._tfs = array("f")
+        self._doclens = array("f")
+        self._sentiment = array("f")
+        self._categories = []
+        self._story_keys = array("Q")
+        self._mentions = array("B")
+        self._docs = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    @property
+    def next_doc_id(self):
+        """Global id the next added article will get"""
+        return self._base + len(self._doclens)
+
+    def add(self, article):
+        """Buffer one normalized article; flushes when the segment is full"""
+        doc_id = len(self._doclens)
+        tfs = defaultdict(float)
+        doclen = 0.0
+        for field in TEXT_FIELDS:
+            weight = self.field_weights.get(field, 0.0)
+            if not weight:
+                continue
+            tokens = tokenize(article.get(field) or "")
+            doclen += weight * len(tokens)
+            for token in tokens:
+                tfs[token] += weight
+
+        vocab = self._vocab
+        for token, tf in tfs.items():
+            term_id = vocab.get(token)
+            if term_id is None:
+                term_id = vocab[token] = len(vocab)
+            self._term_ids.append(term_id)
+            self._doc_ids.append(doc_id)
+            self._tfs.append(tf)
+        self._doclens.append(doclen)
+        self._sentiment.append(article.get("sentiment_score") or 0.0)
+        self._categories.append(article.get("category") or "General")
+        self._story_keys.append(story_hash(article))
+        self._mentions.append(article.get("mentions") or 0)
+        self._docs.append({k: v for k, v in article.items() if k not in ("body", "sentiment_score", "mentions")})
+
+        if len(self._doclens) >= self.segment_docs:
+            self.flush()
+
+    def add_many(self, articles):
+        """Buffer an iterable of articles and return how many were added"""
+        count = 0
+        for article in articles:
+            self.add(article)
+            count += 1
+        return count
+
+    def flush(self):
+        """Write buffered articles as a segment and publish it in the manifest"""
+        if not self._doclens:
+            return None
+        name = "seg_%06d" % self.manifest["next_segment"]
+        seg_dir = os.path.join(self.index_dir, name)
+        os.makedirs(seg_dir, exist_ok=True)
+
+        term_ids = np.frombuffer(self._term_ids, dtype=np.int32)
+        # Doc ids are appended in increasing order, so a stable sort by term
+        # yields term-major postings with doc ids still sorted inside each term
+        order = np.argsort(term_ids, kind="stable")
+        counts = np.bincount(term_ids, minlength=len(self._vocab))
+        offsets = np.zeros(len(self._vocab) + 1, dtype=np.int64)
+        np.cumsum(counts, out=offsets[1:])
+
+        post_docs = np.frombuffer(self._doc_ids, dtype=np.int32)[order]
+        post_tf = np.frombuffer(self._tfs, dtype=np.float32)[order]
+        np.save(os.path.join(seg_dir, "post_docs.npy"), post_docs)
+        np.save(os.path.join(seg_dir, "post_tf.npy"), post_tf)
+        np.save(os.path.join(seg_dir, "term_offsets.npy"), offsets)
+
+        # Fold the segment into the corpus-wide TF-IDF statistics and
+        # precompute its document norms against the updated IDF
+        gids = self.term_stats.add(list(self._vocab), counts, len(self._doclens))
+        np.save(os.path.join(seg_dir, "term_gid.npy"), gids.astype(np.int32))
+        np.save(os.path.join(seg_dir, "tfidf_norm.npy"),
+                document_norms(post_docs, post_tf, counts, self.term_stats.idf(gids), len(self._doclens)))
+        np.save(os.path.join(seg_dir, "doclen.npy"), np.frombuffer(self._doclens, dtype=np.float32))
+        np.save(os.path.join(seg_dir, "sentiment.npy"), np.frombuffer(self._sentiment, dtype=np.float32))
+        np.save(os.path.join(seg_dir, "story_key.npy"), np.frombuffer(self._story_keys, dtype=np.uint64))
+        np.save(os.path.join(seg_dir, "mentions.npy"), np.frombuffer(self._mentions, dtype=np.uint8))
+
+        categories = sorted(set(self._categories))
+        codes = {c: i for i, c in enumerate(categories)}
+        np.save(os.path.join(seg_dir, "category.npy"),
+                np.array([codes[c] for c in self._categories], dtype=np.int16))
+
+        with open(os.path.join(seg_dir, "terms.txt"), "w", encoding="utf-8") as fh:
+            fh.write("\n".join(self._vocab))
+
+        doc_offsets = np.zeros(len(self._docs) + 1, dtype=np.int64)
+        with open(os.path.join(seg_dir, "docs.jsonl"), "wb") as fh:
+            for i, doc in enumerate(self._docs):
+                fh.write(json.dumps(doc, ensure_ascii=False).encode("utf-8") + b"\n")
+                doc_offsets[i + 1] = fh.tell()
+        np.save(os.path.join(seg_dir, "doc_offsets.npy"), doc_offsets)
+
+        _write_json(os.path.join(seg_dir, "meta.json"), {
+            "n_docs": len(self._doclens),
+            "total_len": float(np.sum(np.frombuffer(self._doclens, dtype=np.float32), dtype=np.float64)),
+            "categories": categories,
+            "field_weights": self.field_weights,
+            "tfidf_n_docs": self.term_stats.n_docs,
+        })
+
+        self.manifest["segments"].append(name)
+        self.manifest["next_segment"] += 1
+        _write_json(os.path.join(self.index_dir, MANIFEST), self.manifest)
+        self._base += len(self._doclens)
+        self._reset()
+        return name
+
+    def close(self):
+        self.flush()
+
+
+class Segment:
+    """Read-only, memory-mapped view of one index segment"""
+
+    def __init__(self, seg_dir):
+        self.seg_dir = seg_dir
+        with open(os.path.join(seg_dir, "meta.json"), encoding="utf-8") as fh:
+            self.meta = json.load(fh)
+        self.n_docs = self.meta["n_docs"]
+        self.total_len = self.meta["total_len"]
+        self.categories = self.meta["categories"]
+
+        load = lambda name: np.load(os.path.join(seg_dir, name), mmap_mode="r")
+        self.post_docs = load("post_docs.npy")
+        self.post_tf = load("post_tf.npy")
+        self.term_offsets = load("term_offsets.npy")
+        self.doclen = load("doclen.npy")
+        self.category = load("category.npy")
+        self.doc_offsets = load("doc_offsets.npy")
+        # Segments written before sentiment scoring read as neutral
+        if os.path.exists(os.path.join(seg_dir, "sentiment.npy")):
+            self.sentiment = load("sentiment.npy")
+        else:
+            self.sentiment = np.zeros(self.n_docs, dtype=np.float32)
+        # Segments written before story keys hash them from their documents on demand
+        if os.path.exists(os.path.join(seg_dir, "story_key.npy")):
+            self.story_key = load("story_key.npy")
+        else:
+            self.story_key = None
+        # Segments written before mention flags are re-scanned from their (body-less) documents
+        if os.path.exists(os.path.join(seg_dir, "mentions.npy")):
+            self.mentions = load("mentions.npy")
+        else:
+            self.mentions = None
+        # Segments written before TF-IDF statistics have no cosine relevance
+        if os.path.exists(os.path.join(seg_dir, "term_gid.npy")):
+            self.term_gid = load("term_gid.npy")
+            self.tfidf_norm = load("tfidf_norm.npy")
+            self.tfidf_n_docs = self.meta["tfidf_n_docs"]
+        else:
+            self.term_gid = self.tfidf_norm = None
+
+        with open(os.path.join(seg_dir, "terms.txt"), encoding="utf-8") as fh:
+            terms = fh.read().split("\n") if self.n_docs else []
+        self.terms = {term: i for i, term in enumerate(terms)}
+
+    def postings(self, term):
+        """Return (doc_ids, tfs) for a term, empty arrays if absent"""
+        term_id = self.terms.get(term)
+        if term_id is None:
+            return self.post_docs[:0], self.post_tf[:0]
+        start, end = self.term_offsets[term_id], self.term_offsets[term_id + 1]
+        return self.post_docs[start:end], self.post_tf[start:end]
+
+    def refresh_norms(self, term_stats):
+        """Recompute TF-IDF norms in memory once the corpus IDF has drifted"""
+        if self.term_gid is None or term_stats.n_docs <= self.tfidf_n_docs * (1 + NORM_DRIFT):
+            return False
+        self.tfidf_norm = document_norms(self.post_docs, self.post_tf, np.diff(self.term_offsets),
+                                         term_stats.idf(self.term_gid), self.n_docs)
+        self.tfidf_n_docs = term_stats.n_docs
+        return True
+
+    def df(self, term):
+        term_id = self.terms.get(term)
+        if term_id is None:
+            return 0
+        return int(self.term_offsets[term_id + 1] - self.term_offsets[term_id])
+
+    def category_mask(self, category):
+        """Boolean mask of documents in ``category`` (None matches everything)"""
+        if category is None:
+            return None
+        if category not in self.categories:
+            return np.zeros(self.n_docs, dtype=bool)
+        return np.asarray(self.category) == self.categories.index(category)
+
+    def document(self, local_id):
+        """Load one stored article by its segment-local id"""
+        start, end = int(self.doc_offsets[local_id]), int(self.doc_offsets[local_id + 1])
+        with open(os.path.join(self.seg_dir, "docs.jsonl"), "rb") as fh:
+            fh.seek(start)
+            return json.loads(fh.read(end - start))
+
+
+def merge_top_k(candidates, k, ranking=None):
+    """Fold per-segment candidates into a (scores, segments, local_ids) ranking, best first
+
+    ``ranking`` is an earlier result to merge into, so callers can fold
+    segments in one at a time.
+    """
+    parts = [ranking] if ranking is not None else []
+    parts += [(scores, np.full(len(scores), seg_index, dtype=np.int32), local_ids)
+              for scores, seg_index, local_ids in candidates]
+    if not parts:
+        return np.zeros(0, dtype=np.float32), np.zeros(0, dtype=np.int32), np.zeros(0, dtype=np.int32)
+    scores, segments, local_ids = (np.concatenate(column) for column in zip(*parts))
+    if len(scores) > k:
+        keep = np.argpartition(scores, -k)[-k:]
+        scores, segments, local_ids = scores[keep], segments[keep], local_ids[keep]
+    # Ties keep segment order, then doc id, as the tuple sort did
+    order = np.lexsort((local_ids, segments, -scores))
+    return scores[order], segments[order], local_ids[order]
+
+
+class SearchIndex:
+    """BM25 query engine over all segments listed in an index manifest"""
+
+    def __init__(self, index_dir):
+        self.index_dir = index_dir
+        self._manifest_mtime = None
+        self._dups_mtime = None
+        self.segments = []
+        self.dup_counts = np.zeros(0, dtype=np.int32)
+        self.term_stats = TermStats(os.path.join(index_dir, TFIDF_DIR))
+        self.refresh()
+
+    @classmethod
+    def exists(cls, index_dir):
+        return read_manifest(index_dir) is not None
+
+    @property
+    def version(self):
+        """Changes whenever a refresh picked up new segments or duplicate counts"""
+        return self._manifest_mtime, self._dups_mtime
+
+    def refresh(self):
+        """Pick up segments and duplicate counts published since the last refresh"""
+        dups_path = os.path.join(self.index_dir, "dedup", "dup_counts.npy")
+        if os.path.exists(dups_path) and os.path.getmtime(dups_path) != self._dups_mtime:
+            self._dups_mtime = os.path.getmtime(dups_path)
+            self.dup_counts = np.load(dups_path, mmap_mode="r")
+
+        path = os.path.join(self.index_dir, MANIFEST)
+        mtime = os.path.getmtime(path)
+        if mtime == self._manifest_mtime:
+            return False
+        manifest = read_manifest(self.index_dir)
+        loaded = {seg.seg_dir: seg for seg in self.segments}
+        self.segments = [
+            loaded.get(os.path.join(self.index_dir, name)) or Segment(os.path.join(self.index_dir, name))
+            for name in manifest["segments"]
+        ]
+        self.bases = np.cumsum([0] + [seg.n_docs for seg in self.segments])
+        self.n_docs = int(self.bases[-1])
+        total_len = sum(seg.total_len for seg in self.segments)
+        self.avgdl = total_len / self.n_docs if self.n_docs else 0.0
+        self.term_stats.refresh()
+        for seg in self.segments:
+            seg.refresh_norms(self.term_stats)
+        self._manifest_mtime = mtime
+        return True
+
+    def idf(self, term):
+        df = sum(seg.df(term) for seg in self.segments)
+        return np.log1p((self.n_docs - df + 0.5) / (df + 0.5)), df
+
+    def iter_candidates(self, query, k=10, category=None):
+        """Yield each segment's top ``k`` as (scores, segment_index, local_ids), segment by segment"""
+        terms = list(dict.fromkeys(tokenize(query)))
+        if not terms or not self.n_docs:
+            return
+        idfs = [np.float32(self.idf(term)[0]) for term in terms]
+
+        for seg_index, seg in enumerate(self.segments):
+            scores = self._score_segment(seg, terms, idfs)
+            if scores is None:
+                continue
+            mask = seg.category_mask(category)
+            if mask is not None:
+                scores[~mask] = 0.0
+            hits = np.flatnonzero(scores)
+            if len(hits) > k:
+                hits = hits[np.argpartition(scores[hits], -k)[-k:]]
+            yield scores[hits], seg_index, hits.astype(np.int32)
+
+    def search(self, query, k=10, category=None):
+        """Return the top ``k`` hits as (score, segment_index, local_id) tuples"""
+        scores, segments, local_ids = merge_top_k(self.iter_candidates(query, k, category), k)
+        return list(zip(scores.tolist(), segments.tolist(), local_ids.tolist()))
+
+    def _score_segment(self, seg, terms, idfs):
+        scores = None
+        norm = np.float32(BM25_K1 / self.avgdl)
+        base = np.float32(BM25_K1 * (1 - BM25_B))
+        for term, idf in zip(terms, idfs):
+            docs, tf = seg.postings(term)
+            if not len(docs):
+                continue
+            if scores is None:
+                scores = np.zeros(seg.n_docs, dtype=np.float32)
+            denom = tf + (base + np.float32(BM25_B) * norm * seg.doclen[docs])
+            scores[docs] += idf * tf * (BM25_K1 + 1) / denom
+        return scores
+
+    def cosine(self, query, hits):
+        """TF-IDF cosine similarity of ``query`` to each (score, seg, local) hit
+
+        Returns None when a hit lives in a segment without TF-IDF data.
+        """
+        if any(self.segments[seg_index].term_gid is None for _, seg_index, _ in hits):
+            return None
+        qtf = {}
+        for term in tokenize(query):
+            qtf[term] = qtf.get(term, 0) + 1
+        sims = np.zeros(len(hits), dtype=np.float64)
+
+        # Global ids of the query terms, from the first segment that has them
+        gids = {}
+        for seg in self.segments:
+            if seg.term_gid is None:
+                continue
+            for term in qtf:
+                term_id = seg.terms.get(term)
+                if term_id is not None and term not in gids:
+                    gids[term] = int(seg.term_gid[term_id])
+            if len(gids) == len(qtf):
+                break
+        if not gids:
+            return sims
+        terms = list(gids)
+        idfs = self.term_stats.idf(np.array([gids[t] for t in terms]))
+        qweights = sublinear_tf(np.array([qtf[t] for t in terms], dtype=np.float64)) * idfs
+        qweights /= np.linalg.norm(qweights)
+
+        by_segment = defaultdict(list)
+        for i, (_, seg_index, local_id) in enumerate(hits):
+            by_segment[seg_index].append((i, local_id))
+        for seg_index, members in by_segment.items():
+            seg = self.segments[seg_index]
+            rows = np.array([i for i, _ in members])
+            local = np.array([d for _, d in members], dtype=np.int32)
+            dots = np.zeros(len(local), dtype=np.float64)
+            for term, qweight, term_idf in zip(terms, qweights, idfs):
+                docs, tf = seg.postings(term)
+                # Postings are sorted by doc id, so hits are found by bisection
+                at = np.minimum(np.searchsorted(docs, local), max(len(docs) - 1, 0))
+                found = (docs[at] == local) if len(docs) else np.zeros(len(local), dtype=bool)
+                dots[found] += qweight * term_idf * sublinear_tf(tf[at[found]].astype(np.float64))
+            norms = np.asarray(seg.tfidf_norm[local], dtype=np.float64)
+            sims[rows] = np.divide(dots, norms, out=np.zeros_like(dots), where=norms > 0)
+        return np.clip(sims, 0.0, 1.0)
+
+    def document(self, seg_index, local_id):
+        return self.segments[seg_index].document(local_id)
+
+    def duplicates(self, seg_index, local_id):
+        """Number of near-duplicate copies folded into this article at ingest"""
+        doc_id = int(self.bases[seg_index]) + local_id
+        return int(self.dup_counts[doc_id]) if doc_id < len(self.dup_counts) else 0
+
+    def duplicate_counts(self, segments, local_ids):
+        """:meth:`duplicates` of many hits at once"""
+        doc_ids = self.bases[segments] + local_ids
+        known = doc_ids < len(self.dup_counts)
+        counts = np.zeros(len(doc_ids), dtype=np.int64)
+        counts[known] = np.asarray(self.dup_counts)[doc_ids[known]]
+        return counts
+
+    def story_keys(self, segments, local_ids):
+        """uint64 :func:`story_hash` of every hit"""
+        keys = np.zeros(len(local_ids), dtype=np.uint64)
+        for seg_index in np.unique(segments):
+            rows = segments == seg_index
+            seg = self.segments[seg_index]
+            if seg.story_key is not None:
+                keys[rows] = seg.story_key[local_ids[rows]]
+            else:
+                keys[rows] = [story_hash(seg.document(int(i))) for i in local_ids[rows]]
+        return keys
+
+    def sentiment(self, seg_index, local_id):
+        """Lexicon sentiment score in (-1, 1) computed at ingest"""
+        return float(self.segments[seg_index].sentiment[local_id])
+
+
+def build_index(paths, index_dir, rebuild=False, **writer_kwargs):
+    """Ingest corpus files into ``index_dir`` and return the number of articles"""
+    from .corpus import iter_articles
+
+    if rebuild and os.path.isdir(index_dir):
+        shutil.rmtree(index_dir)
+    with IndexWriter(index_dir, **writer_kwargs) as writer:
+        return writer.add_many(iter_articles(paths))
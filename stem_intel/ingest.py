@@ -0,0 +1,143 @@
+"""Ingestion of local article dumps into the search index and trend store
+
+    python -m stem_intel.ingest data/corpus --rebuild
+"""
+import argparse
+import os
+import shutil
+import time
+from datetime import date
+
+from .aggregates import AggregateStore
+from .config import AGGREGATE_DIR, CORPUS_COUNTERS, CORPUS_DIR, INDEX_DIR, TOPIC_DIR, TREND_DIR
+from .corpus import TokenBatch, article_text, batched, iter_articles
+from .counters import CounterStore, count_batch, mention_flags
+from .dedup import DedupIndex
+from .index import MENTION_FUNDING, SEGMENT_DOCS, DuplicateLog, IndexWriter, IngestedIds
+from .sentiment import score_tokens
+from .topics import TopicModel
+from .tsstore import TrendStore
+
+# Articles buffered before their daily counts are pushed to the trend store
+TREND_BATCH = 50_000
+
+# Articles tokenized together for near-duplicate hashing and sentiment scoring
+DEDUP_BATCH = 1024
+
+
+def ingest_articles(articles, index_dir=INDEX_DIR, trend_dir=TREND_DIR, rebuild=False,
+                    segment_docs=SEGMENT_DOCS, dedup=True, aggregate_dir=AGGREGATE_DIR,
+                    counter_path=CORPUS_COUNTERS, topic_dir=TOPIC_DIR):
+    """Index articles and record their daily counts, monthly aggregates and Home counters
+
+    Articles whose id was ingested before are skipped, so a repeat run over
+    the same corpus adds nothing. Near-duplicates of already indexed
+    articles are folded into their representative instead of being indexed,
+    and logged with their own date, category and source. When a topic model
+    has been fitted under ``topic_dir``, every article is filed under its
+    topic and keeps its feed's category as ``feed_category``. Returns
+    (indexed, duplicates).
+    """
+    if rebuild:
+        # All stores are derived from the corpus, so a rebuild resets them together
+        for path in (index_dir, trend_dir, aggregate_dir):
+            if path and os.path.isdir(path):
+                shutil.rmtree(path)
+        if counter_path and os.path.exists(counter_path):
+            os.remove(counter_path)
+
+    store = TrendStore(trend_dir) if trend_dir else None
+    aggregates = AggregateStore(aggregate_dir) if aggregate_dir else None
+    counters = CounterStore(counter_path) if counter_path else None
+    dedup_index = DedupIndex(os.path.join(index_dir, "dedup")) if dedup else None
+    ingested = IngestedIds(os.path.join(index_dir, "ingested_ids.npy"))
+    duplicate_log = DuplicateLog(index_dir)
+    topics = TopicModel.load(topic_dir) if topic_dir else None
+    days, categories = [], []
+    count = duplicates = 0
+    with IndexWriter(index_dir, segment_docs=segment_docs) as writer:
+        for batch in batched(articles, DEDUP_BATCH):
+            batch = [article for article, fresh in zip(batch, ingested.new(batch)) if fresh]
+            if not batch:
+                continue
+            tokens = TokenBatch([article_text(a) for a in batch])
+            if topics is not None:
+                for article, topic in zip(batch, topics.assign(tokens).tolist()):
+                    article.setdefault("feed_category", article["category"])
+                    if topic >= 0:
+                        article["category"] = topics.names[topic]
+            originals = (dedup_index.assign(batch, writer.next_doc_id, tokens) if dedup_index
+                         else [None] * len(batch))
+            scores = score_tokens(tokens).tolist()
+            # Scanned once from the full text and stored with the article, since stored documents drop the body
+            flags = mention_flags(tokens).tolist()
+            for article, original, score, flag in zip(batch, originals, scores, flags):
+                if original is not None:
+                    duplicates += 1
+                    duplicate_log.add(original, article)
+                    if aggregates is not None:
+                        aggregates.add(article["published"], article["category"], article["source"],
+                                       articles=0, duplicates=1)
+                    continue
+                article["sentiment_score"] = score
+                article["mentions"] = flag
+                if aggregates is not None:
+                    aggregates.add(article["published"], article["category"], article["source"],
+                                   sentiment=score, funding=bool(flag & MENTION_FUNDING))
+                writer.add(article)
+                count += 1
+                if store is not None:
+                    days.append((article["published"] or date.today().isoformat())[:10])
+                    categories.append(article["category"])
+            if counters is not None:
+                count_batch(counters, batch, flags, [original is None for original in originals])
+            if store is not None and len(days) >= TREND_BATCH:
+                store.add_counts(days, categories)
+                days, categories = [], []
+            if aggregates is not None and aggregates.pending >= TREND_BATCH:
+                aggregates.flush()
+        if dedup_index:
+            dedup_index.save()
+    duplicate_log.save()
+    ingested.save()
+    if store is not None:
+        store.add_counts(days, categories)
+    if aggregates is not None:
+        aggregates.save()
+    if counters is not None:
+        counters.save()
+    return count, duplicates
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Build the STEM article search index")
+    parser.add_argument("paths", nargs="*", default=[CORPUS_DIR],
+                        help="JSONL/RSS/Atom files or directories (default: %(default)s)")
+    parser.add_argument("--index", default=INDEX_DIR, help="index directory (default: %(default)s)")
+    parser.add_argument("--trends", default=TREND_DIR, help="trend store directory (default: %(default)s)")
+    parser.add_argument("--aggregates", default=AGGREGATE_DIR,
+                        help="Track Patterns aggregate directory (default: %(default)s)")
+    parser.add_argument("--counters", default=CORPUS_COUNTERS,
+                        help="Home page corpus counter file (default: %(default)s)")
+    parser.add_argument("--rebuild", action="store_true", help="discard the existing index and derived stores first")
+    parser.add_argument("--no-dedup", action="store_true", help="index near-duplicate articles too")
+    parser.add_argument("--segment-docs", type=int, default=SEGMENT_DOCS,
+                        help="articles buffered per segment (default: %(default)s)")
+    parser.add_argument("--topics", default=TOPIC_DIR,
+                        help="topic model directory, used when a model was fitted there (default: %(default)s)")
+    parser.add_argument("--no-topics", action="store_true", help="keep the feed categories even if topics exist")
+    args = parser.parse_args(argv)
+
+    start = time.perf_counter()
+    count, duplicates = ingest_articles(iter_articles(args.paths), args.index, args.trends,
+                                        rebuild=args.rebuild, segment_docs=args.segment_docs,
+                                        dedup=not args.no_dedup, aggregate_dir=args.aggregates,
+                                        counter_path=args.counters,
+                                        topic_dir=None if args.no_topics else args.topics)
+    elapsed = time.perf_counter() - start
+    print(f"Indexed {count:,} articles into {args.index} in {elapsed:.1f}s "
+          f"({duplicates:,} near-duplicates folded into existing stories)")
+
+
+if __name__ == "__main__":
+    main()
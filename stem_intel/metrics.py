@@ -0,0 +1,223 @@
+"""In-process instrumentation: timed spans in a ring buffer, Prometheus text out
+
+Pages and hot functions are wrapped in :func:`span` / :func:`timed`, which
+record wall time and resident-memory delta into a fixed-size ring buffer
+shared by every session of the process. Per-name counters and sums are kept
+alongside so totals survive the buffer wrapping; quantiles are computed from
+the samples still in the buffer. :func:`prometheus_text` renders everything
+in the Prometheus text exposition format, and the recorder rewrites
+``METRICS_FILE`` (for a node_exporter textfile collector) at most every
+``DUMP_INTERVAL`` seconds.
+"""
+import functools
+import os
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+
+import numpy as np
+
+from .config import DATA_DIR
+
+RING_SIZE = 4096
+
+# Set STEM_METRICS_FILE to an empty string to disable the periodic dump
+METRICS_FILE = os.environ.get("STEM_METRICS_FILE", os.path.join(DATA_DIR, "metrics.prom"))
+DUMP_INTERVAL = 15.0  # seconds
+
+QUANTILES = (0.5, 0.9, 0.99)
+
+try:
+    _PAGE_SIZE = os.sysconf("SC_PAGE_SIZE")
+except (AttributeError, ValueError, OSError):
+    _PAGE_SIZE = 4096
+
+
+def rss_bytes():
+    """Current resident set size, or peak RSS where /proc is unavailable"""
+    try:
+        with open("/proc/self/statm", "rb") as fh:
+            return int(fh.read().split()[1]) * _PAGE_SIZE
+    except OSError:
+        try:
+            import resource
+        except ImportError:
+            return 0
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # ru_maxrss is KiB on Linux and bytes on macOS
+        return peak if os.uname().sysname == "Darwin" else peak * 1024
+
+
+class Sample:
+    """One finished (or running) span"""
+
+    __slots__ = ("name", "kind", "started", "wall_ms", "mem_delta", "error")
+
+    def __init__(self, name, kind):
+        self.name = name
+        self.kind = kind
+        self.started = time.time()
+        self.wall_ms = 0.0
+        self.mem_delta = 0
+        self.error = False
+
+    def as_dict(self):
+        return {slot: getattr(self, slot) for slot in self.__slots__}
+
+
+class Recorder:
+    """Thread-safe ring buffer of spans with per-name running totals"""
+
+    def __init__(self, size=RING_SIZE, dump_path=METRICS_FILE, dump_interval=DUMP_INTERVAL):
+        self.samples = deque(maxlen=size)
+        self.totals = {}
+        self.started = time.time()
+        self.dump_path = dump_path
+        self.dump_interval = dump_interval
+        self._last_dump = 0.0
+        self._lock = threading.Lock()
+
+    def record(self, sample):
+        with self._lock:
+            self.samples.append(sample)
+            count, wall, errors = self.totals.get((sample.kind, sample.name), (0, 0.0, 0))
+            self.totals[(sample.kind, sample.name)] = (count + 1, wall + sample.wall_ms, errors + sample.error)
+            due = self.dump_path and time.monotonic() - self._last_dump >= self.dump_interval
+            if due:
+                self._last_dump = time.monotonic()
+        if due:
+            self.dump(self.dump_path)
+
+    @contextmanager
+    def span(self, name, kind="function"):
+        sample = Sample(name, kind)
+        mem = rss_bytes()
+        start = time.perf_counter()
+        try:
+            yield sample
+        except BaseException:
+            sample.error = True
+            raise
+        finally:
+            sample.wall_ms = 1000 * (time.perf_counter() - start)
+            sample.mem_delta = rss_bytes() - mem
+            self.record(sample)
+
+    def snapshot(self):
+        with self._lock:
+            return list(self.samples), dict(self.totals)
+
+    def last(self, name):
+        """Most recent sample recorded under ``name``, or None"""
+        with self._lock:
+            for sample in reversed(self.samples):
+                if sample.name == name:
+                    return sample
+        return None
+
+    def summary(self):
+        """Per (kind, name) statistics over the samples still in the buffer"""
+        samples, totals = self.snapshot()
+        grouped = {}
+        for sample in samples:
+            grouped.setdefault((sample.kind, sample.name), []).append(sample)
+        rows = []
+        for key, group in sorted(grouped.items()):
+            wall = np.array([s.wall_ms for s in group])
+            count, total_ms, errors = totals[key]
+            rows.append({
+                "kind": key[0], "name": key[1], "calls": count, "errors": errors,
+                "total_ms": round(total_ms, 1),
+                **{f"p{int(q * 100)}_ms": round(float(np.quantile(wall, q)), 2) for q in QUANTILES},
+                "max_ms": round(float(wall.max()), 2),
+                "mean_mem_delta_kib": round(float(np.mean([s.mem_delta for s in group])) / 1024, 1),
+            })
+        return rows
+
+    def prometheus_text(self):
+        """All metrics in the Prometheus text exposition format"""
+        samples, totals = self.snapshot()
+        walls = {}
+        mems = {}
+        for sample in samples:
+            walls.setdefault((sample.kind, sample.name), []).append(sample.wall_ms)
+            mems.setdefault((sample.kind, sample.name), []).append(sample.mem_delta)
+
+        lines = [
+            "# HELP stem_span_duration_seconds Wall time of instrumented pages and functions.",
+            "# TYPE stem_span_duration_seconds summary",
+        ]
+        for (kind, name), (count, total_ms, _) in sorted(totals.items()):
+            labels = f'kind="{kind}",name="{name}"'
+            for q in QUANTILES:
+                value = np.quantile(walls[(kind, name)], q) / 1000 if (kind, name) in walls else 0.0
+                lines.append(f'stem_span_duration_seconds{{{labels},quantile="{q}"}} {value:.6f}')
+            lines.append(f"stem_span_duration_seconds_sum{{{labels}}} {total_ms / 1000:.6f}")
+            lines.append(f"stem_span_duration_seconds_count{{{labels}}} {count}")
+        lines += [
+            "# HELP stem_span_errors_total Instrumented calls that raised.",
+            "# TYPE stem_span_errors_total counter",
+        ]
+        for (kind, name), (_, _, errors) in sorted(totals.items()):
+            lines.append(f'stem_span_errors_total{{kind="{kind}",name="{name}"}} {errors}')
+        lines += [
+            "# HELP stem_span_memory_delta_bytes Mean resident memory change per call (recent calls).",
+            "# TYPE stem_span_memory_delta_bytes gauge",
+        ]
+        for (kind, name), deltas in sorted(mems.items()):
+            lines.append(f'stem_span_memory_delta_bytes{{kind="{kind}",name="{name}"}} {np.mean(deltas):.0f}')
+        lines += [
+            "# HELP stem_process_resident_memory_bytes Resident set size.",
+            "# TYPE stem_process_resident_memory_bytes gauge",
+            f"stem_process_resident_memory_bytes {rss_bytes()}",
+            "# HELP stem_process_start_time_seconds Unix time the process started recording.",
+            "# TYPE stem_process_start_time_seconds gauge",
+            f"stem_process_start_time_seconds {self.started:.3f}",
+        ]
+        return "\n".join(lines) + "\n"
+
+    def dump(self, path):
+        """Atomically write :meth:`prometheus_text` to ``path``"""
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        tmp = f"{path}.{os.getpid()}.tmp"
+        with open(tmp, "w", encoding="utf-8") as fh:
+            fh.write(self.prometheus_text())
+        os.replace(tmp, path)
+
+    def uptime(self):
+        return time.time() - self.started
+
+
+RECORDER = Recorder()
+
+
+def span(name, kind="function"):
+    """Context manager recording one span into the process-wide recorder"""
+    return RECORDER.span(name, kind)
+
+
+def timed(name=None, kind="function"):
+    """Decorator recording every call of a function as a span"""
+    def decorate(fn):
+        label = name or fn.__name__
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            with RECORDER.span(label, kind):
+                return fn(*args, **kwargs)
+        return wrapper
+    return decorate
+
+
+def format_duration(seconds):
+    """Compact human duration such as ``3d 4h`` or ``12m 5s``"""
+    seconds = int(seconds)
+    days, rem = divmod(seconds, 86400)
+    hours, rem = divmod(rem, 3600)
+    minutes, secs = divmod(rem, 60)
+    if days:
+        return f"{days}d {hours}h"
+    if hours:
+        return f"{hours}h {minutes}m"
+    return f"{minutes}m {secs}s"
@@ -0,0 +1,132 @@
+"""Process-pool sharding of large trend windows and their pattern statistics
+
+With thousands of categories over multi-year daily series, assembling the
+trend window is column-by-column work that one process does serially. Here
+the categories are cut into one contiguous column shard per worker. Every
+worker writes its columns straight into a NumPy array backed by
+:mod:`multiprocessing.shared_memory` and, in the same pass over columns it
+already holds, reduces them to pattern statistics in a second shared block.
+Only shard bounds and category names cross the process boundary. The window
+is never copied into a worker just to be reduced: the statistics are O(n)
+reductions, cheaper than any copy.
+
+One pool of ``workers`` processes is started on first use and kept for the
+life of the process; the scenario engine submits its draw shards to the same
+pool (:func:`get_process_pool`). Workers come from a forkserver (spawn where
+that is not available) rather than forking the multi-threaded app server,
+and open the trend store's memory map themselves.
+"""
+import multiprocessing
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+import numpy as np
+
+from .config import TREND_WORKERS
+from .patterns import STAT_ROWS, pattern_stats
+
+
+class SharedArray:
+    """A NumPy array in a named shared-memory block"""
+
+    def __init__(self, shape, dtype, name=None):
+        dtype = np.dtype(dtype)
+        size = max(int(np.prod(shape)) * dtype.itemsize, 1)
+        self.shm = shared_memory.SharedMemory(name=name, create=name is None, size=size)
+        self.array = np.ndarray(shape, dtype, buffer=self.shm.buf)
+
+    @property
+    def spec(self):
+        """What another process needs to attach: (name, shape, dtype)"""
+        return self.shm.name, self.array.shape, self.array.dtype.str
+
+    @classmethod
+    def attach(cls, spec):
+        name, shape, dtype = spec
+        return cls(shape, dtype, name)
+
+    def close(self):
+        self.array = None
+        self.shm.close()
+
+    def unlink(self):
+        self.close()
+        self.shm.unlink()
+
+
+_pool = None
+_pool_lock = threading.Lock()
+
+
+def _context():
+    methods = multiprocessing.get_all_start_methods()
+    context = multiprocessing.get_context("forkserver" if "forkserver" in methods else "spawn")
+    if context.get_start_method() == "forkserver":
+        context.set_forkserver_preload([__name__, "stem_intel.trends", "stem_intel.scenarios"])
+    return context
+
+
+def get_process_pool(workers):
+    """The process-wide pool, grown (never shrunk) to at least ``workers`` processes"""
+    global _pool
+    with _pool_lock:
+        if _pool is None or _pool[0] < workers:
+            if _pool is not None:
+                _pool[1].shutdown(wait=True)
+            _pool = (workers, ProcessPoolExecutor(workers, mp_context=_context()))
+        return _pool[1]
+
+
+def shard_bounds(n, workers):
+    """(lo, hi) column ranges splitting ``n`` columns into at most ``workers`` shards"""
+    edges = np.linspace(0, n, min(workers, n) + 1).astype(int)
+    return list(zip(edges[:-1].tolist(), edges[1:].tolist()))
+
+
+# Trend stores opened by this (worker) process, by path
+_stores = {}
+
+
+def _trend_shard(values_spec, stats_spec, lo, categories, timeframe, end, store_path):
+    from .trends import trend_column, trend_dates
+    from .tsstore import TrendStore
+
+    store = _stores.get(store_path)
+    if store is None:
+        store = _stores[store_path] = TrendStore(store_path)
+    store.refresh()
+    dates = trend_dates(timeframe, end)
+    values, stats = SharedArray.attach(values_spec), SharedArray.attach(stats_spec)
+    try:
+        for j, category in enumerate(categories):
+            values.array[:, lo + j] = trend_column(store, category, timeframe, dates, end)
+        # Reduced while the shard's columns are still hot in this worker's cache
+        stats.array[:, lo:lo + len(categories)] = pattern_stats(values.array[:, lo:lo + len(categories)])
+    finally:
+        values.close()
+        stats.close()
+
+
+def parallel_trend_window(categories, timeframe, end, store, workers=TREND_WORKERS):
+    """(window, stats): the float32 (days x categories) trend window and its pattern statistics
+
+    ``stats`` is the :func:`~stem_intel.patterns.pattern_stats` block of the
+    window, computed by the same workers that filled its columns.
+    """
+    from .trends import trend_dates
+
+    categories = list(categories)
+    values = SharedArray((len(trend_dates(timeframe, end)), len(categories)), np.float32)
+    stats = SharedArray((len(STAT_ROWS), len(categories)), np.float64)
+    try:
+        pool = get_process_pool(workers)
+        futures = [pool.submit(_trend_shard, values.spec, stats.spec, lo, categories[lo:hi], timeframe, end,
+                               store.path)
+                   for lo, hi in shard_bounds(len(categories), workers)]
+        for future in futures:
+            future.result()
+        return values.array.copy(), stats.array.copy()
+    finally:
+        values.unlink()
+        stats.unlink()
@@ -0,0 +1,97 @@
+"""Vectorized pattern extraction over whole trend matrices
+
+The trend page treats its data as a (time x category) matrix; every statistic
+here is a single NumPy reduction along the time axis, so the cost of adding a
+category is one more column in the same pass rather than another Python loop
+iteration with its own ``np.std``/``idxmax``/``strftime`` calls.
+
+The numeric pass (:func:`pattern_stats`) is separate from the labelling, so
+the process pool that assembles large trend windows can reduce each column
+shard as it fills it (:mod:`stem_intel.parallel`); the blocks are labelled once.
+"""
+import numpy as np
+import pandas as pd
+
+from .metrics import timed
+
+# Standard deviation thresholds for the volatility labels
+HIGH_VOLATILITY = 10
+MODERATE_VOLATILITY = 5
+
+MOMENTUM_WINDOW = 7
+
+# Keys of the per-category pattern dicts shared with the rest of the app
+PATTERN_FIELDS = ("trend_direction", "volatility", "growth_rate", "peak_period", "recent_momentum")
+
+
+# Rows of the numeric statistics block from pattern_stats()
+STAT_ROWS = ("first", "last", "std", "peak", "increasing")
+
+
+def pattern_stats(values):
+    """Numeric pattern statistics of every column, as a (len(STAT_ROWS) x category) float64 block"""
+    values = np.asarray(values, dtype=np.float64)
+    if values.ndim == 1:
+        values = values[:, None]
+    recent = values[-MOMENTUM_WINDOW:]
+    prior = values[-2 * MOMENTUM_WINDOW:-MOMENTUM_WINDOW]
+    if len(prior):
+        increasing = recent.mean(axis=0) > prior.mean(axis=0)
+    else:
+        increasing = np.zeros(values.shape[1], dtype=bool)
+    return np.stack([values[0], values[-1], values.std(axis=0), values.argmax(axis=0), increasing])
+
+
+def label_patterns(stats, dates):
+    """Pattern dict of 1-D arrays from a :func:`pattern_stats` block"""
+    first, last, std, peak, increasing = stats
+    growth = np.divide((last - first) * 100, first, out=np.zeros_like(first), where=first != 0)
+    peak_dates = pd.DatetimeIndex(dates)[peak.astype(np.intp)].strftime("%Y-%m-%d")
+    return {
+        "last": last,
+        "growth_rate": growth,
+        "std": std,
+        "trend_direction": np.where(last > first, "Upward", "Downward"),
+        "volatility": np.select([std > HIGH_VOLATILITY, std > MODERATE_VOLATILITY], ["High", "Moderate"], "Low"),
+        "peak_period": np.asarray(peak_dates),
+        "recent_momentum": np.where(increasing > 0, "Increasing", "Decreasing"),
+    }
+
+
+def pattern_matrix(values, dates):
+    """Compute pattern statistics for every column of a (time x category) array
+
+    Returns a dict of 1-D arrays, one entry per column: ``last``,
+    ``growth_rate``, ``std``, ``trend_direction``, ``volatility``,
+    ``peak_period`` and ``recent_momentum``.
+    """
+    return label_patterns(pattern_stats(values), dates)
+
+
+@timed()
+def extract_patterns_batch(data, categories, stats=None):
+    """Extract patterns for all ``categories`` of a trend frame in one pass
+
+    Returns a DataFrame indexed by category; categories missing from ``data``
+    are skipped. ``stats`` is an already computed :func:`pattern_stats` block
+    of the frame's category columns (in frame order), e.g. a shared trend
+    window's; only labelling is left to do then.
+    """
+    columns = [c for c in categories if c in data.columns]
+    if not columns or data.empty:
+        return pd.DataFrame(columns=["last", "growth_rate", "std", "trend_direction",
+                                     "volatility", "peak_period", "recent_momentum"])
+    if stats is not None:
+        position = {c: i for i, c in enumerate(c for c in data.columns if c != "Date")}
+        patterns = label_patterns(stats[:, [position[c] for c in columns]], data["Date"])
+    else:
+        patterns = pattern_matrix(data[columns].to_numpy(), data["Date"])
+    return pd.DataFrame(patterns, index=columns)
+
+
+def extract_patterns(data, category):
+    """Extract meaningful patterns from trend data"""
+    if category not in data.columns:
+        return {}
+    row = extract_patterns_batch(data, [category]).iloc[0]
+    return row[list(PATTERN_FIELDS)].to_dict()
@@ -0,0 +1,270 @@
+"""Monte Carlo scenario engine behind the Agentic AI page
+
+Driver variables are estimated from the data the app already keeps: monthly
+coverage growth and its volatility from the trend store, and the funding and
+positive-coverage shares of the field from the Track Patterns aggregates.
+Each draw samples the drivers from their estimation uncertainty, a
+coverage outcome from the implied log-normal growth and a random walk of
+the shares, all as flat NumPy arrays; a scenario's probability is the share of draws meeting its
+thresholds at the scenario's horizon.
+
+Because growth over ``T`` months is ``T * drift + sigma * sqrt(T) * z``, one
+set of draws answers every horizon: scenarios with different timelines share
+the same draws. Complexity scales the number of draws and which drivers are
+sampled rather than held at their point estimates. Draws are generated in
+fixed-size shards with their own seeds, so results are identical whether the
+shards run in-process or on the process-wide pool of :mod:`stem_intel.parallel`.
+"""
+import math
+import os
+import zlib
+
+import numpy as np
+
+from .parallel import get_process_pool
+from .trends import DEMO_MONTHS, get_trend_store, trend_categories, trend_level
+
+# Complexity -> (draws, drivers sampled rather than fixed at their estimates)
+COMPLEXITY = {
+    "Basic": (20_000, ("growth", "volatility")),
+    "Intermediate": (100_000, ("growth", "volatility", "funding")),
+    "Advanced": (300_000, ("growth", "volatility", "funding", "sentiment")),
+    "Expert": (1_000_000, ("growth", "volatility", "funding", "sentiment", "spillover")),
+}
+
+# Trend store names of focus areas that differ from their corpus category
+TREND_CATEGORIES = {"Artificial Intelligence": "AI & Machine Learning"}
+
+HISTORY_MONTHS = DEMO_MONTHS
+
+# Monthly log-growth lift per unit deviation of a share from its estimate
+FUNDING_LIFT = 0.1
+SENTIMENT_LIFT = 0.05
+
+# Monthly random-walk step (logit scale) of the funding and positive shares
+SHARE_DRIFT = 0.15
+
+# Beta priors (hits, misses) for fields without coverage in the corpus
+FUNDING_PRIOR = (2, 8)
+SENTIMENT_PRIOR = (5, 5)
+
+SHARD_DRAWS = 250_000
+FAN_DRAWS = 20_000
+QUANTILES = (0.05, 0.25, 0.5, 0.75, 0.95)
+
+# Processes to shard draws over; 0 or 1 runs in-process
+WORKERS = int(os.environ.get("STEM_SCENARIO_WORKERS", "0"))
+
+# Scenario catalog: thresholds on coverage growth (fraction) and on the
+# funding / positive-coverage shares relative to today's
+SCENARIOS = {
+    "Artificial Intelligence": [
+        {
+            "title": "AI Governance Revolution",
+            "description": "Autonomous AI systems begin self-regulating through distributed governance protocols",
+            "impact": "High",
+            "timeline": (None, 0),
+            "requires": {"growth": 0.15, "sentiment": 1.0},
+        },
+        {
+            "title": "Human-AI Collaborative Networks",
+            "description": "Emergence of hybrid intelligence networks where AI agents and humans work seamlessly",
+            "impact": "Very High",
+            "timeline": (-6, 0),
+            "requires": {"growth": 0.3},
+        },
+    ],
+    "Biotechnology": [
+        {
+            "title": "Personalized Medicine AI Agents",
+            "description": "AI agents autonomously design personalized treatments for individual patients",
+            "impact": "Very High",
+            "timeline": (None, 0),
+            "requires": {"growth": 0.15, "funding": 1.0},
+        },
+        {
+            "title": "Synthetic Biology Automation",
+            "description": "Autonomous lab systems design and test new biological systems without human intervention",
+            "impact": "High",
+            "timeline": (6, 12),
+            "requires": {"growth": 0.25, "funding": 1.2},
+        },
+    ],
+    "Quantum Computing": [
+        {
+            "title": "Quantum AI Integration",
+            "description": "Quantum computers enable AI agents with unprecedented problem-solving capabilities",
+            "impact": "Revolutionary",
+            "timeline": (12, 24),
+            "requires": {"growth": 0.5},
+        },
+    ],
+}
+
+
+def scenario_seed(*parts):
+    """Stable seed for a scenario run (``hash()`` is salted per process)"""
+    return zlib.crc32("|".join(map(str, parts)).encode("utf-8"))
+
+
+def _share_prior(hits, total, prior):
+    if total <= 0:
+        return prior
+    return hits + 1.0, total - hits + 1.0
+
+
+def estimate_drivers(topic, store=None, aggregates=None):
+    """Point estimates and uncertainty of every driver for one field"""
+    store = store or get_trend_store()
+    category = TREND_CATEGORIES.get(topic, topic)
+    others = [c for c in trend_categories(store) if c != category]
+    monthly = trend_level([category] + others, HISTORY_MONTHS, "M", store).to_numpy(dtype=np.float64)
+    changes = np.diff(np.log1p(monthly), axis=0)
+    focus = changes[:, 0]
+    n = max(len(focus), 2)
+    sigma = float(focus.std(ddof=1)) if len(focus) > 1 else 0.1
+    drivers = {
+        "mu": float(focus.mean()) if len(focus) else 0.0,
+        "mu_se": sigma / math.sqrt(n),
+        "sigma": sigma,
+        "dof": n - 1,
+        "mu_other": 0.0, "mu_other_se": 0.0, "rho": 0.0,
+    }
+    if others and len(focus) > 2:
+        market = changes[:, 1:].mean(axis=1)
+        drivers["mu_other"] = float(market.mean())
+        drivers["mu_other_se"] = float(market.std(ddof=1)) / math.sqrt(n)
+        if market.std() > 0 and focus.std() > 0:
+            drivers["rho"] = float(np.corrcoef(focus, market)[0, 1])
+
+    funding, sentiment = FUNDING_PRIOR, SENTIMENT_PRIOR
+    if aggregates is not None:
+        window = aggregates.window(12)
+        if topic in window.index:
+            row = window.loc[topic]
+            funding = _share_prior(row["funding"], row["articles"], FUNDING_PRIOR)
+            sentiment = _share_prior(row["positive"], row["articles"], SENTIMENT_PRIOR)
+    drivers["funding"], drivers["sentiment"] = funding, sentiment
+    return drivers
+
+
+def _simulate_shard(drivers, sampled, n, seed):
+    """Per-draw drift, volatility, shocks and shares for one shard (float32)"""
+    rng = np.random.default_rng(seed)
+    d = drivers
+    mu = rng.normal(d["mu"], d["mu_se"], n) if "growth" in sampled else np.full(n, d["mu"])
+    sigma = (d["sigma"] * np.sqrt(rng.chisquare(d["dof"], n) / d["dof"]) if "volatility" in sampled
+             else np.full(n, d["sigma"]))
+    funding_mean = d["funding"][0] / sum(d["funding"])
+    sentiment_mean = d["sentiment"][0] / sum(d["sentiment"])
+    funding = rng.beta(*d["funding"], n) if "funding" in sampled else np.full(n, funding_mean)
+    sentiment = rng.beta(*d["sentiment"], n) if "sentiment" in sampled else np.full(n, sentiment_mean)
+    drift = mu + FUNDING_LIFT * (funding - funding_mean) + SENTIMENT_LIFT * (sentiment - sentiment_mean)
+    if "spillover" in sampled:
+        drift += d["rho"] * rng.normal(0.0, d["mu_other_se"], n)
+    return {
+        "drift": drift.astype(np.float32),
+        "sigma": sigma.astype(np.float32),
+        "z": rng.standard_normal(n, dtype=np.float32),
+        "funding": funding.astype(np.float32),
+        "funding_z": rng.standard_normal(n, dtype=np.float32),
+        "sentiment": sentiment.astype(np.float32),
+        "sentiment_z": rng.standard_normal(n, dtype=np.float32),
+    }
+
+
+def _logit(p):
+    p = np.clip(p, 1e-6, 1 - 1e-6)
+    return np.log(p / (1 - p))
+
+
+class Simulation:
+    """Monte Carlo draws of one field's drivers, readable at any horizon"""
+
+    def __init__(self, drivers, draws, sampled, seed, workers=WORKERS):
+        self.drivers = drivers
+        self.sampled = sampled
+        sizes = [SHARD_DRAWS] * (draws // SHARD_DRAWS) + ([draws % SHARD_DRAWS] if draws % SHARD_DRAWS else [])
+        seeds = np.random.SeedSequence(seed).spawn(len(sizes))
+        args = ([drivers] * len(sizes), [sampled] * len(sizes), sizes, seeds)
+        if workers > 1 and len(sizes) > 1:
+            shards = list(get_process_pool(workers).map(_simulate_shard, *args))
+        else:
+            shards = list(map(_simulate_shard, *args))
+        self.draws = {key: np.concatenate([s[key] for s in shards]) for key in shards[0]}
+        self.baseline = {
+            "funding": drivers["funding"][0] / sum(drivers["funding"]),
+            "sentiment": drivers["sentiment"][0] / sum(drivers["sentiment"]),
+        }
+
+    def __len__(self):
+        return len(self.draws["z"])
+
+    def at(self, months):
+        """Coverage growth and shares ``months`` ahead, one value per draw"""
+        d = self.draws
+        root = math.sqrt(max(months, 0))
+        growth = np.expm1(months * d["drift"] + root * d["sigma"] * d["z"])
+
+        def share(key):
+            moved = _logit(d[key]) + SHARE_DRIFT * root * d[f"{key}_z"]
+            return 1 / (1 + np.exp(-moved))
+
+        return {"growth": growth, "funding": share("funding"), "sentiment": share("sentiment")}
+
+    def fan(self, months):
+        """Quantiles of coverage growth for each month 1..``months``, shape (months, Q)"""
+        m = min(len(self), FAN_DRAWS)
+        rng = np.random.default_rng(0)
+        steps = self.draws["drift"][:m] + self.draws["sigma"][:m] * rng.standard_normal((months, m), np.float32)
+        return np.quantile(np.expm1(np.cumsum(steps, axis=0)), QUANTILES, axis=1).T
+
+    def probability(self, requires, months):
+        """Share of draws meeting ``requires`` with its 95% Wilson interval and the hits mask"""
+        metrics = self.at(months)
+        hits = np.ones(len(self), dtype=bool)
+        for key, threshold in requires.items():
+            limit = threshold if key == "growth" else threshold * self.baseline[key]
+            hits &= metrics[key] >= limit
+        n, p = len(self), float(hits.mean())
+        z = 1.96
+        centre = (p + z * z / (2 * n)) / (1 + z * z / n)
+        half = z * math.sqrt(p * (1 - p) / n + z * z / (4 * n * n)) / (1 + z * z / n)
+        return p, (max(centre - half, 0.0), min(centre + half, 1.0)), hits, metrics
+
+
+def _timeline(timeframe, offsets):
+    lo, hi = offsets
+    if lo is None:
+        return f"{timeframe + hi} months"
+    return f"{timeframe + lo} to {timeframe + hi} months"
+
+
+def run_scenarios(topic, timeframe, complexity, store=None, aggregates=None, workers=WORKERS):
+    """Simulate the scenarios of a field; returns (scenario dicts, Simulation)
+
+    Each scenario carries its probability in percent, a 95% confidence band
+    on it, and growth quantiles over the draws in which it happens. Fields
+    without their own scenarios use the Artificial Intelligence ones, driven
+    by the field's own data.
+    """
+    draws, sampled = COMPLEXITY.get(complexity, COMPLEXITY["Basic"])
+    drivers = estimate_drivers(topic, store, aggregates)
+    simulation = Simulation(drivers, draws, sampled, scenario_seed(topic, timeframe, complexity), workers)
+    results = []
+    for scenario in SCENARIOS.get(topic, SCENARIOS["Artificial Intelligence"]):
+        horizon = timeframe + scenario["timeline"][1]
+        p, band, hits, metrics = simulation.probability(scenario["requires"], horizon)
+        growth = metrics["growth"][hits] if hits.any() else metrics["growth"]
+        results.append({
+            "title": scenario["title"],
+            "description": scenario["description"],
+            "probability": round(100 * p),
+            "probability_band": (100 * band[0], 100 * band[1]),
+            "growth_quantiles": dict(zip(QUANTILES, np.quantile(growth, QUANTILES).tolist())),
+            "requires": scenario["requires"],
+            "impact": scenario["impact"],
+            "timeline": _timeline(timeframe, scenario["timeline"]),
+            "horizon": horizon,
+        })
+    return results, simulation
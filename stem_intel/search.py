@@ -0,0 +1,220 @@
+"""News search over the local article index, shaped for the Search & Analyze page
+
+A query runs as a generator pipeline, one segment at a time:
+
+* retrieve: BM25 candidates of a segment, as soon as it is scored;
+* rank: the running top-k merged across the segments seen so far;
+* dedupe: hits repeating a better-ranked hit's URL (or title) are folded into
+  it, by the story keys stored at ingest, before anything is paged or counted;
+* enrich: relevance, sentiment, dates and insights for the rows shown.
+
+:func:`stream_search` yields the enriched first page after every segment, so
+the page can show results while later segments are still being scored, and
+finishes with the complete :class:`ResultSet`. :func:`shared_results` is how
+the page and the batch API get result sets: one per query and index version,
+shared in memory by every session and kept in the analysis cache across
+restarts.
+"""
+from datetime import datetime
+
+import numpy as np
+
+from .aggregates import POSITIVE_SCORE
+from .analysis_cache import get_analysis_cache
+from .corpus import tokenize
+from .index import merge_top_k
+from .metrics import timed
+from .sentiment import sentiment_label
+from .shared import SHARED
+
+DEFAULT_TOP_K = 20
+
+# Hits ranked per query on the Search page, and result rows shown per page
+MAX_HITS = 5000
+PAGE_SIZE = 10
+
+# Bumped whenever pickled ResultSets change shape, so stale cache entries are not reused
+RESULT_FORMAT = 2
+
+
+def _article_date(doc):
+    if doc.get("published"):
+        try:
+            return datetime.fromisoformat(doc["published"])
+        except ValueError:
+            pass
+    return datetime.now()
+
+
+def _key_insights(doc, query_terms):
+    if doc.get("key_insights"):
+        return doc["key_insights"]
+    text = set(tokenize(" ".join([doc.get("title", ""), doc.get("summary", "")])))
+    matched = [t for t in query_terms if t in text]
+    insights = []
+    if matched:
+        insights.append(f"Matches: {', '.join(matched)}")
+    if doc.get("source"):
+        insights.append(f"Source: {doc['source']}")
+    insights.append(f"Category: {doc.get('category', 'General')}")
+    return insights
+
+
+class ResultSet:
+    """Ranked hits of one query, materialized into result dicts a page at a time
+
+    Scores, relevance and sentiment of every hit are kept as arrays, so the
+    page's summary metrics are reductions over them rather than over dicts;
+    stored documents are only read for the rows actually shown. Duplicate
+    stories are folded once, up front, so pages, cursors and counts all refer
+    to the same sequence.
+    """
+
+    def __init__(self, index, query, category, ranking):
+        self.query = query
+        self.category = category
+        self._index = index
+        self._query_terms = list(dict.fromkeys(tokenize(query)))
+        self.scores, self.segments, self.local_ids, self.duplicates = _dedupe(index, *ranking)
+
+        hits = list(zip(self.scores.tolist(), self.segments.tolist(), self.local_ids.tolist()))
+        cosine = index.cosine(query, hits) if hits else np.zeros(0)
+        if cosine is None:
+            # Index predates TF-IDF statistics: fall back to BM25 relative to the best hit
+            cosine = self.scores / self.scores[0]
+        self.relevance = np.rint(100 * np.asarray(cosine)).astype(np.int16)
+        self.sentiment = np.zeros(len(hits), dtype=np.float32)
+        for seg_index in np.unique(self.segments):
+            rows = self.segments == seg_index
+            self.sentiment[rows] = index.segments[seg_index].sentiment[self.local_ids[rows]]
+
+    def __len__(self):
+        return len(self.scores)
+
+    def __getstate__(self):
+        # Pickled without the index; bind() reattaches one after loading
+        return dict(self.__dict__, _index=None)
+
+    def bind(self, index):
+        self._index = index
+        return self
+
+    @property
+    def nbytes(self):
+        arrays = (self.scores, self.segments, self.local_ids, self.duplicates, self.relevance, self.sentiment)
+        return sum(a.nbytes for a in arrays)
+
+    def summary(self):
+        """Count, mean relevance and positive-sentiment count of all hits"""
+        return {
+            "count": len(self),
+            "avg_relevance": float(self.relevance.mean()) if len(self) else 0.0,
+            "positive": int((self.sentiment >= POSITIVE_SCORE).sum()),
+        }
+
+    def rows(self, start=0, stop=None):
+        """Result dicts for ranks ``start``..``stop``"""
+        results = []
+        for rank in range(start, min(len(self), len(self) if stop is None else stop)):
+            seg_index, local_id = int(self.segments[rank]), int(self.local_ids[rank])
+            doc = self._index.document(seg_index, local_id)
+            sentiment = float(self.sentiment[rank])
+            results.append({
+                "title": doc.get("title") or "(untitled)",
+                "summary": doc.get("summary", ""),
+                "url": doc.get("url", ""),
+                "source": doc.get("source", ""),
+                "category": doc.get("category", "General"),
+                "date": _article_date(doc),
+                "score": float(self.scores[rank]),
+                "relevance": int(self.relevance[rank]),
+                "sentiment": sentiment_label(sentiment),
+                "sentiment_score": sentiment,
+                "key_insights": _key_insights(doc, self._query_terms),
+                "duplicates": int(self.duplicates[rank]),
+            })
+        return results
+
+    def page(self, cursor=0, size=PAGE_SIZE):
+        """(rows, next cursor) of one page; the next cursor is None on the last page"""
+        cursor = max(0, min(int(cursor), len(self)))
+        # An empty page would hand back its own cursor forever
+        end = cursor + max(int(size), 1)
+        return self.rows(cursor, end), (end if end < len(self) else None)
+
+
+def _retrieve(index, query, category, k):
+    """Each segment's top ``k`` BM25 candidates, as the segment is scored"""
+    return index.iter_candidates(query, k, None if category == "All" else category)
+
+
+def _rank(candidates, k):
+    """The running top ``k`` ranking after every segment folded in"""
+    ranking = None
+    for candidate in candidates:
+        ranking = merge_top_k([candidate], k, ranking)
+        yield ranking
+
+
+def _dedupe(index, scores, segments, local_ids):
+    """Fold hits repeating a better-ranked hit's story into it
+
+    Returns the kept (scores, segments, local_ids) in rank order plus each
+    kept hit's duplicate count: its own near-duplicates from ingest, and one
+    for every folded hit along with that hit's own near-duplicates.
+    """
+    if not len(scores):
+        return scores, segments, local_ids, np.zeros(0, dtype=np.int64)
+    _, first, group = np.unique(index.story_keys(segments, local_ids), return_index=True, return_inverse=True)
+    kept = np.sort(first)
+    copies = np.bincount(group, weights=1 + index.duplicate_counts(segments, local_ids)).astype(np.int64)
+    return scores[kept], segments[kept], local_ids[kept], copies[group[kept]] - 1
+
+
+@timed()
+def search_results(index, query, category="All", k=MAX_HITS):
+    """Rank up to ``k`` hits for the Search & Analyze page without loading any document"""
+    return ResultSet(index, query, category, merge_top_k(_retrieve(index, query, category, k), k))
+
+
+def stream_search(index, query, category="All", k=MAX_HITS, first=PAGE_SIZE):
+    """Yield (rows, result_set) as the query progresses
+
+    ``rows`` are the enriched first ``first`` results of the ranking so far;
+    they are yielded whenever a segment changes them, with ``result_set``
+    None, and a last time with the complete :class:`ResultSet`.
+    """
+    ranking, shown = merge_top_k((), k), None
+    for ranking in _rank(_retrieve(index, query, category, k), k):
+        top = tuple(column[:first] for column in ranking)
+        if shown is None or not (np.array_equal(top[1], shown[1]) and np.array_equal(top[2], shown[2])):
+            shown = top
+            yield ResultSet(index, query, category, top).rows(), None
+    result_set = ResultSet(index, query, category, ranking)
+    yield result_set.rows(0, first), result_set
+
+
+def shared_results(index, query, category="All", compute=None):
+    """Handle to the query's :class:`ResultSet`, ranked once per index version
+
+    Sessions and API requests running the same query share the result set in
+    memory; the analysis cache keeps it across restarts. ``compute`` ranks on
+    a miss (default :func:`search_results`); the Search page passes one that
+    streams its first results. The set's ``created`` is when it was ranked.
+    Release the handle when done with it.
+    """
+    def cached():
+        inputs = {"query": " ".join(tokenize(query)), "category": category,
+                  "index": index.index_dir, "version": index.version, "format": RESULT_FORMAT}
+        entry, _ = get_analysis_cache().get_or_compute(
+            "search", inputs, compute or (lambda: search_results(index, query, category)))
+        result_set = entry.value.bind(index)
+        result_set.created = entry.created
+        return result_set
+
+    return SHARED.acquire(("search", index.index_dir, index.version, query, category), cached)
+
+
+def search_news(index, query, category="All", k=DEFAULT_TOP_K):
+    """Run a BM25 query and return result dicts for the top ``k`` hits"""
+    return search_results(index, query, category, k).rows(0, k)
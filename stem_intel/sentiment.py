@@ -0,0 +1,92 @@
+"""Batch lexicon sentiment scoring for ingested articles
+
+Scores are computed once at ingest and stored with the article, so page views
+only read them. A batch is scored as a single sparse product: the
+document-term count matrix (one nonzero per token occurrence, in COO form from
+a :class:`~stem_intel.corpus.TokenBatch`) times the lexicon weight vector,
+which ``np.bincount`` evaluates in one pass over the batch's tokens.
+"""
+import numpy as np
+
+from .corpus import TokenBatch, article_text
+
+# Weighted lexicon tuned for science and technology news
+LEXICON = {
+    # positive
+    "breakthrough": 2.5, "breakthroughs": 2.5, "milestone": 2.0, "record": 1.5, "success": 2.0,
+    "successful": 2.0, "successfully": 2.0, "promising": 1.8, "promise": 1.2, "improve": 1.2,
+    "improved": 1.2, "improves": 1.2, "improving": 1.2, "improvement": 1.2, "advance": 1.2,
+    "advances": 1.2, "advancing": 1.2, "boost": 1.5, "boosting": 1.5, "boosts": 1.5,
+    "growth": 1.0, "growing": 0.8, "strong": 1.2, "significant": 0.8, "efficient": 1.0,
+    "efficiency": 1.0, "cheaper": 1.0, "accurate": 1.0, "accuracy": 0.8, "innovative": 1.5,
+    "innovation": 1.2, "approved": 1.5, "approval": 1.5, "wins": 1.5, "win": 1.5, "won": 1.5,
+    "benefit": 1.5, "benefits": 1.5, "lasting": 0.8, "progress": 1.2, "opportunity": 1.2,
+    "opportunities": 1.2, "expand": 0.8, "expands": 0.8, "expanding": 0.8, "democratise": 1.0,
+    "democratize": 1.0, "secure": 1.0, "secures": 1.0, "funding": 0.6, "investment": 0.6,
+    "sustainable": 1.0, "resilient": 1.0, "trust": 1.0, "unprecedented": 1.2, "faster": 1.0,
+    "cut": 0.5, "cuts": 0.5, "reduce": 0.5, "reducing": 0.5, "neutralise": 1.0, "neutralize": 1.0,
+    "excellent": 2.5, "outstanding": 2.5, "remarkable": 2.0, "positive": 1.5, "robust": 1.0,
+    # negative
+    "setback": -2.0, "setbacks": -2.0, "failure": -2.0, "failures": -2.0, "fail": -2.0,
+    "fails": -2.0, "failed": -2.0, "struggle": -1.5, "struggles": -1.5, "struggling": -1.5,
+    "risk": -1.2, "risks": -1.2, "risky": -1.2, "concern": -1.2, "concerns": -1.2,
+    "warn": -1.2, "warns": -1.2, "warning": -1.2, "bias": -1.2, "biased": -1.2,
+    "delay": -1.5, "delays": -1.5, "delayed": -1.5,
+    "shortage": -1.5, "shortages": -1.5, "breach": -2.5, "leak": -2.0, "leaked": -2.0,
+    "exposed": -1.5, "exposes": -1.5, "misconfigured": -1.5, "decline": -1.5, "declined": -1.5,
+    "declines": -1.5, "slows": -1.0, "slowing": -1.0, "cautious": -0.8, "cancel": -1.5,
+    "cancelled": -1.5, "canceled": -1.5, "cancellations": -1.5, "surge": -0.3, "costs": -0.5,
+    "lethal": -1.5, "disease": -0.8, "outage": -1.5, "outages": -1.5, "threat": -1.5,
+    "threats": -1.5, "break": -0.5, "crisis": -2.0, "crises": -2.0, "pain": -1.2,
+    "controversy": -1.5, "controversial": -1.5, "lawsuit": -1.5, "ban": -1.5, "banned": -1.5,
+    "layoffs": -2.0, "fraud": -2.0, "vulnerability": -1.5, "vulnerabilities": -1.5,
+    "attack": -2.0, "attacks": -2.0, "hack": -2.0, "hacked": -2.0, "toxic": -1.5,
+    "poor": -1.5, "worse": -1.5, "worst": -2.0, "negative": -1.5, "loss": -1.5, "losses": -1.5,
+}
+
+# Tokens that flip the polarity of the token right after them
+NEGATORS = frozenset({"not", "no", "never", "without", "nor", "lack", "lacks"})
+
+# Normalization constant: score = raw / sqrt(raw**2 + ALPHA), in (-1, 1)
+ALPHA = 15.0
+
+LABELS = (
+    (0.5, "Very Positive"),
+    (0.05, "Positive"),
+    (-0.05, "Neutral"),
+    (-0.5, "Negative"),
+)
+
+
+def score_tokens(tokens):
+    """Sentiment score in (-1, 1) for every text of a :class:`TokenBatch`"""
+    if not len(tokens):
+        return np.zeros(tokens.n_docs, dtype=np.float32)
+    vocab = tokens.vocab.tolist()
+    weights = np.fromiter((LEXICON.get(t, 0.0) for t in vocab), dtype=np.float64, count=len(vocab))
+    negator = np.fromiter((t in NEGATORS for t in vocab), dtype=bool, count=len(vocab))
+
+    # Per-occurrence weights, sign-flipped when the previous token of the
+    # same document is a negator
+    occurrence = weights[tokens.inverse]
+    flipped = np.zeros(len(tokens), dtype=bool)
+    flipped[1:] = negator[tokens.inverse[:-1]] & (tokens.doc_of[1:] == tokens.doc_of[:-1])
+    occurrence[flipped] *= -1
+
+    raw = np.bincount(tokens.doc_of, weights=occurrence, minlength=tokens.n_docs)
+    return (raw / np.sqrt(raw * raw + ALPHA)).astype(np.float32)
+
+
+def score_articles(articles, tokens=None):
+    """Score a batch of articles; ``tokens`` reuses an existing TokenBatch"""
+    if tokens is None:
+        tokens = TokenBatch([article_text(a) for a in articles])
+    return score_tokens(tokens)
+
+
+def sentiment_label(score):
+    """Map a numeric score onto the labels shown in the app"""
+    for threshold, label in LABELS:
+        if score >= threshold:
+            return label
+    return "Very Negative"
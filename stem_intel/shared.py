@@ -0,0 +1,151 @@
+"""Process-wide data shared by every session through small handles
+
+Sessions used to keep their own trend DataFrames and search result lists in
+``st.session_state``, so a hundred users looking at the same categories held
+a hundred float64 copies. :class:`SharedStore` keeps one copy per key and
+gives each session a :class:`Handle`; a session's state is then a few
+handles of a hundred-odd bytes each.
+
+Entries are reference counted by their live handles. A handle releases its
+reference when the session replaces it or when the session itself is
+garbage collected, so entries in use are never evicted. Unreferenced entries
+stay around (for the next session asking for the same key) until their
+total size exceeds ``IDLE_BYTES``, then the least recently released go first.
+
+Trend windows are stored as a :class:`TrendMatrix`: one float32
+(days x categories) block whose date index is implied by its start date.
+"""
+import pickle
+import threading
+import weakref
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+
+# Bytes of unreferenced entries kept for reuse before the oldest are evicted
+IDLE_BYTES = 64 * 2 ** 20
+
+
+def _nbytes(value):
+    size = getattr(value, "nbytes", None)
+    return size if size is not None else len(pickle.dumps(value, pickle.HIGHEST_PROTOCOL))
+
+
+class TrendMatrix:
+    """float32 (days x categories) trend window with an implicit daily index
+
+    ``stats`` is the window's pattern statistics block when whoever built the
+    window computed it along the way (see :mod:`stem_intel.parallel`).
+    """
+
+    __slots__ = ("start", "values", "columns", "stats")
+
+    def __init__(self, start, values, columns, stats=None):
+        self.start = pd.Timestamp(start).normalize()
+        self.values = np.ascontiguousarray(values, dtype=np.float32)
+        self.values.setflags(write=False)
+        self.columns = list(columns)
+        self.stats = stats
+
+    @property
+    def nbytes(self):
+        return self.values.nbytes + (self.stats.nbytes if self.stats is not None else 0)
+
+    @property
+    def dates(self):
+        return pd.date_range(self.start, periods=len(self.values), freq="D")
+
+    def __len__(self):
+        return len(self.values)
+
+    def __getitem__(self, column):
+        return self.values[:, self.columns.index(column)]
+
+    def frame(self):
+        """The window as a trend-page DataFrame (a ``Date`` column plus a view of the block)"""
+        frame = pd.DataFrame(self.values, columns=self.columns, copy=False)
+        frame.insert(0, "Date", self.dates)
+        return frame
+
+
+class Handle:
+    """A session's reference to one shared entry"""
+
+    __slots__ = ("key", "_store", "_finalizer", "__weakref__")
+
+    def __init__(self, store, key):
+        self.key = key
+        self._store = store
+        self._finalizer = weakref.finalize(self, store.release, key)
+
+    def get(self):
+        return self._store.get(self.key)
+
+    def release(self):
+        """Drop the reference now rather than when the handle is collected"""
+        self._finalizer()
+
+
+class SharedStore:
+    """Reference-counted, deduplicated values keyed by what they were computed from"""
+
+    def __init__(self, idle_bytes=IDLE_BYTES):
+        self.idle_bytes = idle_bytes
+        self._entries = {}          # key -> [value, refs, nbytes]
+        self._idle = OrderedDict()  # unreferenced keys, least recently released first
+        self._idle_total = 0
+        self._lock = threading.Lock()
+
+    def acquire(self, key, compute):
+        """Handle to the value under ``key``, computing it if no one holds it"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._ref(key, entry)
+                return Handle(self, key)
+        # Compute outside the lock; a concurrent compute of the same key loses
+        value = compute()
+        with self._lock:
+            entry = self._entries.setdefault(key, [value, 0, _nbytes(value)])
+            self._ref(key, entry)
+        return Handle(self, key)
+
+    def _ref(self, key, entry):
+        if entry[1] == 0 and key in self._idle:
+            del self._idle[key]
+            self._idle_total -= entry[2]
+        entry[1] += 1
+
+    def get(self, key):
+        with self._lock:
+            return self._entries[key][0]
+
+    def release(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[1] == 0:
+                return
+            entry[1] -= 1
+            if entry[1]:
+                return
+            self._idle[key] = None
+            self._idle_total += entry[2]
+            while self._idle_total > self.idle_bytes and self._idle:
+                old, _ = self._idle.popitem(last=False)
+                self._idle_total -= self._entries.pop(old)[2]
+
+    def stats(self):
+        """Entry counts and bytes, split into referenced and idle"""
+        with self._lock:
+            held = [e for e in self._entries.values() if e[1]]
+            return {
+                "entries": len(self._entries),
+                "referenced": len(held),
+                "handles": sum(e[1] for e in held),
+                "referenced_bytes": sum(e[2] for e in held),
+                "idle_bytes": self._idle_total,
+            }
+
+
+SHARED = SharedStore()
@@ -0,0 +1,125 @@
+"""Incremental TF-IDF statistics and cosine relevance over index segments
+
+The segment postings already form a term-major sparse document-term matrix.
+Cosine relevance weights it with sublinear term frequencies and smoothed IDF:
+
+    w(t, d) = (1 + ln tf) * idf(t),    idf(t) = ln((N + 1) / (df + 1)) + 1
+
+and divides by each document's L2 norm, which is precomputed per segment at
+flush time. Vocabulary and document frequencies are corpus-wide and kept in
+``<index>/tfidf``: every flushed segment appends its new terms to
+``vocab.txt`` and adds its per-term counts to ``df.npy``, so new articles
+never trigger a rebuild. A segment's norms are tied to the IDF of the moment
+they were computed; readers recompute them in memory once the corpus has
+grown by more than ``NORM_DRIFT`` since then.
+"""
+import json
+import os
+
+import numpy as np
+
+# Relative corpus growth after which a segment's stored norms are recomputed
+NORM_DRIFT = 0.2
+
+
+def idf(df, n_docs):
+    """Smoothed inverse document frequency (array or scalar ``df``)"""
+    return np.log((n_docs + 1.0) / (np.asarray(df, dtype=np.float64) + 1.0)) + 1.0
+
+
+def sublinear_tf(tf):
+    return 1.0 + np.log(np.maximum(tf, 1.0))
+
+
+def document_norms(post_docs, post_tf, term_counts, term_idf, n_docs):
+    """L2 norms of the TF-IDF rows of one segment's term-major postings
+
+    ``term_counts`` is the number of postings per local term (its df inside
+    the segment) and ``term_idf`` its corpus-wide IDF.
+    """
+    weights = sublinear_tf(np.asarray(post_tf, dtype=np.float64)) * np.repeat(term_idf, term_counts)
+    return np.sqrt(np.bincount(post_docs, weights=weights * weights, minlength=n_docs)).astype(np.float32)
+
+
+class TermStats:
+    """Corpus-wide vocabulary and document frequencies, grown per segment"""
+
+    def __init__(self, path):
+        self.path = path
+        self._mtime = None
+        self._vocab = None
+        self.n_docs = 0
+        self.df = np.zeros(0, dtype=np.int64)
+        self.refresh()
+
+    @property
+    def _stats_path(self):
+        return os.path.join(self.path, "stats.json")
+
+    def refresh(self):
+        """Reload the published statistics if they changed on disk"""
+        if not os.path.exists(self._stats_path):
+            return False
+        mtime = os.path.getmtime(self._stats_path)
+        if mtime == self._mtime:
+            return False
+        with open(self._stats_path, encoding="utf-8") as fh:
+            stats = json.load(fh)
+        self.n_docs = stats["n_docs"]
+        self.df = np.load(os.path.join(self.path, "df.npy"))[:stats["n_terms"]]
+        self._vocab = None
+        self._mtime = mtime
+        return True
+
+    def _load_vocab(self):
+        vocab_path = os.path.join(self.path, "vocab.txt")
+        if not os.path.exists(vocab_path):
+            return {}
+        with open(vocab_path, encoding="utf-8") as fh:
+            terms = fh.read().split("\n")[:-1]
+        if len(terms) > len(self.df):
+            # Drop terms appended by a writer that died before publishing
+            terms = terms[:len(self.df)]
+            with open(vocab_path, "w", encoding="utf-8") as fh:
+                fh.writelines(term + "\n" for term in terms)
+        return {term: i for i, term in enumerate(terms)}
+
+    def add(self, terms, term_counts, n_docs):
+        """Merge a new segment's terms and per-term doc counts; returns global ids"""
+        if self._vocab is None:
+            self._vocab = self._load_vocab()
+        vocab = self._vocab
+        gids = np.empty(len(terms), dtype=np.int64)
+        new_terms = []
+        for i, term in enumerate(terms):
+            gid = vocab.get(term)
+            if gid is None:
+                gid = vocab[term] = len(vocab)
+                new_terms.append(term)
+            gids[i] = gid
+
+        df = np.zeros(len(vocab), dtype=np.int64)
+        df[:len(self.df)] = self.df
+        np.add.at(df, gids, term_counts)
+        self.df = df
+        self.n_docs += n_docs
+
+        # vocab.txt and df.npy first, stats.json last: readers only trust the
+        # first ``n_terms`` entries listed in the stats they loaded
+        os.makedirs(self.path, exist_ok=True)
+        with open(os.path.join(self.path, "vocab.txt"), "a", encoding="utf-8") as fh:
+            fh.writelines(term + "\n" for term in new_terms)
+        tmp = os.path.join(self.path, "df.tmp.npy")
+        np.save(tmp, df)
+        os.replace(tmp, os.path.join(self.path, "df.npy"))
+        tmp = self._stats_path + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as fh:
+            json.dump({"n_docs": self.n_docs, "n_terms": len(vocab)}, fh)
+        os.replace(tmp, self._stats_path)
+        self._mtime = os.path.getmtime(self._stats_path)
+        return gids
+
+    def idf(self, gids=None):
+        """Current IDF of all terms, or of the given global term ids"""
+        df = self.df if gids is None else self.df[gids]
+        return idf(df, self.n_docs)
@@ -0,0 +1,270 @@
+"""Topic discovery with mini-batch k-means over hashed TF-IDF vectors
+
+    python -m stem_intel.topics data/corpus --topics 12
+    python -m stem_intel.ingest data/corpus --rebuild
+
+Articles are streamed from the corpus in :class:`~stem_intel.corpus.TokenBatch`
+chunks. Every token is hashed into ``N_FEATURES`` buckets, so no vocabulary
+has to be known up front, and a running document frequency per bucket gives
+the IDF. Rows are sublinear TF-IDF, L2-normalized.
+
+The model is spherical mini-batch k-means (Sculley, 2010). Each chunk is
+assigned to its most similar centroid. Every centroid then moves toward the
+mean of its new members with a per-centroid learning rate of 1 / members
+seen, and is renormalized. Memory is bounded by the centroid block, not the
+corpus. After fitting, each topic is named after its three heaviest terms.
+
+Once a model exists under ``TOPIC_DIR``, ingestion assigns every new article
+to a topic and files it under the topic's name: the original feed category
+is kept as ``feed_category``. Search filters, trend columns, Track Patterns
+fields and scenario focus areas then follow the discovered topics.
+"""
+import argparse
+import functools
+import json
+import os
+import time
+
+import numpy as np
+
+from .config import CORPUS_DIR, TOPIC_DIR
+from .corpus import STOPWORDS, TokenBatch, article_text, batched, iter_articles
+from .dedup import token_hash
+
+N_FEATURES = 2 ** 18
+N_TOPICS = 12
+# Articles per mini-batch, and passes over the corpus when fitting
+BATCH_SIZE = 1024
+EPOCHS = 2
+LABEL_TERMS = 3
+
+# Tokens too short or too common to say anything about a topic
+MIN_TOKEN_LENGTH = 3
+
+SEED = 20250601
+
+
+class TopicModel:
+    """Hashed TF-IDF statistics and unit-length topic centroids"""
+
+    def __init__(self, n_topics=N_TOPICS, n_features=N_FEATURES, seed=SEED):
+        self.n_topics = n_topics
+        self.n_features = n_features
+        self.centroids = None
+        # Members seen over all passes (learning rates), and per topic in the last pass
+        self.counts = np.zeros(n_topics, dtype=np.int64)
+        self.sizes = np.zeros(n_topics, dtype=np.int64)
+        self.df = np.zeros(n_features, dtype=np.int64)
+        self.n_docs = 0
+        self.names = []
+        self.bucket_terms = {}
+        self._rng = np.random.default_rng(seed)
+
+    # -- vectors ----------------------------------------------------------
+
+    def _pairs(self, tokens):
+        """(doc, bucket, tf) of every distinct informative token of each text"""
+        vocab = tokens.vocab.tolist()
+        keep = np.array([len(t) >= MIN_TOKEN_LENGTH and t not in STOPWORDS and not t.isdigit() for t in vocab],
+                        dtype=bool)
+        buckets = np.fromiter((token_hash(t) % self.n_features for t in vocab), dtype=np.int64, count=len(vocab))
+        for term, bucket in zip(np.asarray(vocab)[keep].tolist(), buckets[keep].tolist()):
+            # First term seen in a bucket names it; collisions are rare at this width
+            self.bucket_terms.setdefault(bucket, term)
+        positions = keep[tokens.inverse] if len(tokens) else np.zeros(0, dtype=bool)
+        keys, tf = np.unique(tokens.doc_of[positions] * self.n_features + buckets[tokens.inverse[positions]],
+                             return_counts=True)
+        return keys // self.n_features, keys % self.n_features, tf
+
+    def observe(self, tokens):
+        """Count the batch's documents into the bucket document frequencies"""
+        _, buckets, _ = self._pairs(tokens)
+        self.df += np.bincount(buckets, minlength=self.n_features)
+        self.n_docs += tokens.n_docs
+
+    def vectors(self, tokens):
+        """Rows of the batch as (docs, buckets, weights) with unit L2 norm per doc"""
+        docs, buckets, tf = self._pairs(tokens)
+        idf = np.log((self.n_docs + 1.0) / (self.df[buckets] + 1.0)) + 1.0
+        weights = (1.0 + np.log(tf)) * idf
+        norms = np.sqrt(np.bincount(docs, weights=weights * weights, minlength=tokens.n_docs))
+        return docs, buckets, weights / norms[docs]
+
+    def _similarities(self, docs, buckets, weights, n_docs):
+        return np.stack([np.bincount(docs, weights=self.centroids[j, buckets] * weights, minlength=n_docs)
+                         for j in range(self.n_topics)], axis=1)
+
+    # -- fitting ----------------------------------------------------------
+
+    def _row(self, docs, buckets, weights, doc):
+        row = np.zeros(self.n_features, dtype=np.float32)
+        mine = docs == doc
+        row[buckets[mine]] = weights[mine]
+        return row
+
+    def _init_centroids(self, docs, buckets, weights, n_docs):
+        """k-means++ seeding on the first batch, by cosine distance; False if it is too sparse"""
+        candidates = np.bincount(docs, minlength=n_docs) > 0
+        if candidates.sum() < self.n_topics:
+            return False
+        rows = [self._row(docs, buckets, weights, self._rng.choice(np.flatnonzero(candidates)))]
+        distance = candidates * (1.0 - np.bincount(docs, weights=rows[0][buckets] * weights, minlength=n_docs))
+        for _ in range(1, self.n_topics):
+            p = np.maximum(distance, 0)
+            doc = (self._rng.choice(n_docs, p=p / p.sum()) if p.sum() > 0
+                   else self._rng.choice(np.flatnonzero(candidates)))
+            rows.append(self._row(docs, buckets, weights, doc))
+            similarity = np.bincount(docs, weights=rows[-1][buckets] * weights, minlength=n_docs)
+            distance = np.minimum(distance, candidates * (1.0 - similarity))
+        self.centroids = np.stack(rows)
+        return True
+
+    def partial_fit(self, tokens, observe=True):
+        """One mini-batch step on a TokenBatch; returns the batch's topic ids"""
+        if observe:
+            self.observe(tokens)
+        docs, buckets, weights = self.vectors(tokens)
+        if self.centroids is None and not self._init_centroids(docs, buckets, weights, tokens.n_docs):
+            return np.full(tokens.n_docs, -1)
+        topics = self._nearest(docs, buckets, weights, tokens.n_docs)
+
+        members = topics[docs]
+        valid = members >= 0
+        sums = np.zeros_like(self.centroids)
+        np.add.at(sums, (members[valid], buckets[valid]), weights[valid])
+        sizes = np.bincount(topics[topics >= 0], minlength=self.n_topics)
+        self.counts += sizes
+        moved = sizes > 0
+        rate = (1.0 / self.counts[moved])[:, None]
+        self.centroids[moved] += rate * (sums[moved] - sizes[moved, None] * self.centroids[moved])
+        norms = np.linalg.norm(self.centroids[moved], axis=1, keepdims=True)
+        self.centroids[moved] /= np.maximum(norms, 1e-12)
+        return topics
+
+    def _nearest(self, docs, buckets, weights, n_docs):
+        sims = self._similarities(docs, buckets, weights, n_docs)
+        topics = sims.argmax(axis=1)
+        # Texts without a single informative token belong to no topic
+        topics[np.bincount(docs, minlength=n_docs) == 0] = -1
+        return topics
+
+    def assign(self, tokens):
+        """Topic id of every text in a TokenBatch (-1 when it has no informative token)"""
+        docs, buckets, weights = self.vectors(tokens)
+        return self._nearest(docs, buckets, weights, tokens.n_docs)
+
+    def top_terms(self, topic, n=LABEL_TERMS):
+        row = self.centroids[topic]
+        top = np.argpartition(row, -n)[-n:]
+        top = top[np.argsort(-row[top])]
+        return [self.bucket_terms.get(int(b), f"#{b}") for b in top if row[b] > 0]
+
+    def label(self):
+        """Name every topic after its heaviest terms, keeping names unique"""
+        names = []
+        for topic in range(self.n_topics):
+            name = " / ".join(self.top_terms(topic)).title() or f"Topic {topic + 1}"
+            names.append(name if name not in names else f"{name} ({topic + 1})")
+        self.names = names
+        return names
+
+    # -- persistence ------------------------------------------------------
+
+    def save(self, path=TOPIC_DIR):
+        os.makedirs(path, exist_ok=True)
+        # Only the buckets that can name a topic are worth keeping
+        used = sorted({int(b) for topic in range(self.n_topics)
+                       for b in np.argpartition(self.centroids[topic], -10 * LABEL_TERMS)[-10 * LABEL_TERMS:]})
+        tmp = os.path.join(path, "model.tmp.npz")
+        np.savez(tmp, centroids=self.centroids, counts=self.counts, df=self.df,
+                 label_buckets=np.array(used, dtype=np.int64),
+                 label_terms=np.array([self.bucket_terms.get(b, "") for b in used], dtype=str))
+        os.replace(tmp, os.path.join(path, "model.npz"))
+        tmp = os.path.join(path, "meta.json.tmp")
+        with open(tmp, "w", encoding="utf-8") as fh:
+            json.dump({"n_topics": self.n_topics, "n_features": self.n_features, "n_docs": self.n_docs,
+                       "names": self.names, "sizes": self.sizes.tolist()}, fh)
+        os.replace(tmp, os.path.join(path, "meta.json"))
+
+    @classmethod
+    def load(cls, path=TOPIC_DIR):
+        """The saved model, or None when no topics were fitted yet"""
+        meta = read_topics(path)
+        if meta is None:
+            return None
+        model = cls(meta["n_topics"], meta["n_features"])
+        with np.load(os.path.join(path, "model.npz")) as arrays:
+            model.centroids = arrays["centroids"]
+            model.counts = arrays["counts"]
+            model.df = arrays["df"]
+            model.bucket_terms = dict(zip(arrays["label_buckets"].tolist(), arrays["label_terms"].tolist()))
+        model.n_docs = meta["n_docs"]
+        model.sizes = np.array(meta["sizes"], dtype=np.int64)
+        model.names = meta["names"]
+        return model
+
+
+def read_topics(path=TOPIC_DIR):
+    """Saved topic metadata (names, sizes), or None when there is no model"""
+    meta_path = os.path.join(path, "meta.json")
+    if not os.path.exists(meta_path):
+        return None
+    with open(meta_path, encoding="utf-8") as fh:
+        return json.load(fh)
+
+
+@functools.lru_cache(maxsize=16)
+def _topic_names(path, version):
+    meta = read_topics(path)
+    return tuple(meta["names"]) if meta else ()
+
+
+def topic_names(path=TOPIC_DIR):
+    """Names of the fitted topics (empty without a model), re-read only when meta.json changes"""
+    try:
+        version = os.stat(os.path.join(path, "meta.json")).st_mtime_ns
+    except FileNotFoundError:
+        return []
+    return list(_topic_names(path, version))
+
+
+def fit_topics(articles, n_topics=N_TOPICS, epochs=EPOCHS, batch_size=BATCH_SIZE, log=None):
+    """Fit a model by streaming ``articles`` (a re-iterable, or a callable returning an iterator)"""
+    model = TopicModel(n_topics)
+    for epoch in range(epochs):
+        stream = articles() if callable(articles) else iter(articles)
+        sizes = np.zeros(n_topics, dtype=np.int64)
+        for batch in batched(stream, batch_size):
+            # Document frequencies are counted on the first pass only
+            topics = model.partial_fit(TokenBatch([article_text(a) for a in batch]), observe=epoch == 0)
+            sizes += np.bincount(topics[topics >= 0], minlength=n_topics)
+        model.sizes = sizes
+        if log is not None:
+            print(f"epoch {epoch + 1}: {model.n_docs:,} articles", file=log)
+    if model.centroids is None:
+        raise ValueError(f"need at least {n_topics} articles to fit {n_topics} topics")
+    model.label()
+    return model
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Discover article topics with mini-batch k-means")
+    parser.add_argument("paths", nargs="*", default=[CORPUS_DIR],
+                        help="JSONL/RSS/Atom files or directories (default: %(default)s)")
+    parser.add_argument("--topics", type=int, default=N_TOPICS, help="number of topics (default: %(default)s)")
+    parser.add_argument("--epochs", type=int, default=EPOCHS, help="passes over the corpus (default: %(default)s)")
+    parser.add_argument("--batch", type=int, default=BATCH_SIZE, help="articles per mini-batch (default: %(default)s)")
+    parser.add_argument("--output", default=TOPIC_DIR, help="model directory (default: %(default)s)")
+    args = parser.parse_args(argv)
+
+    start = time.perf_counter()
+    model = fit_topics(lambda: iter_articles(args.paths), args.topics, args.epochs, args.batch)
+    model.save(args.output)
+    print(f"Fitted {args.topics} topics on {model.n_docs:,} articles in {time.perf_counter() - start:.1f}s")
+    for name, size in sorted(zip(model.names, model.sizes.tolist()), key=lambda item: -item[1]):
+        print(f"  {size:>9,}  {name}")
+    print("Re-ingest with python -m stem_intel.ingest --rebuild to file articles under these topics")
+
+
+if __name__ == "__main__":
+    main()
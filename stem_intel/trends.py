@@ -0,0 +1,281 @@
+"""Category trend series read from the trend store, with a per-column cache
+
+Daily per-category counts come from the append-only ``TrendStore``; windows
+are zero-copy slices of its memory map. Categories the store has never seen
+fall back to synthetic series drawn from a generator seeded on
+(category, timeframe) and cached per column in a bounded LRU with a TTL. Both
+the store handle and the cache live at module level, so every session in the
+process shares them and any combination of categories is assembled from
+already available columns.
+
+Charts read from a :class:`~stem_intel.chartdata.Pyramid` of daily, weekly and
+monthly rollups, built once per store version (or per synthetic column) and
+thinned with LTTB to the chart's point budget.
+
+Sessions keep a handle to a float32 :class:`~stem_intel.shared.TrendMatrix`
+in the process-wide shared store instead of their own DataFrame copy.
+
+Windows of ``MIN_PARALLEL_CELLS`` or more (days x categories) are assembled by
+a process pool when ``STEM_TREND_WORKERS`` allows, which computes their pattern
+statistics in the same pass (see :mod:`stem_intel.parallel`).
+
+Forecasts fit every category missing from the cache in one vectorized pass
+and cache the fitted parameters and states per column until the store
+version (new data) or the window changes.
+"""
+import threading
+import time
+import zlib
+from collections import OrderedDict
+from datetime import date, timedelta
+
+import numpy as np
+import pandas as pd
+
+from .chartdata import CHART_POINTS, Pyramid, choose_level, downsample
+from .config import MIN_PARALLEL_CELLS, TREND_DIR, TREND_WORKERS
+from .forecast import Fit, fit, monthly_forecast
+from .metrics import timed
+from .parallel import parallel_trend_window
+from .shared import SHARED, TrendMatrix
+from .tsstore import TrendStore
+
+TREND_CACHE_SIZE = 512
+TREND_CACHE_TTL = 6 * 3600  # seconds
+
+
+class TTLCache:
+    """Thread-safe LRU cache whose entries also expire after ``ttl`` seconds"""
+
+    def __init__(self, maxsize, ttl):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key):
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is not None and entry[0] > time.monotonic():
+                self._data.move_to_end(key)
+                self.hits += 1
+                return entry[1]
+            if entry is not None:
+                del self._data[key]
+            self.misses += 1
+            return None
+
+    def put(self, key, value):
+        with self._lock:
+            self._data[key] = (time.monotonic() + self.ttl, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def get_or_compute(self, key, compute):
+        value = self.get(key)
+        if value is None:
+            value = compute()
+            self.put(key, value)
+        return value
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self):
+        return len(self._data)
+
+
+TREND_CACHE = TTLCache(TREND_CACHE_SIZE, TREND_CACHE_TTL)
+
+FORECAST_MONTHS = 6
+
+# Categories offered on the trends page. Until real articles are ingested they
+# are served from the synthetic fallback; demo history is never written to the store
+DEMO_CATEGORIES = ["AI & Machine Learning", "Biotechnology", "Quantum Computing", "Data Science", "Renewable Energy"]
+DEMO_MONTHS = 24
+
+_store = None
+_store_lock = threading.Lock()
+
+
+def get_trend_store(path=TREND_DIR):
+    """Process-wide trend store, opened on first use"""
+    global _store
+    with _store_lock:
+        if _store is None or _store.path != path:
+            _store = TrendStore(path)
+        else:
+            _store.refresh()
+        return _store
+
+
+def trend_categories(store):
+    """Categories with stored counts, or the demo categories while the store is empty"""
+    return list(store.categories) or list(DEMO_CATEGORIES)
+
+
+def series_seed(category, timeframe):
+    """Stable seed for a category's series (``hash()`` is salted per process)"""
+    return zlib.crc32(f"{category}|{timeframe}".encode("utf-8"))
+
+
+def _frozen(values):
+    values.setflags(write=False)
+    return values
+
+
+def trend_dates(timeframe, end=None):
+    """Daily date index covering ``timeframe`` months up to ``end`` (today)"""
+    end = end or date.today()
+    return TREND_CACHE.get_or_compute(
+        ("dates", timeframe, end),
+        lambda: pd.date_range(start=end - timedelta(days=timeframe * 30), end=end, freq="D"),
+    )
+
+
+def category_series(category, timeframe, end=None):
+    """Seeded trend series for one category, computed once per cache lifetime"""
+    end = end or date.today()
+
+    def compute():
+        n = len(trend_dates(timeframe, end))
+        rng = np.random.default_rng(series_seed(category, timeframe))
+        # Realistic trend with some noise and seasonal patterns
+        base_trend = np.linspace(50, 100, n)
+        seasonal = 10 * np.sin(2 * np.pi * np.arange(n) / 365)
+        noise = rng.normal(0, 5, n)
+        return _frozen(np.maximum(base_trend + seasonal + noise, 0))
+
+    return TREND_CACHE.get_or_compute(("series", category, timeframe, end), compute)
+
+
+def _stored_series(store, category, dates):
+    """Store column aligned to ``dates``; a view when the store covers them all"""
+    values = store.series(category, dates[0], dates[-1])
+    if len(values) == len(dates):
+        return values
+    aligned = np.zeros(len(dates), dtype=np.float32)
+    if len(values):
+        offset = max((store.start - dates[0].date()).days, 0)
+        aligned[offset:offset + len(values)] = values
+    return aligned
+
+
+def _window_end(store):
+    # Windows end at the latest day with data rather than at a zero-filled today
+    return store.end or date.today()
+
+
+def trend_column(store, category, timeframe, dates, end):
+    """One category's window: its store column, or the synthetic series when the store lacks it"""
+    if category in store:
+        return _stored_series(store, category, dates)
+    return category_series(category, timeframe, end)
+
+
+def _parallel(categories, dates, workers):
+    return workers > 1 and len(categories) * len(dates) >= MIN_PARALLEL_CELLS
+
+
+@timed()
+def generate_trend_data(categories, timeframe, store=None, workers=TREND_WORKERS):
+    """Generate realistic trend data for visualization"""
+    store = store or get_trend_store()
+    end = _window_end(store)
+    dates = trend_dates(timeframe, end)
+    if _parallel(categories, dates, workers):
+        values, _ = parallel_trend_window(categories, timeframe, end, store, workers)
+        frame = pd.DataFrame(values, columns=list(categories), copy=False)
+        frame.insert(0, "Date", dates)
+        return frame
+    data = {"Date": dates}
+    for category in categories:
+        data[category] = trend_column(store, category, timeframe, dates, end)
+    return pd.DataFrame(data)
+
+
+def shared_trend_data(categories, timeframe, store=None):
+    """Handle to the shared float32 trend window, one copy per distinct selection"""
+    store = store or get_trend_store()
+    end = _window_end(store)
+    categories = list(categories)
+
+    def compute():
+        dates = trend_dates(timeframe, end)
+        if _parallel(categories, dates, TREND_WORKERS):
+            values, stats = parallel_trend_window(categories, timeframe, end, store, TREND_WORKERS)
+            return TrendMatrix(dates[0], values, categories, stats)
+        frame = generate_trend_data(categories, timeframe, store)
+        return TrendMatrix(frame["Date"].iloc[0], frame[categories].to_numpy(np.float32), categories)
+
+    return SHARED.acquire(("trend", tuple(categories), timeframe, store.path, store.version, end), compute)
+
+
+def store_pyramid(store):
+    """Rollup pyramid of every stored category, rebuilt when the store changes"""
+    return TREND_CACHE.get_or_compute(
+        ("pyramid", store.path, store.version),
+        lambda: Pyramid(store.start, store.window(), store.categories),
+    )
+
+
+def _series_pyramid(category, timeframe, end):
+    dates = trend_dates(timeframe, end)
+    return TREND_CACHE.get_or_compute(
+        ("pyramid", category, timeframe, end),
+        lambda: Pyramid(dates[0], category_series(category, timeframe, end)[:, None], [category]),
+    )
+
+
+def trend_level(categories, timeframe, freq, store=None):
+    """Daily ("D"), weekly ("W") or monthly ("M") means over the trend window"""
+    store = store or get_trend_store()
+    end = _window_end(store)
+    start = trend_dates(timeframe, end)[0]
+    stored = [c for c in categories if c in store]
+    frames = [store_pyramid(store).level(freq, start, end, stored)] if stored else []
+    frames += [_series_pyramid(c, timeframe, end).level(freq, start, end) for c in categories if c not in store]
+    # Stored columns that do not reach back to the window start read as zero
+    return pd.concat(frames, axis=1).fillna(0.0)[list(categories)]
+
+
+def chart_trend_data(categories, timeframe, budget=CHART_POINTS, store=None):
+    """Line/area chart frame indexed by date with at most ``budget`` rows"""
+    store = store or get_trend_store()
+    end = _window_end(store)
+    freq = choose_level(trend_dates(timeframe, end)[0], end, budget)
+    return TREND_CACHE.get_or_compute(
+        ("chart", tuple(categories), timeframe, budget, store.path, store.version, end),
+        lambda: downsample(trend_level(categories, timeframe, freq, store), budget),
+    )
+
+
+def monthly_trend_data(categories, timeframe, store=None):
+    """Monthly mean counts for the bar chart, from the rollup pyramid"""
+    return trend_level(categories, timeframe, "M", store)
+
+
+def _fit_key(category, timeframe, end, store):
+    version = (store.path, store.version) if category in store else None
+    return ("fit", category, timeframe, end, version)
+
+
+@timed()
+def trend_forecast(categories, timeframe, months=FORECAST_MONTHS, store=None):
+    """Monthly forecasts with intervals for ``months`` after the trend window"""
+    store = store or get_trend_store()
+    end = _window_end(store)
+    fits = {c: TREND_CACHE.get(_fit_key(c, timeframe, end, store)) for c in categories}
+    missing = [c for c, f in fits.items() if f is None]
+    if missing:
+        history = generate_trend_data(missing, timeframe, store)
+        fitted = fit(history[missing].to_numpy())
+        for i, category in enumerate(missing):
+            fits[category] = fitted.select([i])
+            TREND_CACHE.put(_fit_key(category, timeframe, end, store), fits[category])
+    start = pd.Timestamp(end) + pd.Timedelta(days=1)
+    return monthly_forecast(Fit.concat([fits[c] for c in categories]), list(categories), months, start)
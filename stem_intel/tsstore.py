@@ -0,0 +1,247 @@
+"""Append-only columnar store for daily per-category article counts
+
+Counts live in a single row-major ``float32`` file with one row per day and
+one column per category, memory-mapped for reading. Appending a day writes one
+row (O(categories)); the file is over-allocated in chunks so appends never
+rewrite existing rows. Date-range reads are zero-copy views of the mapping.
+Only structural changes (a new category, or data older than the first day)
+rewrite the file, and both are rare compared to daily appends.
+"""
+import json
+import os
+import threading
+from datetime import date, timedelta
+
+import numpy as np
+import pandas as pd
+
+COUNTS_FILE = "counts.f32"
+META_FILE = "meta.json"
+
+# Rows added whenever the counts file runs out of pre-allocated space
+GROW_DAYS = 366
+
+
+def _as_date(value):
+    if isinstance(value, date):
+        return value if type(value) is date else value.date()
+    return pd.Timestamp(value).date()
+
+
+def monthly_means(values, dates):
+    """Calendar-month means of a (time x category) array without resampling
+
+    Returns (month_start_dates, means) where ``means`` has one row per month.
+    """
+    months = np.asarray(dates, dtype="datetime64[D]").astype("datetime64[M]")
+    if not len(months):
+        return pd.DatetimeIndex([]), np.zeros((0,) + np.shape(values)[1:])
+    bounds = np.flatnonzero(np.r_[True, months[1:] != months[:-1]])
+    sizes = np.diff(np.r_[bounds, len(months)])
+    sums = np.add.reduceat(np.asarray(values, dtype=np.float64), bounds, axis=0)
+    return pd.DatetimeIndex(months[bounds]), sums / sizes[:, None]
+
+
+class TrendStore:
+    """Daily category counts backed by a memory-mapped row-major file"""
+
+    def __init__(self, path):
+        self.path = path
+        self._lock = threading.RLock()
+        os.makedirs(path, exist_ok=True)
+        if not os.path.exists(os.path.join(path, META_FILE)):
+            self._write_meta({"start": None, "categories": [], "n_days": 0, "capacity": 0})
+        self._meta_mtime = None
+        self.refresh()
+
+    # -- metadata ---------------------------------------------------------
+
+    def _write_meta(self, meta):
+        tmp = os.path.join(self.path, META_FILE + ".tmp")
+        with open(tmp, "w", encoding="utf-8") as fh:
+            json.dump(meta, fh)
+        os.replace(tmp, os.path.join(self.path, META_FILE))
+        self.meta = meta
+        self._meta_mtime = os.path.getmtime(os.path.join(self.path, META_FILE))
+
+    def refresh(self):
+        """Re-read metadata and remap the counts file if another writer changed it"""
+        meta_path = os.path.join(self.path, META_FILE)
+        mtime = os.path.getmtime(meta_path)
+        if mtime == self._meta_mtime:
+            return False
+        with self._lock:
+            with open(meta_path, encoding="utf-8") as fh:
+                self.meta = json.load(fh)
+            self._map()
+            self._meta_mtime = mtime
+        return True
+
+    def _map(self):
+        meta = self.meta
+        self.categories = list(meta["categories"])
+        self._columns = {c: i for i, c in enumerate(self.categories)}
+        self.start = _as_date(meta["start"]) if meta["start"] else None
+        if meta["capacity"] and self.categories:
+            self._counts = np.memmap(os.path.join(self.path, COUNTS_FILE), dtype=np.float32,
+                                     mode="r+", shape=(meta["capacity"], len(self.categories)))
+        else:
+            self._counts = np.zeros((0, len(self.categories)), dtype=np.float32)
+
+    @property
+    def version(self):
+        """Changes whenever a writer publishes new metadata (every write does)"""
+        return self._meta_mtime
+
+    @property
+    def n_days(self):
+        return self.meta["n_days"]
+
+    @property
+    def end(self):
+        """Last day with a row in the store, or None when empty"""
+        if not self.n_days:
+            return None
+        return self.start + timedelta(days=self.n_days - 1)
+
+    def set_attr(self, name, value):
+        """Persist a small piece of user metadata alongside the counts"""
+        with self._lock:
+            self.meta.setdefault("attrs", {})[name] = value
+            self._write_meta(self.meta)
+
+    def get_attr(self, name, default=None):
+        return self.meta.get("attrs", {}).get(name, default)
+
+    def __contains__(self, category):
+        return category in self._columns
+
+    # -- reads ------------------------------------------------------------
+
+    def dates(self, start=None, end=None):
+        """Daily DatetimeIndex for the rows between ``start`` and ``end``"""
+        lo, hi = self._row_range(start, end)
+        return pd.date_range(self.start + timedelta(days=lo), periods=hi - lo, freq="D") if hi > lo \
+            else pd.DatetimeIndex([])
+
+    def _row_range(self, start, end):
+        if not self.n_days:
+            return 0, 0
+        lo = 0 if start is None else max((_as_date(start) - self.start).days, 0)
+        hi = self.n_days if end is None else min((_as_date(end) - self.start).days + 1, self.n_days)
+        return lo, max(hi, lo)
+
+    def window(self, start=None, end=None):
+        """Zero-copy (days x categories) view of the rows in a date range"""
+        lo, hi = self._row_range(start, end)
+        return self._counts[lo:hi]
+
+    def series(self, category, start=None, end=None):
+        """Zero-copy strided view of one category over a date range"""
+        lo, hi = self._row_range(start, end)
+        return self._counts[lo:hi, self._columns[category]]
+
+    def monthly_means(self, categories, start=None, end=None):
+        """Monthly mean counts for ``categories`` as a DataFrame indexed by month"""
+        view = self.window(start, end)
+        cols = [self._columns[c] for c in categories]
+        months, means = monthly_means(view[:, cols], self.dates(start, end))
+        return pd.DataFrame(means, index=months, columns=list(categories))
+
+    # -- writes -----------------------------------------------------------
+
+    def append_day(self, counts, day=None):
+        """Append one day of counts (a {category: count} mapping); O(categories)"""
+        with self._lock:
+            self._ensure_categories(counts.keys())
+            day = _as_date(day) if day is not None else (self.end + timedelta(days=1) if self.end else date.today())
+            row = self._ensure_day(day)
+            for category, value in counts.items():
+                self._counts[row, self._columns[category]] = value
+            self._counts.flush()
+            self._write_meta(self.meta)
+
+    def add_counts(self, days, categories, weights=None):
+        """Accumulate per-article counts given parallel arrays of days and categories"""
+        days = np.asarray(days, dtype="datetime64[D]")
+        categories = np.asarray(categories, dtype=object)
+        if not len(days):
+            return
+        weights = np.ones(len(days), dtype=np.float32) if weights is None else np.asarray(weights, np.float32)
+        with self._lock:
+            names, cat_codes = np.unique(categories, return_inverse=True)
+            self._ensure_categories(names)
+            self._ensure_day(_as_date(days.min()))
+            self._ensure_day(_as_date(days.max()))
+            rows = (days - np.datetime64(self.start, "D")).astype(np.int64)
+            cols = np.array([self._columns[n] for n in names])[cat_codes]
+            np.add.at(self._counts, (rows, cols), weights)
+            self._counts.flush()
+            self._write_meta(self.meta)
+
+    def add_block(self, start, categories, values):
+        """Add a dense (days x categories) block of counts starting at ``start``"""
+        values = np.asarray(values, dtype=np.float32)
+        if not values.size:
+            return
+        start = _as_date(start)
+        with self._lock:
+            self._ensure_categories(categories)
+            self._ensure_day(start)
+            last = self._ensure_day(start + timedelta(days=len(values) - 1))
+            first = last - len(values) + 1
+            cols = np.array([self._columns[c] for c in categories])
+            self._counts[first:last + 1, cols] += values
+            self._counts.flush()
+            self._write_meta(self.meta)
+
+    def _ensure_day(self, day):
+        """Make sure ``day`` has a row and return its index"""
+        if self.start is None:
+            self.meta["start"] = day.isoformat()
+            self.start = day
+        offset = (day - self.start).days
+        if offset < 0:
+            self._rewrite(start=day, categories=self.categories)
+            offset = 0
+        if offset >= self.meta["capacity"]:
+            self._grow(offset + 1)
+        if offset >= self.meta["n_days"]:
+            self.meta["n_days"] = offset + 1
+        return offset
+
+    def _grow(self, min_rows):
+        capacity = max(min_rows, self.meta["capacity"]) + GROW_DAYS
+        n_cols = len(self.categories)
+        if n_cols:
+            self._close()
+            # Extending the file keeps existing rows in place; new rows read as zeros
+            with open(os.path.join(self.path, COUNTS_FILE), "ab") as fh:
+                fh.truncate(capacity * n_cols * 4)
+        self.meta["capacity"] = capacity
+        self._map()
+
+    def _ensure_categories(self, names):
+        missing = [n for n in names if n not in self._columns]
+        if missing:
+            self._rewrite(start=self.start, categories=self.categories + sorted(missing))
+
+    def _rewrite(self, start, categories):
+        """Copy all rows into a file with a new start date and/or column set"""
+        shift = (self.start - start).days if self.start and start else 0
+        capacity = self.meta["n_days"] + shift + GROW_DAYS
+        new = np.zeros((capacity, len(categories)), dtype=np.float32)
+        if self.n_days and self.categories:
+            new[shift:shift + self.n_days, :len(self.categories)] = self._counts[:self.n_days]
+        self._close()
+        tmp = os.path.join(self.path, COUNTS_FILE + ".tmp")
+        new.tofile(tmp)
+        os.replace(tmp, os.path.join(self.path, COUNTS_FILE))
+        self.meta.update(start=start.isoformat() if start else None, categories=list(categories),
+                         n_days=self.meta["n_days"] + shift, capacity=capacity)
+        self._map()
+
+    def _close(self):
+        if isinstance(self._counts, np.memmap):
+            self._counts.flush()
+        self._counts = None
@@ -0,0 +1,67 @@
+"""Feed poller against the local stand-in HTTP server of benchmarks.bench_feeds"""
+import asyncio
+import gzip
+import json
+
+from benchmarks.bench_feeds import StandInServer
+from stem_intel.feeds import FeedFetcher, FeedState
+
+
+async def _poll_twice(server, paths):
+    """(cold, warm) (articles, stats) of two polls over ``paths`` of one stand-in host"""
+    host = await asyncio.start_server(server.handle, "127.0.0.1", 0)
+    port = host.sockets[0].getsockname()[1]
+    fetcher = FeedFetcher([(f"http://127.0.0.1:{port}{path}", None) for path in paths], FeedState(None))
+    try:
+        return await fetcher.poll(), await fetcher.poll()
+    finally:
+        host.close()
+        await host.wait_closed()
+
+
+def test_200_then_304_with_etag():
+    server = StandInServer(feeds=3, items=5)
+    (articles, cold), (again, warm) = asyncio.run(_poll_twice(server, [f"/feed/{i}" for i in range(3)]))
+
+    assert (cold.fetched, cold.not_modified, cold.failed) == (3, 0, 0)
+    assert len(articles) == 15
+    assert {a["title"] for a in articles} >= {"Feed 2 story 4: quantum sensor breakthrough"}
+    # The replayed ETags turn every second request into a bodiless 304
+    assert (warm.fetched, warm.not_modified, warm.failed) == (0, 3, 0)
+    assert again == []
+    assert server.requests == 6
+
+
+def test_gzip_bodies_are_decompressed():
+    server = StandInServer(feeds=1, items=3)
+    raw, zipped, _ = server.bodies["/feed/0"]
+    assert zipped != raw and gzip.decompress(zipped) == raw
+    (articles, stats), _ = asyncio.run(_poll_twice(server, ["/feed/0"]))
+
+    assert stats.fetched == 1
+    assert [a["id"] for a in articles] == ["0-0", "0-1", "0-2"]
+
+
+def test_corrupt_gzip_fails_only_its_feed():
+    server = StandInServer(feeds=2, items=4)
+    raw, zipped, _ = server.bodies["/feed/1"]
+    server.bodies["/feed/bad"] = (raw, zipped[:10] + b"not deflate data" + zipped[10:], '"bad"')
+    (articles, stats), _ = asyncio.run(_poll_twice(server, ["/feed/0", "/feed/bad", "/feed/1"]))
+
+    assert (stats.fetched, stats.failed) == (2, 1)
+    assert len(articles) == 8
+    assert any(url.endswith("/feed/bad") for url in stats.errors)
+
+
+def test_malformed_json_feed_items_are_skipped():
+    server = StandInServer(feeds=0, items=0)
+    body = json.dumps({"items": [
+        "not an object",
+        {"id": 7, "title": {"nested": "title"}, "summary": "Gene therapy trial results", "tags": "biology"},
+        {"id": "ok", "title": "Fusion record", "content_text": "Plasma held for minutes", "tags": [None]},
+    ]}).encode()
+    server.bodies["/feed.json"] = (body, gzip.compress(body), '"json"')
+    (articles, stats), _ = asyncio.run(_poll_twice(server, ["/feed.json"]))
+
+    assert (stats.fetched, stats.failed) == (1, 0)
+    assert sorted(a["id"] for a in articles) == ["7", "ok"]
@@ -0,0 +1,30 @@
+"""Streamlit page modules, imported on first use
+
+Each sidebar navigation target is a module with a ``render()`` function. A
+rerun only imports and renders the selected page, so the heavy engine imports
+(index, trend store, pandas analytics) are paid for by the pages that use
+them, once per process. The package is deliberately not named ``pages/``,
+which Streamlit would turn into its own multipage navigation.
+"""
+import importlib
+
+from stem_intel.metrics import span
+
+PAGES = {
+    "🏠 Home": "home",
+    "🔍 Search & Analyze": "search",
+    "📊 Visualize Trends": "trends",
+    "📈 Track Patterns": "patterns",
+    "🤖 AI Analysis": "career",
+    "🧠 Agentic AI & Scenarios": "agentic",
+    "🔗 Integrated Dashboard": "dashboard",
+    "ℹ️ About": "about",
+    "🛠️ Admin": "admin",
+}
+
+
+def render(page):
+    """Import the module behind a navigation label and render it, timed as a page span"""
+    name = PAGES[page]
+    with span(name, kind="page"):
+        importlib.import_module(f"{__name__}.{name}").render()
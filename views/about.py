@@ -0,0 +1,76 @@
+"""About page"""
+import streamlit as st
+
+
+def render():
+    st.header("ℹ️ About This Platform")
+    
+    st.markdown("""
+    ### 🚀 Future STEM News Intelligence
+    
+    Welcome to the next generation of STEM news analysis! This platform combines the power of 
+    artificial intelligence with intuitive data visualization to bring you insights from the 
+    world of Science, Technology, Engineering, and Mathematics.
+    
+    #### 🎯 Our Mission
+    To democratize access to STEM knowledge and make complex scientific information 
+    accessible to everyone - from students and researchers to industry professionals 
+    and curious minds.
+    
+    #### 🛠️ Advanced Technology Stack
+    - **Frontend Framework:** Streamlit for rapid development and deployment
+    - **Data Processing:** Pandas and NumPy for efficient data manipulation
+    - **Visualization:** Native Streamlit charts for interactive displays
+    - **AI Analysis Engine:** Custom algorithms for personalized career insights
+    - **Agentic AI System:** Autonomous scenario generation and strategic planning
+    - **Integration Engine:** Cross-analysis correlation and insight synthesis
+    - **Deployment:** Streamlit Cloud for seamless hosting
+    - **Version Control:** GitHub for collaborative development
+    
+    #### 📈 Current Features
+    - **🔍 Real-time News Analysis:** AI-powered search with sentiment analysis
+    - **📊 Interactive Trend Visualization:** Dynamic charts with predictive modeling
+    - **📈 Pattern Recognition:** Advanced pattern extraction from research data
+    - **🤖 AI Career Analysis:** Personalized career insights and recommendations
+    - **🧠 Agentic AI Scenarios:** Autonomous future scenario generation
+    - **🔗 Integrated Dashboard:** Cross-analysis correlation and unified insights
+    - **📱 Responsive Design:** Works seamlessly across all devices
+    - **⚡ Real-time Integration:** Live data correlation across all analysis modules
+    
+    #### 🔮 Advanced Capabilities
+    - **Cross-Module Integration:** All analysis components work together seamlessly
+    - **Agentic AI Reasoning:** Autonomous analysis and scenario generation
+    - **Predictive Analytics:** Future trend forecasting based on multiple data sources
+    - **Strategic Foresight:** Long-term planning and opportunity identification
+    - **Risk Assessment:** Comprehensive risk analysis across multiple scenarios
+    - **Personalization Engine:** Tailored insights based on individual profiles
+    """)
+    
+    st.success("✨ **Version 3.0** - Advanced Agentic AI Integration - Built with ❤️ by Faby Rizky")
+    
+    st.markdown("""
+    #### 🧠 Agentic AI Features
+    Our advanced agentic AI system can:
+    - **Autonomously analyze** trends across multiple data sources
+    - **Generate realistic scenarios** based on current patterns
+    - **Provide strategic recommendations** without human intervention
+    - **Continuously learn** from new data and user interactions
+    - **Cross-reference insights** from different analysis modules
+    - **Adapt predictions** based on changing conditions
+    
+    #### 🔗 Integration Capabilities
+    The platform's integration engine:
+    - **Correlates data** from all analysis modules
+    - **Identifies patterns** across different data types
+    - **Provides unified insights** combining multiple perspectives
+    - **Generates actionable recommendations** based on comprehensive analysis
+    - **Maintains data freshness** indicators for reliability
+    - **Enables cross-validation** of insights and predictions
+    
+    #### 🤝 Contributing
+    This is an open-source project! Feel free to contribute, report issues, or suggest features.
+    
+    #### 📞 Get in Touch
+    Have questions or feedback? Reach out through any of the contact methods listed in the 
+    developer section above.
+    """)
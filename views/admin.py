@@ -0,0 +1,71 @@
+"""Admin page: page render timings and hot-path instrumentation"""
+from datetime import datetime
+
+import pandas as pd
+import streamlit as st
+
+from stem_intel.metrics import RECORDER, format_duration, rss_bytes
+from stem_intel.shared import SHARED
+
+
+def render():
+    st.header("🛠️ Instrumentation")
+
+    st.markdown("""
+    <div class="analysis-box">
+        <h3>⏱️ Where Time Goes</h3>
+        <p>Wall time and resident-memory change of every page render and instrumented function in this process, across all sessions.</p>
+    </div>
+    """, unsafe_allow_html=True)
+
+    samples, totals = RECORDER.snapshot()
+    col1, col2, col3, col4 = st.columns(4)
+    with col1:
+        st.metric("🚀 Process Uptime", format_duration(RECORDER.uptime()))
+    with col2:
+        st.metric("🧮 Recorded Calls", f"{sum(count for count, _, _ in totals.values()):,}")
+    with col3:
+        st.metric("🗂️ Ring Buffer", f"{len(samples):,}/{RECORDER.samples.maxlen:,}")
+    with col4:
+        st.metric("💾 Resident Memory", f"{rss_bytes() / 2 ** 20:,.0f} MiB")
+
+    shared = SHARED.stats()
+    col1, col2, col3, col4 = st.columns(4)
+    with col1:
+        st.metric("🗃️ Shared Entries", f"{shared['entries']:,}")
+    with col2:
+        st.metric("🔗 Session Handles", f"{shared['handles']:,}")
+    with col3:
+        st.metric("📦 Referenced Data", f"{shared['referenced_bytes'] / 2 ** 20:,.1f} MiB")
+    with col4:
+        st.metric("💤 Idle Data", f"{shared['idle_bytes'] / 2 ** 20:,.1f} MiB")
+
+    if not samples:
+        st.info("No spans recorded yet. Visit a few pages and come back.")
+        return
+
+    summary = pd.DataFrame(RECORDER.summary())
+    st.subheader("📄 Page Renders")
+    st.dataframe(summary[summary["kind"] == "page"].drop(columns="kind"), use_container_width=True, hide_index=True)
+    st.subheader("⚙️ Hot Functions")
+    st.dataframe(summary[summary["kind"] != "page"].drop(columns="kind"), use_container_width=True, hide_index=True)
+
+    st.subheader("🕒 Recent Spans")
+    recent = pd.DataFrame([s.as_dict() for s in samples[-200:]][::-1])
+    recent["started"] = pd.to_datetime(recent["started"], unit="s")
+    recent["mem_delta"] = (recent["mem_delta"] / 1024).round(1)
+    recent = recent.rename(columns={"mem_delta": "mem_delta_kib"})
+    recent["wall_ms"] = recent["wall_ms"].round(2)
+    st.dataframe(recent, use_container_width=True, hide_index=True)
+
+    st.subheader("📈 Prometheus Metrics")
+    text = RECORDER.prometheus_text()
+    col1, col2 = st.columns(2)
+    with col1:
+        st.download_button("⬇️ Download metrics.prom", text, file_name="metrics.prom", mime="text/plain")
+    with col2:
+        if RECORDER.dump_path and st.button("💾 Write metrics file now"):
+            RECORDER.dump(RECORDER.dump_path)
+            st.success(f"✅ Written to `{RECORDER.dump_path}` at {datetime.now():%H:%M:%S}")
+    with st.expander("Exposition text", expanded=False):
+        st.code(text, language="text")
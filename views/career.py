@@ -0,0 +1,120 @@
+"""AI Analysis page: personalized career report"""
+from datetime import datetime
+
+import streamlit as st
+
+from stem_intel.analysis_cache import get_analysis_cache
+from stem_intel.career import career_report, catalog_version, normalize_profile, ordered_interests
+from stem_intel.metrics import timed
+
+
+@timed()
+def generate_analysis(research_area, career_level, interests, challenges, goals):
+    """Generate comprehensive career analysis (memoized per normalized profile)"""
+    return career_report(research_area, career_level, interests, challenges, goals)
+
+
+def render():
+    st.header("🤖 AI-Powered STEM Career Analysis")
+    
+    st.markdown("""
+    <div class="analysis-box">
+        <h3>🎯 Personalized Career Insights</h3>
+        <p>Get customized analysis and recommendations based on your STEM interests, career level, and goals. 
+        Our AI-powered system will provide detailed insights and actionable advice for your career journey.</p>
+    </div>
+    """, unsafe_allow_html=True)
+    
+    # Input Form
+    with st.form("career_analysis_form"):
+        st.subheader("📋 Tell Us About Yourself")
+        
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            research_area = st.selectbox(
+                "🔬 Primary Research/Interest Area:",
+                ["Artificial Intelligence", "Biotechnology", "Quantum Computing", 
+                 "Data Science", "Renewable Energy", "Robotics", "Cybersecurity", "Space Technology"]
+            )
+            
+            career_level = st.selectbox(
+                "👤 Career Level:",
+                ["Student", "Recent Graduate", "Entry Level", "Mid-Career", "Senior Professional", "Career Changer"]
+            )
+            
+            interests = st.multiselect(
+                "🎯 Specific Interests (select multiple):",
+                ["Machine Learning", "Research & Development", "Product Development", 
+                 "Data Analysis", "Project Management", "Teaching/Education", 
+                 "Entrepreneurship", "Consulting", "Policy Making"]
+            )
+        
+        with col2:
+            challenges = st.multiselect(
+                "⚠️ Current Challenges:",
+                ["Lack of Experience", "Keeping Up with Technology", "Finding Opportunities", 
+                 "Skill Development", "Networking", "Work-Life Balance", "Salary Expectations"]
+            )
+            
+            goals = st.multiselect(
+                "🎯 Career Goals (select multiple):",
+                ["Career Transition", "Skill Enhancement", "Leadership Role", 
+                 "Research Opportunities", "Industry Networking", "Higher Education", 
+                 "Starting a Business", "Remote Work Opportunities"]
+            )
+            
+            additional_info = st.text_area(
+                "📝 Additional Information (optional):",
+                placeholder="Tell us anything else that might help us provide better recommendations..."
+            )
+        
+        submitted = st.form_submit_button("🚀 Generate Analysis", type="primary")
+        
+        if submitted:
+            if research_area and career_level:
+                with st.spinner("🤖 Generating your personalized analysis..."):
+                    # Generate the analysis, or reuse the persisted report of the same profile; the stored
+                    # text lists the interests, so they are part of the key in the order they were picked
+                    profile = normalize_profile(research_area, career_level, interests, challenges, goals)
+                    inputs = dict(zip(('research_area', 'career_level', 'interests', 'challenges', 'goals'), profile),
+                                  catalog=catalog_version())
+                    inputs['interests'] = list(ordered_interests(interests))
+                    entry, _ = get_analysis_cache().get_or_compute('career', inputs, lambda: generate_analysis(
+                        research_area, career_level, interests, challenges, goals))
+                    analysis_result = entry.value
+                    
+                    # Display the result
+                    st.markdown("""
+                    <div class="result-box">
+                        <h3>✨ Your Personalized STEM Career Analysis</h3>
+                    </div>
+                    """, unsafe_allow_html=True)
+                    
+                    st.markdown(analysis_result)
+                    
+                    # Store career analysis for integration
+                    st.session_state.analysis_data['career_analysis'] = {
+                        'research_area': research_area,
+                        'career_level': career_level,
+                        'interests': interests,
+                        'challenges': challenges,
+                        'goals': goals,
+                        'timestamp': datetime.fromtimestamp(entry.created)
+                    }
+                    
+                    # Additional actionable insights
+                    st.markdown("---")
+                    st.subheader("📊 Quick Stats for Your Field")
+                    
+                    col1, col2, col3 = st.columns(3)
+                    with col1:
+                        st.metric("💼 Job Growth", "15-25%", "projected 2024-2030")
+                    with col2:
+                        st.metric("💰 Avg Salary", "$75K-$150K", "based on experience")
+                    with col3:
+                        st.metric("🌟 Satisfaction", "4.2/5", "industry average")
+                    
+                    st.success("✅ Analysis complete! Check the Integrated Dashboard for cross-analysis insights.")
+            else:
+                st.error("⚠️ Please fill in at least the Research Area and Career Level fields.")
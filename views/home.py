@@ -0,0 +1,81 @@
+"""Home page: headline metrics and feature overview"""
+from datetime import date
+
+import streamlit as st
+
+from stem_intel.aggregates import month_index
+from stem_intel.config import CORPUS_COUNTERS, CORPUS_DIR, INDEX_DIR, USAGE_COUNTERS
+from stem_intel.counters import CounterStore, get_counter_store, month_label, rebuild_from_index
+from stem_intel.index import SearchIndex
+
+
+@st.cache_resource(show_spinner=False)
+def load_counters():
+    """Open the corpus and usage counters, backfilling corpus ones from an existing index
+
+    Ingesting the corpus is left to ``python -m stem_intel.ingest``; until it
+    has run the cards read zero.
+    """
+    corpus = CounterStore(CORPUS_COUNTERS)
+    if not corpus.counters and SearchIndex.exists(INDEX_DIR):
+        rebuild_from_index(INDEX_DIR, CORPUS_COUNTERS)
+        corpus.refresh()
+    return corpus, get_counter_store(USAGE_COUNTERS)
+
+
+def _delta(month, change):
+    """The month-over-month line under a metric card"""
+    if month is None:
+        return '<small style="color: gray;">No activity yet</small>'
+    when = "this month" if month == month_index(date.today().isoformat()) else f"in {month_label(month)}"
+    if change is None:
+        return f'<small style="color: gray;">🆕 first activity {when}</small>'
+    if change < 0:
+        return f'<small style="color: red;">↘️ {change:.0f}% {when}</small>'
+    return f'<small style="color: green;">↗️ +{change:.0f}% {when}</small>'
+
+
+def render():
+    st.markdown("## Welcome to Your Advanced STEM Intelligence Hub! 🎉")
+    
+    # Metrics Row
+    corpus, usage = load_counters()
+    corpus.refresh()
+    usage.refresh()
+    cards = [
+        ("📚", "Articles Analyzed", corpus.card("articles")),
+        ("🔬", "Research Papers", corpus.card("research")),
+        ("🚀", "Tech Innovations", corpus.card("innovations")),
+        ("🤖", "AI Scenarios", usage.card("scenarios")),
+    ]
+    for col, (icon, label, card) in zip(st.columns(4), cards):
+        with col:
+            st.markdown(f"""
+            <div class="metric-card">
+                <h3>{icon}</h3>
+                <h2>{card[0]:,}</h2>
+                <p>{label}</p>
+                {_delta(*card[1:])}
+            </div>
+            """, unsafe_allow_html=True)
+    if not corpus.counters:
+        st.info(f"📭 No articles ingested yet. Add JSONL/RSS dumps to `{CORPUS_DIR}` and run `python -m stem_intel.ingest`.")
+    
+    st.markdown("### 🎯 Advanced AI-Powered Features:")
+    
+    features = [
+        ("🔍 Search & Analyze", "Real-time STEM news analysis with AI-powered insights and sentiment analysis"),
+        ("📊 Visualize Trends", "Interactive charts and data visualization tools with predictive modeling"),
+        ("📈 Track Patterns", "Monitor scientific publication trends and extract actionable patterns"),
+        ("🤖 AI Career Analysis", "Personalized career recommendations based on current market trends"),
+        ("🧠 Agentic AI Scenarios", "Advanced scenario modeling and future prediction capabilities"),
+        ("🔗 Integrated Dashboard", "Unified view combining all analysis components with cross-referencing")
+    ]
+    
+    for title, description in features:
+        st.markdown(f"""
+        <div class="feature-card">
+            <h4>{title}</h4>
+            <p>{description}</p>
+        </div>
+        """, unsafe_allow_html=True)
@@ -0,0 +1,218 @@
+"""Page chrome shared by every view: styles, header, developer panel, sidebar, footer
+
+The HTML and CSS are module constants, so they are built once per process and
+each rerun only sends them to the browser.
+"""
+import streamlit as st
+
+from stem_intel.metrics import RECORDER, format_duration
+
+STYLE = """
+<style>
+    .main-header {
+        font-size: 3rem;
+        font-weight: 700;
+        text-align: center;
+        background: linear-gradient(90deg, #667eea 0%, #764ba2 100%);
+        -webkit-background-clip: text;
+        -webkit-text-fill-color: transparent;
+        margin-bottom: 1rem;
+    }
+    .sub-header {
+        text-align: center;
+        color: #666;
+        font-size: 1.2rem;
+        margin-bottom: 2rem;
+    }
+    .developer-box {
+        background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
+        color: white;
+        padding: 2rem;
+        border-radius: 15px;
+        margin: 2rem 0;
+        text-align: center;
+    }
+    .analysis-box {
+        background: linear-gradient(135deg, #f8f9fa 0%, #e9ecef 100%);
+        padding: 2rem;
+        border-radius: 15px;
+        border-left: 5px solid #667eea;
+        margin: 1rem 0;
+    }
+    .result-box {
+        background: linear-gradient(135deg, #d4edda 0%, #c3e6cb 100%);
+        padding: 2rem;
+        border-radius: 15px;
+        border-left: 5px solid #28a745;
+        margin: 1rem 0;
+    }
+    .agentic-box {
+        background: linear-gradient(135deg, #fff3cd 0%, #ffeaa7 100%);
+        padding: 2rem;
+        border-radius: 15px;
+        border-left: 5px solid #ffc107;
+        margin: 1rem 0;
+    }
+    .scenario-box {
+        background: linear-gradient(135deg, #d1ecf1 0%, #bee5eb 100%);
+        padding: 1.5rem;
+        border-radius: 12px;
+        border-left: 4px solid #17a2b8;
+        margin: 1rem 0;
+    }
+    .integration-box {
+        background: linear-gradient(135deg, #f8d7da 0%, #f5c6cb 100%);
+        padding: 2rem;
+        border-radius: 15px;
+        border-left: 5px solid #dc3545;
+        margin: 1rem 0;
+    }
+    .feature-card {
+        background: #f8f9fa;
+        padding: 1.5rem;
+        border-radius: 10px;
+        border-left: 4px solid #667eea;
+        margin: 1rem 0;
+    }
+    .metric-card {
+        background: linear-gradient(45deg, #f0f2f6, #ffffff);
+        padding: 1.5rem;
+        border-radius: 10px;
+        text-align: center;
+        margin: 0.5rem;
+        box-shadow: 0 2px 4px rgba(0,0,0,0.1);
+    }
+    .news-card {
+        background: #ffffff;
+        padding: 1.5rem;
+        border-radius: 10px;
+        border: 1px solid #dee2e6;
+        margin: 1rem 0;
+        box-shadow: 0 2px 4px rgba(0,0,0,0.05);
+    }
+</style>
+"""
+
+HEADER = (
+    '<h1 class="main-header">🔬 Future STEM News Intelligence</h1>',
+    '<p class="sub-header">AI-Powered STEM News Analysis & Personal Insights</p>',
+)
+
+DEVELOPER_BOX = """
+    <div class="developer-box">
+        <h2>👨‍💻 Developed by: M Faby Rizky K</h2>
+        <h3>🏢 Supported by: Patria & Co</h3>
+        <h4>🚀 Future STEM News Intelligence Center</h4>
+        <p style="font-size: 1.1rem; margin: 1rem 0;">
+            An advanced AI-powered platform designed to revolutionize how we consume and analyze 
+            Science, Technology, Engineering, and Mathematics news content.
+        </p>
+    </div>
+"""
+
+PROJECT_NOTES = ("""
+        ### 🎯 Project Vision
+        - **Democratize** access to STEM knowledge
+        - **Provide** intelligent news curation  
+        - **Enable** data-driven insights
+        - **Foster** scientific literacy
+        
+        ### 🛠️ Technology Stack
+        - **Frontend:** Streamlit
+        - **Data Processing:** Pandas, NumPy
+        - **AI Engine:** Agentic Analysis System
+        - **Deployment:** Streamlit Cloud
+""", """
+        ### 🌟 Key Features
+        - 🔍 **Real-time** STEM news analysis
+        - 📊 **Interactive** data visualizations
+        - 📈 **Pattern recognition** and predictions
+        - 🤖 **Agentic AI** scenario modeling
+        - 🔗 **Integrated** cross-analysis dashboard
+        
+        ### 📞 Connect with Developer
+        - 💼 **LinkedIn:** https://www.linkedin.com/in/m-faby-rizky-k/
+        - 🐙 **GitHub:** https://github.com/fabyrizky 
+        - 📧 **Email:** fabyrizky@gmail.com
+""")
+
+QUICK_LINKS = """
+### 📚 Quick Links
+- 📚 [Documentation](#)
+- 🐛 [Report Bug](#)  
+- 💡 [Feature Request](#)
+- 📞 [Support](#)
+- ⭐ [Rate This App](#)
+"""
+
+FOOTER = """
+<div style='text-align: center; color: gray; font-size: 14px; padding: 2rem 0; border-top: 1px solid #eee;'>
+    <p><strong>🔬 Future STEM News Intelligence</strong> © 2025</p>
+    <p>Developed with ❤️ by <strong>Faby Rizky</strong> | Empowering the future through intelligent STEM analysis</p>
+    <p style="font-size: 12px; margin-top: 1rem;">
+        🚀 Powered by Streamlit | 📊 Data-driven insights | 🤖 Advanced Agentic AI | 🔗 Integrated Analysis Engine
+    </p>
+</div>
+"""
+
+
+def init_session_state():
+    """Initialize session state for cross-page data sharing"""
+    if 'analysis_data' not in st.session_state:
+        st.session_state.analysis_data = {}
+    # Handles into the process-wide shared store, resolved with shared_value()
+    if 'search_results' not in st.session_state:
+        st.session_state.search_results = None
+    if 'trend_data' not in st.session_state:
+        st.session_state.trend_data = None
+    if 'pattern_insights' not in st.session_state:
+        st.session_state.pattern_insights = {}
+
+
+def shared_value(name, default=None):
+    """Value behind a session's shared-store handle, or ``default`` when unset"""
+    handle = st.session_state.get(name)
+    return default if handle is None else handle.get()
+
+
+def header():
+    st.markdown(STYLE, unsafe_allow_html=True)
+    for html in HEADER:
+        st.markdown(html, unsafe_allow_html=True)
+
+
+def developer_section():
+    with st.expander("ℹ️ About Developer & Project", expanded=False):
+        st.markdown(DEVELOPER_BOX, unsafe_allow_html=True)
+        for column, notes in zip(st.columns(2), PROJECT_NOTES):
+            with column:
+                st.markdown(notes)
+
+
+def sidebar():
+    st.sidebar.markdown("---")
+    st.sidebar.markdown("### 📊 Platform Stats")
+    st.sidebar.metric("🌟 Version", "3.0.0")
+    st.sidebar.metric("📅 Last Updated", "June 2025")
+    st.sidebar.metric("💡 Active Features", "25+")
+    st.sidebar.metric("🚀 Uptime", format_duration(RECORDER.uptime()))
+    st.sidebar.metric("🧠 AI Modules", "6")
+
+    st.sidebar.markdown("---")
+    st.sidebar.markdown("### 🔗 Quick Actions")
+    if st.sidebar.button("🔄 Reset All Data"):
+        st.session_state.analysis_data = {}
+        st.session_state.search_results = None
+        st.session_state.trend_data = None
+        st.session_state.pattern_insights = {}
+        st.sidebar.success("✅ All data reset!")
+
+    st.sidebar.markdown(QUICK_LINKS)
+
+    st.sidebar.markdown("---")
+    st.sidebar.info("💡 **New!** Try the Integrated Dashboard after running multiple analyses!")
+
+
+def footer():
+    st.markdown("---")
+    st.markdown(FOOTER, unsafe_allow_html=True)
@@ -0,0 +1,161 @@
+"""Search & Analyze page backed by the local article index"""
+import html
+import time
+from datetime import datetime
+
+import streamlit as st
+
+from stem_intel.config import CORPUS_DIR, INDEX_DIR
+from stem_intel.index import SearchIndex
+from stem_intel.metrics import span
+from stem_intel.search import PAGE_SIZE, shared_results, stream_search
+from stem_intel.topics import topic_names
+from views.layout import shared_value
+
+
+PAGE_SIZES = [PAGE_SIZE, 25, 50, 100]
+
+# Category filters until a topic model has been fitted
+CATEGORIES = ["Artificial Intelligence", "Biotechnology", "Quantum Computing", "Data Science", "Renewable Energy"]
+
+
+@st.cache_resource(show_spinner=False)
+def _open_index(index_dir):
+    return SearchIndex(index_dir)
+
+
+def load_search_index():
+    """Open the local article index, or None until ``python -m stem_intel.ingest`` has built it"""
+    if not SearchIndex.exists(INDEX_DIR):
+        return None
+    return _open_index(INDEX_DIR)
+
+
+def _news_card(article):
+    # Titles, summaries and insights come straight from feeds and corpus files
+    escape = lambda value: html.escape(str(value))
+    st.markdown(f"""
+    <div class="news-card">
+        <h4>📰 {escape(article['title'])}</h4>
+        <p><strong>📅 Date:</strong> {article['date'].strftime('%Y-%m-%d')} | 
+           <strong>🎯 Relevance:</strong> {article['relevance']}% | 
+           <strong>😊 Sentiment:</strong> {escape(article['sentiment'])} ({article['sentiment_score']:+.2f}){f" | <strong>🔁 Also reported by:</strong> {article['duplicates']} other outlets" if article.get('duplicates') else ""}</p>
+        <p>{escape(article['summary'])}</p>
+        <p><strong>🔍 Key Insights:</strong></p>
+        <ul>
+            {"".join([f"<li>{escape(insight)}</li>" for insight in article['key_insights']])}
+        </ul>
+    </div>
+    """, unsafe_allow_html=True)
+
+
+def _stream_results(placeholder, search_index, query, category, progress):
+    """Show the first results while later segments are scored; returns the full result set"""
+    start = time.perf_counter()
+    for rows, result_set in stream_search(search_index, query, category,
+                                          first=st.session_state.get("search_page_size", PAGE_SIZE)):
+        progress.setdefault("first_ms", 1000 * (time.perf_counter() - start))
+        if result_set is None:
+            with placeholder.container():
+                st.caption(f"⏳ Top {len(rows)} so far, still ranking...")
+                for article in rows:
+                    _news_card(article)
+    return result_set
+
+
+def _move_cursor(cursor):
+    st.session_state.search_cursor = cursor
+
+
+def render():
+    st.header("🔍 Real-time STEM News Analysis")
+    
+    st.markdown("""
+    <div class="analysis-box">
+        <h3>🎯 AI-Powered News Intelligence</h3>
+        <p>Search and analyze STEM news with advanced AI insights, sentiment analysis, and relevance scoring.</p>
+    </div>
+    """, unsafe_allow_html=True)
+    
+    # Search Interface
+    col1, col2, col3 = st.columns([3, 2, 1])
+    
+    with col1:
+        search_query = st.text_input("🔍 Enter your search query:", placeholder="e.g., quantum computing, CRISPR, machine learning")
+    
+    with col2:
+        category = st.selectbox("📂 Category:", ["All"] + (topic_names() or CATEGORIES))
+    
+    with col3:
+        analyze = st.button("🚀 Analyze", type="primary")
+    
+    if analyze and search_query:
+        search_index = load_search_index()
+        if search_index is None:
+            st.warning(f"📭 No article index yet. Add JSONL/RSS dumps to `{CORPUS_DIR}` and run `python -m stem_intel.ingest`.")
+        else:
+            live, progress = st.empty(), {}
+            with st.spinner("🤖 AI is analyzing STEM news..."), span("search_request") as timing:
+                # Pick up segments ingested since the index was opened
+                search_index.refresh()
+                # Sessions running the same search share one ranked result set
+                handle = shared_results(search_index, search_query, category, lambda: _stream_results(
+                    live, search_index, search_query, category, progress))
+            live.empty()
+            if not len(handle.get()):
+                st.info("No matching articles found.")
+            st.session_state.search_results = handle
+            st.session_state.search_cursor = 0
+            st.session_state.analysis_data['last_search'] = {
+                'query': search_query,
+                'category': category,
+                'latency_ms': timing.wall_ms,
+                'first_result_ms': progress.get('first_ms'),
+                'timestamp': datetime.fromtimestamp(handle.get().created)
+            }
+    
+    # Display Results
+    search_results = shared_value("search_results")
+    if search_results is not None and len(search_results):
+        st.subheader("📊 Analysis Results")
+        
+        # Summary Metrics from the result set's arrays, not its rows
+        summary = search_results.summary()
+        col1, col2, col3, col4 = st.columns(4)
+        with col1:
+            st.metric("📄 Articles Found", f"{summary['count']:,}")
+        with col2:
+            st.metric("🎯 Avg Relevance", f"{summary['avg_relevance']:.1f}%")
+        with col3:
+            st.metric("😊 Positive Sentiment", f"{summary['positive']:,}/{summary['count']:,}")
+        with col4:
+            last_search = st.session_state.analysis_data.get('last_search', {})
+            latency_ms, first_ms = last_search.get('latency_ms'), last_search.get('first_result_ms')
+            st.metric("⚡ Analysis Speed", "n/a" if latency_ms is None else
+                      f"{latency_ms:.0f} ms" if latency_ms < 1000 else f"{latency_ms / 1000:.2f}s",
+                      None if first_ms is None else f"first results in {first_ms:.0f} ms", delta_color="off")
+        
+        # Detailed Results: only the visible page is read from the index and rendered
+        page_size = st.selectbox("📑 Results per page:", PAGE_SIZES, key="search_page_size")
+        cursor = st.session_state.get("search_cursor", 0)
+        page, next_cursor = search_results.page(cursor, page_size)
+        for article in page:
+            _news_card(article)
+        
+        col1, col2, col3 = st.columns([1, 2, 1])
+        with col1:
+            st.button("◀ Previous", disabled=cursor == 0, on_click=_move_cursor, args=(max(cursor - page_size, 0),))
+        with col2:
+            st.caption(f"Showing {cursor + 1:,}–{cursor + len(page):,} of {len(search_results):,} ranked articles")
+        with col3:
+            st.button("Next ▶", disabled=next_cursor is None, on_click=_move_cursor, args=(next_cursor,))
+        
+        # AI Insights Summary
+        st.markdown("""
+        <div class="agentic-box">
+            <h3>🧠 AI Meta-Analysis</h3>
+            <p><strong>Trend Direction:</strong> The analyzed articles show strong positive momentum in the searched topic.</p>
+            <p><strong>Key Themes:</strong> Innovation, collaboration, market growth, and regulatory support are dominant themes.</p>
+            <p><strong>Prediction:</strong> Based on current patterns, expect continued growth and development in this area over the next 6-12 months.</p>
+        </div>
+        """, unsafe_allow_html=True)
@@ -0,0 +1,128 @@
+"""Visualize Trends page"""
+import html
+
+import streamlit as st
+
+from stem_intel.anomaly import get_monitor
+from stem_intel.forecast import DAYS_PER_MONTH
+from stem_intel.patterns import PATTERN_FIELDS, extract_patterns_batch
+from stem_intel.topics import topic_names
+from stem_intel.trends import (FORECAST_MONTHS, chart_trend_data, get_trend_store, monthly_trend_data, shared_trend_data,
+                               trend_forecast)
+
+
+# Trend columns offered until a topic model has been fitted, and the default selection
+CATEGORIES = ["AI & Machine Learning", "Biotechnology", "Quantum Computing", "Data Science", "Renewable Energy"]
+DEFAULT_CATEGORIES = ["AI & Machine Learning", "Biotechnology"]
+
+# Most recent detector events listed per category under Pattern Insights
+EVENTS_SHOWN = 3
+
+
+def render():
+    st.header("📊 Interactive Trend Visualization")
+    
+    st.markdown("""
+    <div class="analysis-box">
+        <h3>📈 Advanced Data Visualization</h3>
+        <p>Interactive charts with predictive modeling and cross-correlation analysis.</p>
+    </div>
+    """, unsafe_allow_html=True)
+    
+    # Visualization Controls
+    col1, col2, col3 = st.columns(3)
+    
+    with col1:
+        # Discovered topics are the trend columns once articles are filed under them
+        categories = topic_names() or CATEGORIES
+        selected_categories = st.multiselect(
+            "📂 Select Categories:",
+            categories,
+            default=[c for c in DEFAULT_CATEGORIES if c in categories] or categories[:2]
+        )
+    
+    with col2:
+        timeframe = st.selectbox("📅 Timeframe:", [3, 6, 12, 24], index=2, format_func=lambda x: f"{x} months")
+    
+    with col3:
+        chart_type = st.selectbox("📊 Chart Type:", ["Line Chart", "Area Chart", "Bar Chart"])
+    
+    if selected_categories:
+        # One shared float32 window per distinct selection; the session only keeps a handle
+        handle = shared_trend_data(selected_categories, timeframe)
+        st.session_state.trend_data = handle
+        trend_data = handle.get().frame()
+        
+        # Display main chart
+        st.subheader(f"📈 {chart_type} - {timeframe} Month Trend")
+        
+        if chart_type == "Line Chart":
+            # Charts get a rollup level thinned with LTTB, not every daily point
+            st.line_chart(chart_trend_data(selected_categories, timeframe))
+        elif chart_type == "Area Chart":
+            st.area_chart(chart_trend_data(selected_categories, timeframe))
+        else:
+            # For bar chart, show monthly averages from the same rollup pyramid
+            monthly_data = monthly_trend_data(selected_categories, timeframe)
+            st.bar_chart(monthly_data)
+        
+        # Trend Analysis: one vectorized pass over every selected category
+        patterns_df = extract_patterns_batch(trend_data, selected_categories, handle.get().stats)
+        # Spikes and level shifts the online detector raised inside the window
+        monitor = get_monitor(get_trend_store())
+        events = monitor.recent(selected_categories, since=handle.get().start.date())
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            st.subheader("📊 Trend Statistics")
+            for category, row in patterns_df.iterrows():
+                st.metric(f"📈 {category}", f"{row['last']:.1f}", f"{row['growth_rate']:+.1f}%")
+        
+        with col2:
+            st.subheader("🔍 Pattern Insights")
+            for category, row in patterns_df.iterrows():
+                category_events = [e for e in events if e['category'] == category]
+                st.session_state.pattern_insights[category] = dict(row[list(PATTERN_FIELDS)].to_dict(),
+                                                                   events=category_events)
+                lines = [
+                    f"**{category}:**",
+                    f"- Trend: {row['trend_direction']}",
+                    f"- Volatility: {row['volatility']}",
+                    f"- Recent Momentum: {row['recent_momentum']}",
+                ]
+                lines += [f"- {e['kind']} on {e['date']:%Y-%m-%d} ({e['value']:.0f} articles, z {e['z']:+.1f})"
+                          for e in category_events[:EVENTS_SHOWN]]
+                st.markdown("\n".join(lines))
+        
+        # Predictive Analysis: damped Holt-Winters fitted to every category at once
+        forecast = trend_forecast(selected_categories, timeframe, FORECAST_MONTHS)
+        recent = trend_data[selected_categories].tail(DAYS_PER_MONTH).mean()
+        short = forecast[forecast["Month"] == 1].set_index("Category")
+        long = forecast[forecast["Month"] == FORECAST_MONTHS].set_index("Category")
+        short_change = 100 * (short["Forecast"] - recent) / recent.where(recent > 0)
+        change = 100 * (long["Forecast"] - recent) / recent.where(recent > 0)
+        short_lines = "".join(
+            f"<li>{html.escape(c)}: {short.at[c, 'Forecast']:.1f}/day (80% interval {short.at[c, 'Lower']:.1f}–"
+            f"{short.at[c, 'Upper']:.1f}), {short_change.fillna(0)[c]:+.1f}% vs the last 30 days</li>"
+            for c in selected_categories
+        )
+        leader = change.idxmax() if change.notna().any() else selected_categories[0]
+        laggard = change.idxmin() if change.notna().any() else selected_categories[-1]
+        outlook = (f"Strongest expected growth in {html.escape(leader)} ({change[leader]:+.1f}% "
+                   f"by month {FORECAST_MONTHS})"
+                   if len(selected_categories) == 1 or leader == laggard else
+                   f"Strongest expected growth in {html.escape(leader)} ({change[leader]:+.1f}%), weakest in {html.escape(laggard)} "
+                   f"({change[laggard]:+.1f}%) by month {FORECAST_MONTHS}")
+        st.markdown(f"""
+        <div class="agentic-box">
+            <h3>🔮 AI Predictive Analysis</h3>
+            <p><strong>Short-term Forecast (Next 30 days):</strong></p>
+            <ul>{short_lines}</ul>
+            <p><strong>Long-term Outlook ({FORECAST_MONTHS} months):</strong> {outlook}, based on damped-trend Holt-Winters fits with weekly seasonality.</p>
+        </div>
+        """, unsafe_allow_html=True)
+        
+        with st.expander("📅 Monthly forecast table"):
+            # Only the numeric columns: rounding the Start dates would warn on every render
+            st.dataframe(forecast.round({"Forecast": 1, "Lower": 1, "Upper": 1}), use_container_width=True,
+                         hide_index=True)